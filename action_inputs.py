@@ -27,9 +27,35 @@ from living_doc_utilities.github.utils import get_action_input
 
 from living_doc_utilities.inputs.action_inputs import BaseActionInputs
 
+from doc_issues.body_parser import DEFAULT_BODY_SECTIONS
+from doc_issues.model.body_section import BodySection
 from doc_issues.model.config_repository import ConfigRepository
-from utils.constants import Mode, DOC_ISSUES_PROJECT_STATE_MINING, DOC_ISSUES_REPOSITORIES, VERBOSE_LOGGING
-from utils.exceptions import FetchRepositoriesException
+from utils import compression
+from utils.constants import (
+    ADAPTER_ITEM_FIELDS,
+    Mode,
+    OutputCompression,
+    OutputFormat,
+    DOC_ISSUES_BODY_SECTIONS,
+    DOC_ISSUES_CONCURRENCY,
+    DOC_ISSUES_HTTP_CACHE,
+    DOC_ISSUES_HTTP_CACHE_DEFAULT_PATH,
+    DOC_ISSUES_HTTP_CACHE_PATH,
+    DOC_ISSUES_INCREMENTAL,
+    DOC_ISSUES_OUTPUT_COMPACT,
+    DOC_ISSUES_OUTPUT_COMPRESSION,
+    DOC_ISSUES_OUTPUT_FORMAT,
+    DOC_ISSUES_OUTPUT_WORKERS,
+    DOC_ISSUES_PARSE_CACHE,
+    DOC_ISSUES_PARSE_CACHE_DEFAULT_PATH,
+    DOC_ISSUES_PARSE_CACHE_PATH,
+    DOC_ISSUES_PROJECT_STATE_MINING,
+    DOC_ISSUES_REPOSITORIES,
+    DOC_ISSUES_SNAPSHOT_DEFAULT_PATH,
+    DOC_ISSUES_SNAPSHOT_PATH,
+    VERBOSE_LOGGING,
+)
+from utils.exceptions import FetchBodySectionsException, FetchRepositoriesException
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +83,96 @@ class ActionInputs(BaseActionInputs):
         """
         return get_action_input(DOC_ISSUES_PROJECT_STATE_MINING, "false").lower() == "true"
 
+    @staticmethod
+    def get_concurrency() -> int:
+        """
+        Getter of the number of repositories mined in parallel. 1 (sequential mining) by default.
+        @return: The number of worker threads, 0 if the input is not a positive number.
+        """
+        concurrency = get_action_input(DOC_ISSUES_CONCURRENCY, "1").strip()
+        return int(concurrency) if concurrency.isdigit() else 0
+
+    @staticmethod
+    def get_output_workers() -> int:
+        """
+        Getter of the number of worker processes building the output items. 1 (no worker processes) by default.
+        @return: The number of worker processes, 0 if the input is not a positive number.
+        """
+        output_workers = get_action_input(DOC_ISSUES_OUTPUT_WORKERS, "1").strip()
+        return int(output_workers) if output_workers.isdigit() else 0
+
+    @staticmethod
+    def is_incremental_mining_enabled() -> bool:
+        """
+        Getter of the incremental mining switch. False by default.
+        @return: True if only issues updated since the last run are mined, False otherwise.
+        """
+        return get_action_input(DOC_ISSUES_INCREMENTAL, "false").lower() == "true"
+
+    @staticmethod
+    def get_snapshot_path() -> str:
+        """
+        Getter of the path to the snapshot file used by the incremental mining.
+        @return: The path to the snapshot file.
+        """
+        return get_action_input(DOC_ISSUES_SNAPSHOT_PATH, DOC_ISSUES_SNAPSHOT_DEFAULT_PATH)
+
+    @staticmethod
+    def is_http_cache_enabled() -> bool:
+        """
+        Getter of the conditional request cache switch. False by default.
+        @return: True if REST responses are cached and revalidated by conditional requests, False otherwise.
+        """
+        return get_action_input(DOC_ISSUES_HTTP_CACHE, "false").lower() == "true"
+
+    @staticmethod
+    def get_http_cache_path() -> str:
+        """
+        Getter of the path to the conditional request cache directory.
+        @return: The path to the cache directory.
+        """
+        return get_action_input(DOC_ISSUES_HTTP_CACHE_PATH, DOC_ISSUES_HTTP_CACHE_DEFAULT_PATH)
+
+    @staticmethod
+    def is_parse_cache_enabled() -> bool:
+        """
+        Getter of the parse cache switch. False by default.
+        @return: True if parsed issue bodies are cached between runs, False otherwise.
+        """
+        return get_action_input(DOC_ISSUES_PARSE_CACHE, "false").lower() == "true"
+
+    @staticmethod
+    def get_parse_cache_path() -> str:
+        """
+        Getter of the path to the parse cache file.
+        @return: The path to the parse cache file.
+        """
+        return get_action_input(DOC_ISSUES_PARSE_CACHE_PATH, DOC_ISSUES_PARSE_CACHE_DEFAULT_PATH)
+
+    @staticmethod
+    def get_output_format() -> str:
+        """
+        Getter of the output file format. `json` (a single JSON document) by default.
+        @return: The output file format in lower case.
+        """
+        return get_action_input(DOC_ISSUES_OUTPUT_FORMAT, OutputFormat.JSON.value).strip().lower()
+
+    @staticmethod
+    def get_output_compression() -> str:
+        """
+        Getter of the compression of the output file. `none` by default.
+        @return: The output file compression in lower case.
+        """
+        return get_action_input(DOC_ISSUES_OUTPUT_COMPRESSION, OutputCompression.NONE.value).strip().lower()
+
+    @staticmethod
+    def is_output_compact() -> bool:
+        """
+        Getter of the compact output switch. False by default.
+        @return: True if the output JSON document is written without indentation, False otherwise.
+        """
+        return get_action_input(DOC_ISSUES_OUTPUT_COMPACT, "false").lower() == "true"
+
     @staticmethod
     def get_verbose_logging() -> bool:
         """
@@ -108,6 +224,34 @@ class ActionInputs(BaseActionInputs):
 
         return repositories
 
+    @staticmethod
+    def get_body_sections() -> list[BodySection]:
+        """
+        Getter and parser of the additional issue body sections, parsed together with the default sections.
+
+        @return: A list of Body Sections.
+        @raise FetchBodySectionsException: When parsing JSON string fails or a section is not valid.
+        """
+        body_sections = []
+        action_input = get_action_input(DOC_ISSUES_BODY_SECTIONS, "[]")
+        try:
+            for section_json in json.loads(action_input):
+                body_section = BodySection()
+                if not body_section.load_from_json(section_json):
+                    logger.error("Failed to load body section from JSON: %s.", section_json)
+                    raise FetchBodySectionsException
+                body_sections.append(body_section)
+
+        except json.JSONDecodeError as e:
+            logger.error("Error parsing JSON body sections: %s.", e, exc_info=True)
+            raise FetchBodySectionsException from e
+
+        except TypeError as e:
+            logger.error("Type error parsing input JSON body sections: %s.", action_input)
+            raise FetchBodySectionsException from e
+
+        return body_sections
+
     def _validate(self) -> int:
         err_counter = 0
         repositories = []
@@ -118,6 +262,15 @@ class ActionInputs(BaseActionInputs):
         except FetchRepositoriesException:
             err_counter += 1
 
+        if self.get_concurrency() < 1:
+            logger.error(
+                "Invalid `doc-issues-concurrency` input: `%s`. Expected a positive integer.",
+                get_action_input(DOC_ISSUES_CONCURRENCY, "1"),
+            )
+            err_counter += 1
+
+        err_counter += self._validate_output_inputs()
+
         github_token = self.get_github_token()
         headers = {"Authorization": f"token {github_token}"}
         verify_cert = self.get_ca_bundle()
@@ -172,6 +325,57 @@ class ActionInputs(BaseActionInputs):
 
         return err_counter
 
+    def _validate_output_inputs(self) -> int:
+        """
+        Validate the inputs shaping the output file: body sections, output format and compression.
+
+        @return: The number of found errors.
+        """
+        err_counter = 0
+
+        try:
+            reserved_fields = ADAPTER_ITEM_FIELDS + [section.field for section in DEFAULT_BODY_SECTIONS]
+            body_section_fields = [section.field for section in self.get_body_sections()]
+            for field in body_section_fields:
+                if field in reserved_fields or body_section_fields.count(field) > 1:
+                    logger.error("Invalid `doc-issues-body-sections` input: field `%s` is already used.", field)
+                    err_counter += 1
+        except FetchBodySectionsException:
+            err_counter += 1
+
+        if self.get_output_workers() < 1:
+            logger.error(
+                "Invalid `doc-issues-output-workers` input: `%s`. Expected a positive integer.",
+                get_action_input(DOC_ISSUES_OUTPUT_WORKERS, "1"),
+            )
+            err_counter += 1
+
+        supported_output_formats = [output_format.value for output_format in OutputFormat]
+        if self.get_output_format() not in supported_output_formats:
+            logger.error(
+                "Invalid `doc-issues-output-format` input: `%s`. Expected one of %s.",
+                self.get_output_format(),
+                supported_output_formats,
+            )
+            err_counter += 1
+
+        supported_output_compressions = [output_compression.value for output_compression in OutputCompression]
+        if self.get_output_compression() not in supported_output_compressions:
+            logger.error(
+                "Invalid `doc-issues-output-compression` input: `%s`. Expected one of %s.",
+                self.get_output_compression(),
+                supported_output_compressions,
+            )
+            err_counter += 1
+        elif not compression.is_available(self.get_output_compression()):
+            logger.error(
+                "The `%s` output compression is not available. Install the `zstandard` package or use Python 3.14+.",
+                self.get_output_compression(),
+            )
+            err_counter += 1
+
+        return err_counter
+
     def _print_effective_configuration(self) -> None:
         """
         Print the effective configuration of the action inputs.
@@ -182,4 +386,19 @@ class ActionInputs(BaseActionInputs):
             "Mode(doc-issues): `doc-issues-project-state-mining`: %s.",
             ActionInputs.is_project_state_mining_enabled(),
         )
+        logger.info("Mode(doc-issues): `doc-issues-concurrency`: %s.", ActionInputs.get_concurrency())
+        logger.info("Mode(doc-issues): `doc-issues-incremental`: %s.", ActionInputs.is_incremental_mining_enabled())
+        if ActionInputs.is_incremental_mining_enabled():
+            logger.info("Mode(doc-issues): `doc-issues-snapshot-path`: %s.", ActionInputs.get_snapshot_path())
+        logger.info("Mode(doc-issues): `doc-issues-http-cache`: %s.", ActionInputs.is_http_cache_enabled())
+        if ActionInputs.is_http_cache_enabled():
+            logger.info("Mode(doc-issues): `doc-issues-http-cache-path`: %s.", ActionInputs.get_http_cache_path())
+        logger.info("Mode(doc-issues): `doc-issues-body-sections`: %s.", ActionInputs.get_body_sections())
+        logger.info("Mode(doc-issues): `doc-issues-parse-cache`: %s.", ActionInputs.is_parse_cache_enabled())
+        if ActionInputs.is_parse_cache_enabled():
+            logger.info("Mode(doc-issues): `doc-issues-parse-cache-path`: %s.", ActionInputs.get_parse_cache_path())
+        logger.info("Mode(doc-issues): `doc-issues-output-format`: %s.", ActionInputs.get_output_format())
+        logger.info("Mode(doc-issues): `doc-issues-output-compression`: %s.", ActionInputs.get_output_compression())
+        logger.info("Mode(doc-issues): `doc-issues-output-compact`: %s.", ActionInputs.is_output_compact())
+        logger.info("Mode(doc-issues): `doc-issues-output-workers`: %s.", ActionInputs.get_output_workers())
         logger.info("verbose logging: %s", self.get_verbose_logging())
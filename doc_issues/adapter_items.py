@@ -0,0 +1,85 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the functions building the output items of the v1.0.0 schema from plain issue data.
+The functions use no shared state, so item chunks can be built and encoded by worker processes.
+"""
+
+from typing import Any, Optional
+
+from doc_issues.body_parser import SectionSchema
+from utils import json_codec
+from utils.json_codec import EncodedJSON
+
+# Issue data needed to build an output item, the only data sent to worker processes
+ITEM_ISSUE_DATA_KEYS = ("title", "state", "labels", "html_url", "created_at", "updated_at", "body")
+
+
+def get_item_issue_data(issue_dict: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get the plain issue data needed to build the output item.
+
+    @param issue_dict: The dictionary of the issue, see `Issue.to_dict`.
+    @return: The issue data with only the item relevant keys.
+    """
+    return {key: issue_dict[key] for key in ITEM_ISSUE_DATA_KEYS if key in issue_dict}
+
+
+def build_adapter_item(key: str, issue_data: dict[str, Any], parsed_body: dict) -> dict:
+    """
+    Build the output item of the issue.
+
+    @param key: The unique issue key in the `owner/repo#number` format.
+    @param issue_data: The issue data, see `get_item_issue_data`.
+    @param parsed_body: The parsed issue body with the section fields as keys.
+    @return: The output item.
+    """
+    # Parsed sections follow the base fields: description, business_value, preconditions,
+    # acceptance_criteria and the additional sections in their configured order
+    return {
+        "id": key,
+        "title": issue_data.get("title", ""),
+        "state": issue_data.get("state", ""),
+        "tags": issue_data.get("labels", []),
+        "url": issue_data.get("html_url", ""),
+        "timestamps": {
+            "created": issue_data.get("created_at", ""),
+            "updated": issue_data.get("updated_at", ""),
+        },
+        **parsed_body,
+    }
+
+
+def encode_adapter_items(
+    chunk: list[tuple[str, dict[str, Any], Optional[dict]]], schema: SectionSchema, indent: Optional[int]
+) -> list[tuple[EncodedJSON, Optional[dict]]]:
+    """
+    Build and encode the output items of a chunk of issues, executed by worker processes.
+
+    @param chunk: The issue keys with their issue data and already known parsed bodies (None when unknown).
+    @param schema: The section schema to parse the issue bodies.
+    @param indent: The indentation of the output document, None for a compact document.
+    @return: The encoded items in the chunk order, together with the newly parsed bodies (None when known).
+    """
+    encoded_items: list[tuple[EncodedJSON, Optional[dict]]] = []
+    for key, issue_data, known_parsed_body in chunk:
+        parsed_body = known_parsed_body if known_parsed_body is not None else schema.parse(issue_data.get("body"))
+        item = build_adapter_item(key, issue_data, parsed_body)
+        encoded_items.append(
+            (EncodedJSON(json_codec.dumps(item, indent)), parsed_body if known_parsed_body is None else None)
+        )
+    return encoded_items
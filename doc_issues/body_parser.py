@@ -19,60 +19,103 @@ This module contains functions for parsing raw markdown issue body strings
 into structured JSON-ready data.
 """
 
+import functools
+import hashlib
+import json
 import re
 import logging
-from typing import Optional
+from typing import Callable, Optional
+
+from doc_issues.model.body_section import BodySection
+from utils.constants import BodySectionKind
 
 logger = logging.getLogger(__name__)
 
-_SECTION_PATTERN = re.compile(r"^## (.+?)[ \t]*$", re.MULTILINE)
+# Sections (##) and sub-sections (###) are indexed by a single pass over the body, splitting the body by heading lines
+_HEADING_PATTERN = re.compile(r"^((##|###) (.+?)[ \t]*)$", re.MULTILINE)
 _SUBSECTION_PATTERN = re.compile(r"^### (.+?)[ \t]*$", re.MULTILINE)
 _SEPARATOR_ROW_PATTERN = re.compile(r"^\|[-|:\s]+\|$")
 
+_SECTION_MARKS = "##"
+_SUBSECTION_MARKS = "###"
+
 
-def _extract_section(body: str, heading: str) -> Optional[str]:
+# pylint: disable=too-few-public-methods
+class _HeadingIndex:
+    """
+    The index of all ## and ### headings of a body, built by a single tokenizer pass.
+    The content of any section or sub-section is sliced from the body using the index.
+    """
+
+    def __init__(self, body: str):
+        # [text before the first heading, heading line, marks, title, content, heading line, marks, title, ...]
+        parts = _HEADING_PATTERN.split(body)
+        self.__lines: list[str] = parts[1::4]
+        self.__marks: list[str] = parts[2::4]
+        self.__contents: list[str] = parts[4::4]
+        # Only the first heading of a title is used, the same as when searching the body from its start
+        keys = list(zip(self.__marks, map(str.strip, parts[3::4])))
+        self.__first_positions: dict[tuple[str, str], int] = dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+
+    def get_content(self, marks: str, title: str) -> Optional[str]:
+        """
+        Get the content of the first heading with the marks and title.
+        A section ends at the next section, a sub-section ends at the next section or sub-section.
+
+        Parameters:
+            marks: The heading marks, ## for a section and ### for a sub-section.
+            title: The heading text (without the # prefix).
+
+        Returns:
+            Content string, or None if heading not found.
+        """
+        position = self.__first_positions.get((marks, title))
+        if position is None:
+            return None
+        if marks == _SUBSECTION_MARKS:
+            return self.__contents[position].strip()
+
+        # A section spans its sub-sections, their heading lines are kept in the content
+        try:
+            section_end = self.__marks.index(_SECTION_MARKS, position + 1)
+        except ValueError:
+            section_end = len(self.__marks)
+        content_parts = [self.__contents[position]]
+        for next_position in range(position + 1, section_end):
+            content_parts.append(self.__lines[next_position])
+            content_parts.append(self.__contents[next_position])
+        return "".join(content_parts).strip()
+
+
+def _extract_section(body: str, heading: str, index: Optional[_HeadingIndex] = None) -> Optional[str]:
     """
     Extract the content of a ## heading section from the body.
 
     Parameters:
         body: Raw markdown body string.
         heading: The heading text to look for (without the ## prefix).
+        index: The heading index of the body, built when not provided.
 
     Returns:
         Section content string, or None if heading not found.
     """
-    matches = list(_SECTION_PATTERN.finditer(body))
-    for i, m in enumerate(matches):
-        if m.group(1).strip() == heading:
-            content_start = m.end()
-            content_end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-            return body[content_start:content_end].strip()
-    return None
+    return (index or _HeadingIndex(body)).get_content(_SECTION_MARKS, heading)
 
 
-def _extract_subsection(body: str, heading: str) -> Optional[str]:
+def _extract_subsection(body: str, heading: str, index: Optional[_HeadingIndex] = None) -> Optional[str]:
     """
     Extract the content of a ### heading sub-section, searching anywhere in the body.
 
     Parameters:
         body: Raw markdown body string.
         heading: The sub-heading text to look for (without the ### prefix).
+        index: The heading index of the body, built when not provided.
 
     Returns:
         Sub-section content string, or None if heading not found.
     """
-    sub_matches = list(_SUBSECTION_PATTERN.finditer(body))
-    section_starts = [m.start() for m in _SECTION_PATTERN.finditer(body)]
-
-    for i, m in enumerate(sub_matches):
-        if m.group(1).strip() == heading:
-            content_start = m.end()
-            # End at the next ### sub-section or the next ## section, whichever comes first
-            next_subsection = sub_matches[i + 1].start() if i + 1 < len(sub_matches) else len(body)
-            next_section = next((boundary for boundary in section_starts if boundary > m.start()), len(body))
-            content_end = min(next_subsection, next_section)
-            return body[content_start:content_end].strip()
-    return None
+    # The sub-section ends at the next ### sub-section or the next ## section, whichever comes first
+    return (index or _HeadingIndex(body)).get_content(_SUBSECTION_MARKS, heading)
 
 
 def _remove_subsections(text: str) -> str:
@@ -109,16 +152,17 @@ def _parse_bullet_list(text: str) -> list[str]:
     return items
 
 
-def _parse_ac_table(text: str) -> list[dict]:
+def _parse_table(text: str, columns: list[str]) -> list[dict]:
     """
-    Parse a markdown table into a list of acceptance criterion dicts.
+    Parse a markdown table into a list of row dicts. The header row is skipped,
+    rows with fewer cells than columns are ignored.
 
     Parameters:
-        text: Markdown text containing a table with columns:
-              Criteria ID | State | Version | Description
+        text: Markdown text containing a table.
+        columns: The names of the table columns, the first one holds an identifier without code span backticks.
 
     Returns:
-        List of dicts with keys: id, state, version, description.
+        List of dicts with the column names as keys.
     """
     result = []
     header_seen = False
@@ -134,63 +178,140 @@ def _parse_ac_table(text: str) -> list[dict]:
         if not header_seen:
             header_seen = True
             continue
-        if len(cells) >= 4:
-            result.append(
-                {
-                    "id": cells[0].strip("`").strip(),
-                    "state": cells[1],
-                    "version": cells[2],
-                    "description": cells[3],
-                }
-            )
+        if len(cells) >= len(columns):
+            cells[0] = cells[0].strip("`").strip()
+            result.append(dict(zip(columns, cells)))
     return result
 
 
-def parse_body(body: Optional[str]) -> dict:
+def _parse_ac_table(text: str) -> list[dict]:
     """
-    Parse a raw markdown GitHub issue body into structured fields.
+    Parse a markdown table into a list of acceptance criterion dicts.
 
-    Extracts:
-    - description: plain narrative from ## Description (before any ### sub-sections)
-    - business_value: bullet list from ### Business Value (anywhere in body)
-    - preconditions: bullet list from ## Preconditions
-    - acceptance_criteria: table rows from ## Acceptance Criteria
+    Parameters:
+        text: Markdown text containing a table with columns:
+              Criteria ID | State | Version | Description
+
+    Returns:
+        List of dicts with keys: id, state, version, description.
+    """
+    return _parse_table(text, _AC_TABLE_COLUMNS)
+
+
+def _parse_text(text: str) -> str:
+    """
+    Parse a section into its plain narrative, sub-sections are not part of the narrative.
 
     Parameters:
-        body: Raw markdown string from a GitHub issue body, or None.
+        text: Section content that may contain ### sub-headings.
 
     Returns:
-        Dictionary with keys: description, business_value, preconditions, acceptance_criteria.
-        Each value is either a structured type or None when the section is absent or empty.
+        The narrative text.
     """
-    result: dict = {
-        "description": None,
-        "business_value": None,
-        "preconditions": None,
-        "acceptance_criteria": None,
-    }
+    return _remove_subsections(text)
+
+
+_AC_TABLE_COLUMNS = ["id", "state", "version", "description"]
+
+DEFAULT_BODY_SECTIONS = [
+    BodySection("description", "Description", 2, BodySectionKind.TEXT.value),
+    BodySection("business_value", "Business Value", 3, BodySectionKind.BULLET_LIST.value),
+    BodySection("preconditions", "Preconditions", 2, BodySectionKind.BULLET_LIST.value),
+    BodySection("acceptance_criteria", "Acceptance Criteria", 2, BodySectionKind.TABLE.value, _AC_TABLE_COLUMNS),
+]
+
+
+class SectionSchema:
+    """
+    A class representing the compiled schema of the issue body sections.
+    Every section is resolved by a single lookup in the heading index, so the body is scanned only once
+    regardless of the number of sections.
+    """
+
+    def __init__(self, sections: list[BodySection]):
+        self.__sections: list[BodySection] = sections
+        # (field, heading marks, heading, content parser) of every section, resolved once for all bodies
+        self.__compiled: list[tuple[str, str, str, Callable[[str], object]]] = [
+            (section.field, "#" * section.level, section.heading, self.__get_content_parser(section))
+            for section in sections
+        ]
+        self.__version: str = hashlib.sha256(
+            json.dumps([section.to_dict() for section in sections]).encode("utf-8")
+        ).hexdigest()
+
+    @property
+    def fields(self) -> list[str]:
+        """Getter of the output item fields of all sections."""
+        return [section.field for section in self.__sections]
+
+    @property
+    def version(self) -> str:
+        """Getter of the schema version, the hash of all section definitions."""
+        return self.__version
+
+    @staticmethod
+    def __get_content_parser(section: BodySection) -> Callable[[str], object]:
+        """
+        Get the parser of the section content based on its content kind.
+
+        Parameters:
+            section: The body section.
+
+        Returns:
+            The content parser.
+        """
+        if section.kind == BodySectionKind.BULLET_LIST.value:
+            return _parse_bullet_list
+        if section.kind == BodySectionKind.TABLE.value:
+            # The schema is sent to worker processes, so the parser has to be picklable
+            return functools.partial(_parse_table, columns=section.columns)
+        return _parse_text
+
+    def parse(self, body: Optional[str]) -> dict:
+        """
+        Parse a raw markdown GitHub issue body into the fields of all sections.
+
+        Parameters:
+            body: Raw markdown string from a GitHub issue body, or None.
+
+        Returns:
+            Dictionary with the section fields as keys.
+            Each value is either a structured type or None when the section is absent or empty.
+        """
+        result: dict = {field: None for field, _, _, _ in self.__compiled}
+        if not body:
+            return result
+
+        # All sections are sliced from the single heading index of the body
+        index = _HeadingIndex(body)
+        for field, marks, heading, parse_content in self.__compiled:
+            content = index.get_content(marks, heading)
+            if content is not None:
+                result[field] = parse_content(content) or None
 
-    if not body:
         return result
 
-    desc_section = _extract_section(body, "Description")
-    if desc_section is not None:
-        narrative = _remove_subsections(desc_section)
-        result["description"] = narrative or None
 
-    bv_section = _extract_subsection(body, "Business Value")
-    if bv_section is not None:
-        bv_items = _parse_bullet_list(bv_section)
-        result["business_value"] = bv_items if bv_items else None
+DEFAULT_SECTION_SCHEMA = SectionSchema(DEFAULT_BODY_SECTIONS)
+
 
-    precond_section = _extract_section(body, "Preconditions")
-    if precond_section is not None:
-        precond_items = _parse_bullet_list(precond_section)
-        result["preconditions"] = precond_items if precond_items else None
+def parse_body(body: Optional[str], schema: Optional[SectionSchema] = None) -> dict:
+    """
+    Parse a raw markdown GitHub issue body into structured fields.
 
-    ac_section = _extract_section(body, "Acceptance Criteria")
-    if ac_section is not None:
-        ac_items = _parse_ac_table(ac_section)
-        result["acceptance_criteria"] = ac_items if ac_items else None
+    Extracts by default:
+    - description: plain narrative from ## Description (before any ### sub-sections)
+    - business_value: bullet list from ### Business Value (anywhere in body)
+    - preconditions: bullet list from ## Preconditions
+    - acceptance_criteria: table rows from ## Acceptance Criteria
 
-    return result
+    Parameters:
+        body: Raw markdown string from a GitHub issue body, or None.
+        schema: The section schema to parse, the default sections when not provided.
+
+    Returns:
+        Dictionary with keys: description, business_value, preconditions, acceptance_criteria
+        and the fields of all additional sections of the schema.
+        Each value is either a structured type or None when the section is absent or empty.
+    """
+    return (schema or DEFAULT_SECTION_SCHEMA).parse(body)
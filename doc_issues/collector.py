@@ -18,44 +18,75 @@ This module contains the Living Documentation Collector for GitHub class, which
 of the Living Documentation related data from GitHub.
 """
 
-import json
 import logging
+import math
 import os
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Callable
+from itertools import batched, repeat
+from typing import Any, Callable, Generator, Iterator, Optional, TypeVar
+
+import requests
 
 from github import Auth, Github
+from github.GithubException import GithubException
 from github.Issue import Issue
+from github.Repository import Repository
 
 from utils.constants import get_package_version
 
 from living_doc_utilities.decorators import safe_call_decorator
-from living_doc_utilities.github.rate_limiter import GithubRateLimiter
 from living_doc_utilities.model.feature_issue import FeatureIssue
 from living_doc_utilities.model.functionality_issue import FunctionalityIssue
 from living_doc_utilities.model.issues import Issues
 from living_doc_utilities.model.user_story_issue import UserStoryIssue
 
 from action_inputs import ActionInputs
-from doc_issues.body_parser import parse_body
+from doc_issues.adapter_items import build_adapter_item, encode_adapter_items, get_item_issue_data
+from doc_issues.body_parser import DEFAULT_BODY_SECTIONS, SectionSchema
+from doc_issues.github_issues import GitHubIssues
 from doc_issues.github_projects import GitHubProjects
+from doc_issues.model.config_repository import ConfigRepository
 from doc_issues.model.consolidated_issue import ConsolidatedIssue
 from doc_issues.model.github_project import GitHubProject
+from doc_issues.model.issue_record import IssueRecord
 from doc_issues.model.project_issue import ProjectIssue
+from doc_issues.parse_cache import ParsedBodyCache
+from doc_issues.snapshot import IssuesSnapshot
+from utils import compression, json_codec
 from utils.constants import (
+    AUDIT_BATCH_SIZE,
+    DOC_ISSUES_OUTPUT_FILE_NAME,
+    DOC_ISSUES_OUTPUT_INDENT,
+    DOC_ISSUES_SIDECAR_FILE_NAME,
+    HTTP_CACHE_MAX_AGE_DAYS,
+    HTTP_CACHE_MAX_SIZE_MB,
     ISSUES_PER_PAGE_LIMIT,
-    ISSUE_STATE_ALL,
+    OUTPUT_WORKERS_CHUNK_SIZE,
+    OUTPUT_WORKERS_CHUNKS_IN_FLIGHT,
+    PROJECT_ITEMS_BATCH_SIZE,
+    RATE_LIMIT_MIN_REMAINING,
     SUPPORTED_ISSUE_LABELS,
     DOC_USER_STORY_LABEL,
     DOC_FEATURE_LABEL,
     DOC_FUNCTIONALITY_LABEL,
+    OutputFormat,
 )
+from utils.github_connection import SharedSessionHTTPSConnection
+from utils.http_cache import ConditionalRequestCache
+from utils.json_codec import EncodedJSON
+from utils.rate_limiter import HeaderRateLimiter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+U = TypeVar("U")
+
 
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
 class GHDocIssuesCollector:
     """
     A class representing the Living Documentation Collector for GitHub.
@@ -67,54 +98,164 @@ class GHDocIssuesCollector:
         github_token = ActionInputs.get_github_token()
 
         self.__output_path = os.path.join(output_path, "doc-issues")
+        self.__output_format: str = ActionInputs.get_output_format()
+        self.__output_compression: str = ActionInputs.get_output_compression()
+        self.__output_file_path: str = compression.get_file_path(
+            os.path.join(self.__output_path, f"{DOC_ISSUES_OUTPUT_FILE_NAME}.{self.__output_format}"),
+            self.__output_compression,
+        )
 
         ca_bundle = ActionInputs.get_ca_bundle()
+        self.__concurrency: int = max(ActionInputs.get_concurrency(), 1)
+        self.__output_workers: int = max(ActionInputs.get_output_workers(), 1)
+        pool_size = max(self.__concurrency, requests.adapters.DEFAULT_POOLSIZE)
 
+        self.__http_cache: Optional[ConditionalRequestCache] = None
+        if ActionInputs.is_http_cache_enabled():
+            self.__http_cache = ConditionalRequestCache(ActionInputs.get_http_cache_path())
+
+        # All worker threads share the single GitHub instance, which requires thread-safe connections.
+        # PyGithub picks the connection class up when the instance is created, so it is installed first.
+        SharedSessionHTTPSConnection.install(self.__http_cache)
         self.__github_instance: Github = Github(
-            auth=Auth.Token(token=github_token), per_page=ISSUES_PER_PAGE_LIMIT, verify=ca_bundle
+            auth=Auth.Token(token=github_token), per_page=ISSUES_PER_PAGE_LIMIT, verify=ca_bundle, pool_size=pool_size
+        )
+        # Every worker keeps a few calls in reserve, so concurrent calls can not overdraw the budget
+        self.__rate_limiter: HeaderRateLimiter = HeaderRateLimiter(
+            self.__github_instance, min_remaining=RATE_LIMIT_MIN_REMAINING * self.__concurrency
         )
-        self.__github_projects_instance: GitHubProjects = GitHubProjects(token=github_token, ca_bundle=ca_bundle)
-        self.__rate_limiter: GithubRateLimiter = GithubRateLimiter(self.__github_instance)
+        SharedSessionHTTPSConnection.set_response_hook(self.__rate_limiter.observe)
         self.__safe_call: Callable = safe_call_decorator(self.__rate_limiter)
 
+        logger.debug("JSON codec - using the `%s` backend.", json_codec.get_backend_name())
+
+        self.__github_issues_instance: GitHubIssues = GitHubIssues(
+            self.__github_instance, rate_limiter=self.__rate_limiter
+        )
+        self.__github_projects_instance: GitHubProjects = GitHubProjects(
+            token=github_token, ca_bundle=ca_bundle, pool_size=pool_size, rate_limiter=self.__rate_limiter
+        )
+
+        # Snapshot of the last successful run, used only when incremental mining is enabled
+        self.__snapshot: Optional[IssuesSnapshot] = (
+            IssuesSnapshot(ActionInputs.get_snapshot_path()) if ActionInputs.is_incremental_mining_enabled() else None
+        )
+        # Additional issue body sections are parsed together with the default ones
+        self.__section_schema: SectionSchema = SectionSchema(DEFAULT_BODY_SECTIONS + ActionInputs.get_body_sections())
+        # Parsed issue bodies of previous runs, used only when the parse cache is enabled
+        self.__parse_cache: Optional[ParsedBodyCache] = (
+            ParsedBodyCache(ActionInputs.get_parse_cache_path(), self.__section_schema)
+            if ActionInputs.is_parse_cache_enabled()
+            else None
+        )
+
+    @property
+    def output_file_path(self) -> str:
+        """Getter of the path to the (compressed) output file."""
+        return self.__output_file_path
+
     def collect(self) -> bool:
         """
         Collect 'doc-issues' GitHub data and export the output.
 
         @return: True if collection is successful, False otherwise (error occurred).
         """
+        run_started_at = datetime.now(timezone.utc)
+        if self.__snapshot is not None:
+            self.__snapshot.load(run_started_at)
+        if self.__parse_cache is not None:
+            self.__parse_cache.load()
+        if self.__http_cache is not None:
+            self.__http_cache.set_identity(self._get_http_cache_identity())
+
         self._clean_output_directory()
         logger.debug("'doc-issues' mode output directory cleaned.")
 
         # Data mine GitHub issues with defined labels from all repositories
         logger.info("Fetching repository GitHub issues - started.")
-        repository_issues: dict[str, list[Issue]] = self._fetch_github_issues()
+        repository_issues: dict[str, list[IssueRecord]] = self._fetch_github_issues()
         # Note: got a dict of the list of issues for each repository (key is repository id)
         logger.info("Fetching repository GitHub issues - finished.")
 
         # Data mine GitHub project's issues
         logger.info("Fetching GitHub project data - started.")
-        project_issues: dict[str, list[ProjectIssue]] = self._fetch_github_project_issues()
+        # Only project items of the fetched documentation issues are ever consolidated
+        wanted_issues: dict[str, Optional[str]] = {}
+        for repository_id, issues in repository_issues.items():
+            organization_name, repository_name = repository_id.split("/")
+            wanted_issues.update(
+                (Issues.make_issue_key(organization_name, repository_name, issue.number), issue.node_id)
+                for issue in issues
+            )
+        project_issues: dict[str, list[ProjectIssue]] = self._fetch_github_project_issues(wanted_issues)
         # Note: got dict of project issues with unique string key, defying the issue
         logger.info("Fetching GitHub project data - finished.")
 
         # Consolidate all issue data together
         logger.info("Issue and project data consolidation - started.")
         consolidated_issues: dict[str, ConsolidatedIssue] = self._consolidate_issues_data(
-            repository_issues, project_issues
+            repository_issues,
+            project_issues,
+            self.__safe_call(self.__github_issues_instance.get_issue_timeline_items),
         )
         logger.info("Issue and project data consolidation - finished.")
 
+        if self.__snapshot is not None:
+            self._restore_audit_data(self.__snapshot, consolidated_issues)
+
+        # Fetch audit data of all remaining issues in bulk
+        logger.info("Audit data enrichment - started.")
+        self._enrich_audit_data(consolidated_issues)
+        logger.info("Audit data enrichment - finished.")
+
         # persist the consolidated issues
         logger.info("Exporting consolidated issues - started.")
         without_error = self._store_consolidated_issues(consolidated_issues)
         logger.info("Exporting consolidated issues - finished.")
 
+        if self.__parse_cache is not None:
+            self.__parse_cache.save()
+            logger.info(
+                "Parse cache - `%i` issue bodies taken from cache, `%i` parsed.",
+                self.__parse_cache.hits,
+                self.__parse_cache.misses,
+            )
+
+        if self.__http_cache is not None:
+            logger.info(
+                "HTTP cache - `%i` responses replayed from cache, `%i` transferred in full.",
+                self.__http_cache.hits,
+                self.__http_cache.misses,
+            )
+            pruned_count = self.__http_cache.prune(HTTP_CACHE_MAX_AGE_DAYS * 86400, HTTP_CACHE_MAX_SIZE_MB * 1024**2)
+            logger.debug("HTTP cache - pruned `%i` stale entries.", pruned_count)
+        logger.info("GraphQL rate limit - queries cost `%i` points in total.", self.__rate_limiter.graphql_cost)
+
         if not without_error:
             return False
 
+        # Only a successful run becomes the base of the next incremental run
+        if self.__snapshot is not None:
+            self.__snapshot.save(run_started_at, list(repository_issues.keys()), consolidated_issues)
+
         return True
 
+    def _get_http_cache_identity(self) -> Optional[str]:
+        """
+        Get the stable identity the REST responses are cached for. It is the login of the authenticated user,
+        or the workflow repository for installation tokens (e.g. `GITHUB_TOKEN`), which can not read their user.
+
+        @return: The identity, or None if it is not known.
+        """
+        try:
+            return f"user:{self.__github_instance.get_user().login}"
+        except (GithubException, requests.RequestException) as e:
+            # A network failure only leaves the identity unknown, it does not stop the collection
+            logger.debug("HTTP cache - authenticated user not available: %s.", str(e))
+
+        repository = os.environ.get("GITHUB_REPOSITORY")
+        return f"installation:{repository}" if repository else None
+
     def _clean_output_directory(self) -> None:
         """
         Clean the output directory from the previous run.
@@ -125,43 +266,31 @@ class GHDocIssuesCollector:
             shutil.rmtree(self.__output_path)
         os.makedirs(self.__output_path)
 
-    def _fetch_github_issues(self) -> dict[str, list[Issue]]:
+    def _fetch_github_issues(self) -> dict[str, list[IssueRecord]]:
         """
-        Fetch GitHub repository issues using the GitHub library. Only issues with correct labels are fetched.
-        All repository issues are fetched if no labels are defined in the configuration.
+        Fetch GitHub repository issues using the GraphQL API. Only issues with supported labels are fetched.
+        All supported labels are requested at once, so every issue is fetched only once.
 
-        @return: A dictionary containing repository issue objects with a unique key.
+        @return: A dictionary containing repository issue records with a unique key.
         """
-        issues: dict[str, list[Issue]] = {}
+        issues: dict[str, list[IssueRecord]] = {}
         total_issues_number = 0
 
         # Run the fetching logic for every config repository
         # Here is no need for catching an exception, because get_repositories
         # is static, and it was handled when validating user configuration.
-        for config_repository in ActionInputs.get_repositories():
-            repository_id = f"{config_repository.organization_name}/{config_repository.repository_name}"
+        config_repositories = ActionInputs.get_repositories()
+        fetched_issues = self._map_concurrently(self._fetch_repository_issues, config_repositories)
 
-            repository = self.__safe_call(self.__github_instance.get_repo)(repository_id)
-            if repository is None:
+        for config_repository, repository_issues in zip(config_repositories, fetched_issues):
+            if repository_issues is None:
                 return {}
 
-            logger.info("Fetching repository GitHub issues - from `%s`.", repository.full_name)
-
-            issues[repository_id] = []
-            for label in SUPPORTED_ISSUE_LABELS:
-                logger.debug("Fetching issues with label `%s`.", label)
-                issues[repository_id].extend(
-                    self.__safe_call(repository.get_issues)(state=ISSUE_STATE_ALL, labels=[label])
-                )
-            amount_of_issues_per_repo = len(issues[repository_id])
+            repository_id = f"{config_repository.organization_name}/{config_repository.repository_name}"
+            issues[repository_id] = repository_issues
 
             # Accumulate the count of issues
-            total_issues_number += amount_of_issues_per_repo
-            logger.info(
-                "Fetching repository GitHub issues - fetched `%i` repository issues (%s).",
-                amount_of_issues_per_repo,
-                repository.full_name,
-            )
+            total_issues_number += len(repository_issues)
 
         logger.info(
             "Fetching repository GitHub issues - loaded `%i` repository issues in total.",
@@ -169,10 +298,91 @@ class GHDocIssuesCollector:
         )
         return issues
 
-    def _fetch_github_project_issues(self) -> dict[str, list[ProjectIssue]]:
+    def _fetch_repository_issues(self, config_repository: ConfigRepository) -> Optional[list[IssueRecord]]:
+        """
+        Fetch the GitHub issues with supported labels of a single config repository.
+        The GitHub library issues are replaced by slim issue records right after mining, so they can be released.
+
+        @param config_repository: The config repository to fetch issues from.
+        @return: A list of repository issue records, or None if the repository or its issues can not be fetched.
+        """
+        repository_id = f"{config_repository.organization_name}/{config_repository.repository_name}"
+
+        repository = self.__safe_call(self.__github_instance.get_repo)(repository_id)
+        if repository is None:
+            return None
+
+        logger.info("Fetching repository GitHub issues - from `%s`.", repository.full_name)
+
+        since = self.__snapshot.get_since(repository_id) if self.__snapshot is not None else None
+        if since is not None:
+            return self._fetch_updated_repository_issues(repository_id, repository, since)
+
+        logger.debug("Fetching issues with labels `%s`.", SUPPORTED_ISSUE_LABELS)
+        repository_issues: Optional[list[Issue]] = self.__safe_call(
+            self.__github_issues_instance.get_repository_issues
+        )(repository=repository, labels=SUPPORTED_ISSUE_LABELS)
+        if repository_issues is None:
+            return None
+
+        logger.info(
+            "Fetching repository GitHub issues - fetched `%i` repository issues (%s).",
+            len(repository_issues),
+            repository.full_name,
+        )
+        return [IssueRecord.from_github_issue(issue) for issue in repository_issues]
+
+    def _fetch_updated_repository_issues(
+        self, repository_id: str, repository: Repository, since: datetime
+    ) -> Optional[list[IssueRecord]]:
+        """
+        Fetch only the repository issues updated since the last run and merge them into the snapshot issues.
+        Updated issues replace their snapshot version, updated issues without supported labels are dropped.
+
+        @param repository_id: The repository id in the `organization/repository` format.
+        @param repository: The repository instance to fetch issues from.
+        @param since: The time since which the issues have been updated.
+        @return: A list of repository issue records, or None if the updated issues can not be fetched.
+        """
+        logger.debug("Fetching issues updated since `%s`.", since.isoformat())
+        updated_issues: Optional[list[Issue]] = self.__safe_call(
+            self.__github_issues_instance.get_repository_issues_updated_since
+        )(repository=repository, since=since)
+        if updated_issues is None or self.__snapshot is None:
+            return None
+
+        updated_numbers = {issue.number for issue in updated_issues}
+        repository_issues = [
+            issue
+            for issue in self.__snapshot.get_repository_issues(repository_id, self.__github_instance.requester)
+            if issue.number not in updated_numbers
+        ]
+        restored_issues_count = len(repository_issues)
+
+        repository_issues.extend(
+            IssueRecord.from_github_issue(issue)
+            for issue in updated_issues
+            if any(label.name in SUPPORTED_ISSUE_LABELS for label in issue.labels)
+        )
+
+        logger.info(
+            "Fetching repository GitHub issues - fetched `%i` updated, restored `%i` unchanged issues (%s).",
+            len(repository_issues) - restored_issues_count,
+            restored_issues_count,
+            repository.full_name,
+        )
+        return repository_issues
+
+    def _fetch_github_project_issues(
+        self, wanted_issues: Optional[dict[str, Optional[str]]] = None
+    ) -> dict[str, list[ProjectIssue]]:
         """
         Fetch GitHub project issues using the GraphQL API.
+        The items of every project are read either from the project board, or from the side of the wanted issues,
+        whichever needs fewer queries.
 
+        @param wanted_issues: The node ids of the issues to keep project data for by their unique key,
+                              None keeps all project items.
         @return: A dictionary containing project issue objects with unique key.
         """
         if not ActionInputs.is_project_state_mining_enabled():
@@ -181,45 +391,95 @@ class GHDocIssuesCollector:
 
         logger.debug("Project data mining allowed.")
 
-        # Mine project issues for every repository
-        all_project_issues: dict[str, list[ProjectIssue]] = {}
-
-        # Here is no need for catching the exception, because get_repositories
-        # is static, and it was handled when validating user configuration.
-        for config_repository in ActionInputs.get_repositories():
-            repository_id = f"{config_repository.organization_name}/{config_repository.repository_name}"
-            projects_title_filter = config_repository.projects_title_filter
-            logger.debug("Filtering projects: %s. If filter is empty, fetching all.", projects_title_filter)
+        wanted_issue_keys = set(wanted_issues) if wanted_issues is not None else None
+        # The issue side can be used only when every wanted issue is known by its node id
+        is_issue_side_possible = wanted_issues is not None and all(wanted_issues.values())
+
+        # A project linked to several repositories is registered, and so fetched, only once per run.
+        # Its items are fetched as soon as the project is discovered, while next project pages are still requested.
+        # Discovery runs on its own worker, queued discovery tasks would hold back the item fetching otherwise
+        # (e.g. with the default concurrency of 1, no project would be fetched before all were discovered).
+        projects_registry: dict[str, Future[list[ProjectIssue]]] = {}
+        issue_side_projects: dict[str, GitHubProject] = {}
+        registry_lock = threading.Lock()
+
+        with (
+            ThreadPoolExecutor(max_workers=self.__concurrency, thread_name_prefix="doc-issues") as executor,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-issues-discovery") as discovery_executor,
+        ):
+
+            def register_project(project: GitHubProject) -> None:
+                with registry_lock:
+                    if project.id in projects_registry or project.id in issue_side_projects:
+                        return
+
+                    if is_issue_side_possible and self._is_issue_side_lookup_cheaper(
+                        project, len(wanted_issue_keys or [])
+                    ):
+                        issue_side_projects[project.id] = project
+                    else:
+                        projects_registry[project.id] = executor.submit(
+                            self._fetch_project_issues, project, wanted_issue_keys
+                        )
+
+            # Here is no need for catching the exception, because get_repositories
+            # is static, and it was handled when validating user configuration.
+            discovered_project_ids: list[Optional[list[str]]] = list(
+                discovery_executor.map(
+                    self.__safe_call(self._discover_repository_projects),
+                    ActionInputs.get_repositories(),
+                    repeat(register_project),
+                )
+            )
 
-            repository = self.__safe_call(self.__github_instance.get_repo)(repository_id)
-            if repository is None:
+            if any(project_ids is None for project_ids in discovered_project_ids):
+                for project_issues_future in projects_registry.values():
+                    project_issues_future.cancel()
                 return {}
 
-            # Fetch all projects_buffer attached to the repository
-            logger.debug("Fetching GitHub project data - looking for repository `%s` projects.", repository_id)
-            projects: list[GitHubProject] = self.__safe_call(self.__github_projects_instance.get_repository_projects)(
-                repository=repository, projects_title_filter=projects_title_filter
-            )
-
-            if projects:
-                logger.info(
-                    "Fetching GitHub project data - for repository `%s` found `%i` project/s.",
-                    repository.full_name,
-                    len(projects),
-                )
-            else:
-                logger.info(
-                    "Fetching GitHub project data - no project data found for repository `%s`.", repository.full_name
+            issue_side_project_issues: dict[str, list[ProjectIssue]] = {}
+            if issue_side_projects and wanted_issues is not None:
+                issue_side_project_issues = self._fetch_issue_side_project_issues(
+                    executor, list(filter(None, wanted_issues.values())), issue_side_projects
                 )
 
-            # Update every project with project issue-related data
-            for project in projects:
-                logger.info("Fetching GitHub project data - fetching project data from `%s`.", project.title)
-                project_issues: list[ProjectIssue] = self.__safe_call(
-                    self.__github_projects_instance.get_project_issues
-                )(project=project)
+            def get_project_issues(project_id: str) -> list[ProjectIssue]:
+                if project_id in projects_registry:
+                    return projects_registry[project_id].result()
+                return issue_side_project_issues.get(project_id, [])
+
+            all_project_issues = self._merge_project_issues(discovered_project_ids, get_project_issues)
+
+        logger.debug(
+            "Fetching GitHub project data - fetched `%i` unique project/s, `%i` of them from the issue side.",
+            len(projects_registry) + len(issue_side_projects),
+            len(issue_side_projects),
+        )
+        return all_project_issues
+
+    @staticmethod
+    def _merge_project_issues(
+        discovered_project_ids: list[Optional[list[str]]], get_project_issues: Callable[[str], list[ProjectIssue]]
+    ) -> dict[str, list[ProjectIssue]]:
+        """
+        Merge the project issues of all discovered projects by the issue key. Project items are merged
+        in the order of the config repositories, so the output is deterministic.
+
+        @param discovered_project_ids: The list of discovered project ids per config repository.
+        @param get_project_issues: The function providing the project issues of a project by its id.
+        @return: A dictionary containing project issue objects with unique key.
+        """
+        all_project_issues: dict[str, list[ProjectIssue]] = {}
+        merged_project_ids: set[str] = set()
+
+        for project_ids in discovered_project_ids:
+            for project_id in project_ids or []:
+                if project_id in merged_project_ids:
+                    continue
+                merged_project_ids.add(project_id)
 
-                for project_issue in project_issues:
+                # Project items are routed to their repositories by the issue key
+                for project_issue in get_project_issues(project_id):
                     key = Issues.make_issue_key(
                         project_issue.organization_name,
                         project_issue.repository_name,
@@ -232,21 +492,133 @@ class GHDocIssuesCollector:
                     else:
                         # If the project issue key is already present, add another project data from other projects
                         all_project_issues[key].append(project_issue)
-                logger.info(
-                    "Fetching GitHub project data - successfully fetched project data from `%s`.", project.title
-                )
 
         return all_project_issues
 
+    @staticmethod
+    def _is_issue_side_lookup_cheaper(project: GitHubProject, wanted_issues_count: int) -> bool:
+        """
+        Choose the project traversal needing fewer queries. The board side pages through all project items,
+        while the issue side asks for the project items of the wanted issues in batches.
+
+        @param project: The discovered GitHub project.
+        @param wanted_issues_count: The number of wanted issues.
+        @return: True if the project items should be read from the issue side, False otherwise.
+        """
+        board_side_queries = math.ceil(project.items_total_count / ISSUES_PER_PAGE_LIMIT)
+        issue_side_queries = math.ceil(wanted_issues_count / PROJECT_ITEMS_BATCH_SIZE)
+        return issue_side_queries < board_side_queries
+
+    def _fetch_issue_side_project_issues(
+        self, executor: ThreadPoolExecutor, node_ids: list[str], projects: dict[str, GitHubProject]
+    ) -> dict[str, list[ProjectIssue]]:
+        """
+        Fetch the project items of the given issues in batches, keeping only the items of the given projects.
+
+        @param executor: The worker pool to run the batches in.
+        @param node_ids: The node ids of the wanted issues.
+        @param projects: The projects read from the issue side by their project id.
+        @return: A dictionary of project issue lists by their project id.
+        """
+        logger.info(
+            "Fetching GitHub project data - reading `%i` project/s from the side of `%i` issues.",
+            len(projects),
+            len(node_ids),
+        )
+        batches = [
+            node_ids[i : i + PROJECT_ITEMS_BATCH_SIZE] for i in range(0, len(node_ids), PROJECT_ITEMS_BATCH_SIZE)
+        ]
+        get_issues_project_items = self.__safe_call(self.__github_projects_instance.get_issues_project_items)
+
+        project_issues: dict[str, list[ProjectIssue]] = {}
+        for batch_project_issues in executor.map(get_issues_project_items, batches, repeat(projects)):
+            for project_id, batch_issues in (batch_project_issues or {}).items():
+                project_issues.setdefault(project_id, []).extend(batch_issues)
+
+        return project_issues
+
+    def _discover_repository_projects(
+        self, config_repository: ConfigRepository, register_project: Callable[[GitHubProject], None]
+    ) -> Optional[list[str]]:
+        """
+        Discover all projects attached to a single config repository, the project title filter is applied.
+        Every project is registered as soon as it is received.
+
+        @param config_repository: The config repository to discover projects for.
+        @param register_project: The function registering a discovered project for fetching its items.
+        @return: A list of discovered project ids, or None if the repository can not be fetched.
+        """
+        repository_id = f"{config_repository.organization_name}/{config_repository.repository_name}"
+        projects_title_filter = config_repository.projects_title_filter
+        logger.debug("Filtering projects: %s. If filter is empty, fetching all.", projects_title_filter)
+
+        repository = self.__safe_call(self.__github_instance.get_repo)(repository_id)
+        if repository is None:
+            return None
+
+        # Discover all projects attached to the repository
+        logger.debug("Fetching GitHub project data - looking for repository `%s` projects.", repository_id)
+        project_ids: list[str] = []
+        for project in self.__github_projects_instance.iter_repository_projects(
+            repository=repository, projects_title_filter=projects_title_filter
+        ):
+            register_project(project)
+            project_ids.append(project.id)
+
+        if project_ids:
+            logger.info(
+                "Fetching GitHub project data - for repository `%s` found `%i` project/s.",
+                repository.full_name,
+                len(project_ids),
+            )
+        else:
+            logger.info(
+                "Fetching GitHub project data - no project data found for repository `%s`.", repository.full_name
+            )
+
+        return project_ids
+
+    def _fetch_project_issues(
+        self, project: GitHubProject, wanted_issue_keys: Optional[set[str]] = None
+    ) -> list[ProjectIssue]:
+        """
+        Fetch the project issues of a single project.
+
+        @param project: The GitHub project to fetch the items of.
+        @param wanted_issue_keys: The keys of the issues to keep, None keeps all project items.
+        @return: A list of project issue objects.
+        """
+        logger.info("Fetching GitHub project data - fetching project data from `%s`.", project.title)
+        project_issues: list[ProjectIssue] = self.__safe_call(self.__github_projects_instance.get_project_issues)(
+            project=project, wanted_issue_keys=wanted_issue_keys
+        )
+        logger.info("Fetching GitHub project data - successfully fetched project data from `%s`.", project.title)
+        return project_issues or []
+
+    def _map_concurrently(self, fetch_method: Callable[[U], T], items: list[U]) -> list[T]:
+        """
+        Run the fetch method for every item (e.g. config repository) using the bounded worker pool.
+        The results keep the order of the items, so merging them is deterministic.
+
+        @param fetch_method: The method fetching data for a single item.
+        @param items: The items to fetch data for.
+        @return: A list of fetch method results in the order of the items.
+        """
+        with ThreadPoolExecutor(max_workers=self.__concurrency, thread_name_prefix="doc-issues") as executor:
+            return list(executor.map(fetch_method, items))
+
     @staticmethod
     def _consolidate_issues_data(
-        repository_issues: dict[str, list[Issue]], project_issues: dict[str, list[ProjectIssue]]
+        repository_issues: dict[str, list[IssueRecord]],
+        project_issues: dict[str, list[ProjectIssue]],
+        timeline_items_fetcher: Optional[Callable[[str], Optional[list[dict[str, Any]]]]] = None,
     ) -> dict[str, ConsolidatedIssue]:
         """
         Consolidate the fetched issues and extra project data into a single consolidated object.
 
-        @param repository_issues: A dictionary containing repository issue objects with a unique key.
+        @param repository_issues: A dictionary containing repository issue records with a unique key.
         @param project_issues: A dictionary containing project issue objects with a unique key.
+        @param timeline_items_fetcher: The fetcher of the GraphQL timeline items used by the lazy audit data fetching.
         @return: A dictionary containing all consolidated issues.
         """
 
@@ -259,7 +631,9 @@ class GHDocIssuesCollector:
                 unique_key = Issues.make_issue_key(repo_id_parts[0], repo_id_parts[1], repository_issue.number)
                 if unique_key not in consolidated_issues:
                     consolidated_issues[unique_key] = ConsolidatedIssue(
-                        repository_id=repository_id, repository_issue=repository_issue
+                        repository_id=repository_id,
+                        repository_issue=repository_issue,
+                        timeline_items_fetcher=timeline_items_fetcher,
                     )
 
                     labels = consolidated_issues[unique_key].labels
@@ -273,6 +647,18 @@ class GHDocIssuesCollector:
                         issue_type = FunctionalityIssue.__name__
 
                     consolidated_issues[unique_key].issue_type = issue_type
+
+                    living_doc_labels = [label for label in labels if label in SUPPORTED_ISSUE_LABELS]
+                    if len(living_doc_labels) > 1:
+                        logger.error(
+                            "Issue with key `%s` has multiple Living-Doc labels `%s`.",
+                            unique_key,
+                            living_doc_labels,
+                        )
+                        consolidated_issues[unique_key].errors["multiple_labels"] = (
+                            "Multiple Living-Doc labels found for the same issue. "
+                            "Please use only one Living-Doc label per issue."
+                        )
                 else:
                     logger.error(
                         "Issue with key `%s` already consolidated. Multiple Living-Doc labels `%s` might be used.",
@@ -297,6 +683,59 @@ class GHDocIssuesCollector:
         )
         return consolidated_issues
 
+    def _enrich_audit_data(self, consolidated_issues: dict[str, ConsolidatedIssue]) -> None:
+        """
+        Fetch the audit data of the consolidated issues in batches of GraphQL queries, instead of
+        several REST calls per issue. Issues not enriched here fall back to the lazy REST fetching.
+
+        @param consolidated_issues: A dictionary containing all consolidated issues.
+        @return: None
+        """
+        issues_by_node_id: dict[str, ConsolidatedIssue] = {
+            consolidated_issue.node_id: consolidated_issue
+            for consolidated_issue in consolidated_issues.values()
+            if not consolidated_issue.audit_data_fetched and consolidated_issue.node_id
+        }
+        node_ids = list(issues_by_node_id.keys())
+        batches = [node_ids[i : i + AUDIT_BATCH_SIZE] for i in range(0, len(node_ids), AUDIT_BATCH_SIZE)]
+
+        enriched_count = 0
+        for issue_nodes in self._map_concurrently(
+            self.__safe_call(self.__github_issues_instance.get_issues_audit_data), batches
+        ):
+            if issue_nodes is None:
+                continue
+
+            for node_id, issue_node in issue_nodes.items():
+                issues_by_node_id[node_id].load_audit_data(issue_node)
+                enriched_count += 1
+
+        logger.info(
+            "Audit data enrichment - enriched `%i` from `%i` issues in `%i` queries.",
+            enriched_count,
+            len(node_ids),
+            len(batches),
+        )
+
+    @staticmethod
+    def _restore_audit_data(snapshot: IssuesSnapshot, consolidated_issues: dict[str, ConsolidatedIssue]) -> None:
+        """
+        Set the audit data known from the snapshot to all issues not updated since the last run,
+        so their comments and timeline are not fetched again.
+
+        @param snapshot: The snapshot of the last successful run.
+        @param consolidated_issues: A dictionary containing all consolidated issues.
+        @return: None
+        """
+        restored_count = 0
+        for key, consolidated_issue in consolidated_issues.items():
+            audit_data = snapshot.get_audit_data(consolidated_issue.repository_id, key, consolidated_issue.updated_at)
+            if audit_data is not None:
+                consolidated_issue.set_audit_data(audit_data)
+                restored_count += 1
+
+        logger.info("Incremental mining - restored audit data of `%i` unchanged issues.", restored_count)
+
     def _store_consolidated_issues(self, consolidated_issues: dict[str, ConsolidatedIssue]) -> bool:
         """
         Store the consolidated issues in JSON format with audit enrichment.
@@ -324,11 +763,15 @@ class GHDocIssuesCollector:
                 issue=issue,
             )
 
-        output_file_path = os.path.join(self.__output_path, "doc-issues.json")
+        output_file_path = self.__output_file_path
         logger.info("Exporting consolidated issues - exporting to `%s`.", output_file_path)
 
         # Save with audit enrichment
-        self._save_issues_with_audit_data(output_file_path, issues, consolidated_issues)
+        if self.__output_format == OutputFormat.JSONL.value:
+            sidecar_file_path = os.path.join(self.__output_path, DOC_ISSUES_SIDECAR_FILE_NAME)
+            self._save_issues_as_json_lines(output_file_path, sidecar_file_path, issues, consolidated_issues)
+        else:
+            self._save_issues_with_audit_data(output_file_path, issues, consolidated_issues)
 
         if any(len(issue.errors) > 0 for issue in issues.issues.values()) or invalid_issue_detected:
             logger.error("Exporting consolidated issues - some issues have errors.")
@@ -351,10 +794,80 @@ class GHDocIssuesCollector:
         @param consolidated_issues: Consolidated issues with audit data.
         @return: None
         """
-        # Build items array with audit enrichment
-        items_list = []
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # Items are converted one by one while being written (and compressed), the whole document is never held
+        # in memory
         warnings_list: list[str] = []
+        indent = None if ActionInputs.is_output_compact() else DOC_ISSUES_OUTPUT_INDENT
+        with compression.open_text_file(file_path, self.__output_compression) as f:
+            json_codec.dump_streamed(
+                [
+                    ("items", self._iter_output_items(issues, consolidated_issues, indent)),
+                    ("metadata", self._get_file_metadata()),
+                    ("warnings", warnings_list),
+                ],
+                f,
+                indent=indent,
+            )
 
+    def _save_issues_as_json_lines(
+        self,
+        file_path: str,
+        sidecar_file_path: str,
+        issues: Issues,
+        consolidated_issues: dict[str, ConsolidatedIssue],
+    ) -> None:
+        """
+        Save issues to JSON Lines with audit enrichment, one item of the v1.0.0 schema per line.
+        The file-level metadata and warnings are saved to a separate sidecar JSON file,
+        so consumers can stream and split the items without parsing the whole document.
+
+        @param file_path: Path to save the JSON Lines file.
+        @param sidecar_file_path: Path to save the sidecar JSON file with metadata and warnings.
+        @param issues: Issues object containing base issue data.
+        @param consolidated_issues: Consolidated issues with audit data.
+        @return: None
+        """
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with compression.open_text_file(file_path, self.__output_compression) as f:
+            for adapter_item in self._iter_output_items(issues, consolidated_issues, None):
+                f.write(adapter_item if isinstance(adapter_item, EncodedJSON) else json_codec.dumps(adapter_item))
+                f.write("\n")
+
+        warnings_list: list[str] = []
+        with open(sidecar_file_path, "w", encoding="utf-8") as f:
+            json_codec.dump(
+                {"metadata": self._get_file_metadata(), "warnings": warnings_list}, f, indent=DOC_ISSUES_OUTPUT_INDENT
+            )
+
+    def _iter_output_items(
+        self, issues: Issues, consolidated_issues: dict[str, ConsolidatedIssue], indent: Optional[int]
+    ) -> Iterator[dict | EncodedJSON]:
+        """
+        Convert issues into the output items, by worker processes when more output workers are configured.
+
+        @param issues: Issues object containing base issue data.
+        @param consolidated_issues: Consolidated issues with audit data.
+        @param indent: The indentation of the output document, None for a compact document.
+        @return: An iterator of output items, or of items already encoded by the worker processes.
+        """
+        if self.__output_workers > 1:
+            return self._iter_encoded_adapter_items(issues, consolidated_issues, indent)
+        return self._iter_adapter_items(issues, consolidated_issues)
+
+    def _iter_issue_data(
+        self, issues: Issues, consolidated_issues: dict[str, ConsolidatedIssue]
+    ) -> Generator[tuple[str, dict[str, Any]], None, None]:
+        """
+        Get the plain data of the issues needed to build their output items, one at a time.
+
+        @param issues: Issues object containing base issue data.
+        @param consolidated_issues: Consolidated issues with audit data.
+        @return: A generator of issue keys with their issue data.
+        """
         for key, issue in issues.issues.items():
             issue_dict = issue.to_dict()
 
@@ -363,37 +876,68 @@ class GHDocIssuesCollector:
                 audit_data = consolidated_issues[key].get_audit_data()
                 issue_dict.update(audit_data)
 
-            parsed_body = parse_body(issue_dict.get("body"))
-            adapter_item = {
-                "id": key,  # owner/repo#number format
-                "title": issue_dict.get("title", ""),
-                "state": issue_dict.get("state", ""),
-                "tags": issue_dict.get("labels", []),
-                "url": issue_dict.get("html_url", ""),
-                "timestamps": {
-                    "created": issue_dict.get("created_at", ""),
-                    "updated": issue_dict.get("updated_at", ""),
-                },
-                "description": parsed_body["description"],
-                "business_value": parsed_body["business_value"],
-                "preconditions": parsed_body["preconditions"],
-                "acceptance_criteria": parsed_body["acceptance_criteria"],
-            }
-            items_list.append(adapter_item)
-
-        # Wrap with file-level metadata matching AdapterMetadata structure
-        output_data = {
-            "items": items_list,
-            "metadata": self._get_file_metadata(),
-            "warnings": warnings_list,
-        }
+            yield key, get_item_issue_data(issue_dict)
 
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    def _iter_adapter_items(
+        self, issues: Issues, consolidated_issues: dict[str, ConsolidatedIssue]
+    ) -> Generator[dict, None, None]:
+        """
+        Convert issues into the adapter items of the v1.0.0 schema with audit enrichment, one at a time.
+
+        @param issues: Issues object containing base issue data.
+        @param consolidated_issues: Consolidated issues with audit data.
+        @return: A generator of adapter items.
+        """
+        for key, issue_data in self._iter_issue_data(issues, consolidated_issues):
+            if self.__parse_cache is not None:
+                parsed_body = self.__parse_cache.parse_body(issue_data.get("body"))
+            else:
+                parsed_body = self.__section_schema.parse(issue_data.get("body"))
+            yield build_adapter_item(key, issue_data, parsed_body)
 
-        # Write to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=4, ensure_ascii=False)
+    def _iter_encoded_adapter_items(
+        self, issues: Issues, consolidated_issues: dict[str, ConsolidatedIssue], indent: Optional[int]
+    ) -> Generator[EncodedJSON, None, None]:
+        """
+        Convert issues into encoded adapter items by a pool of worker processes. Issue data are sent in chunks,
+        only a few chunks per worker are in flight, and the encoded items are yielded in the original order.
+
+        @param issues: Issues object containing base issue data.
+        @param consolidated_issues: Consolidated issues with audit data.
+        @param indent: The indentation of the output document, None for a compact document.
+        @return: A generator of encoded adapter items.
+        """
+        parse_cache = self.__parse_cache
+        chunks = (
+            # Bodies known from the parse cache are not parsed again by the workers
+            [
+                (key, issue_data, parse_cache.get(issue_data.get("body")) if parse_cache is not None else None)
+                for key, issue_data in chunk
+            ]
+            for chunk in batched(self._iter_issue_data(issues, consolidated_issues), OUTPUT_WORKERS_CHUNK_SIZE)
+        )
+
+        with ProcessPoolExecutor(max_workers=self.__output_workers) as executor:
+            in_flight: deque[tuple[list, Future]] = deque()
+            for chunk in chunks:
+                in_flight.append((chunk, executor.submit(encode_adapter_items, chunk, self.__section_schema, indent)))
+                if len(in_flight) >= self.__output_workers * OUTPUT_WORKERS_CHUNKS_IN_FLIGHT:
+                    yield from self.__collect_encoded_chunk(*in_flight.popleft())
+            while in_flight:
+                yield from self.__collect_encoded_chunk(*in_flight.popleft())
+
+    def __collect_encoded_chunk(self, chunk: list, future: Future) -> Generator[EncodedJSON, None, None]:
+        """
+        Wait for the encoded chunk and store its newly parsed bodies in the parse cache.
+
+        @param chunk: The chunk of issue keys, issue data and known parsed bodies sent to the worker.
+        @param future: The future of the encoded chunk.
+        @return: A generator of the encoded adapter items of the chunk.
+        """
+        for (_, issue_data, _), (encoded_item, parsed_body) in zip(chunk, future.result()):
+            if self.__parse_cache is not None and parsed_body is not None:
+                self.__parse_cache.put(issue_data.get("body"), parsed_body)
+            yield encoded_item
 
     def _get_file_metadata(self) -> dict:
         """
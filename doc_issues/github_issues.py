@@ -0,0 +1,253 @@
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the GitHubIssues class, which is responsible for mining repository issues via GraphQL.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from github import Github
+from github.GithubException import GithubException
+from github.Issue import Issue
+from github.Repository import Repository
+
+from utils.github_project_queries import (
+    get_issue_timeline_items_query,
+    get_issues_audit_query,
+    get_issues_from_repo_query,
+    get_issues_updated_since_from_repo_query,
+)
+from utils.rate_limiter import HeaderRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class GitHubIssues:
+    """
+    A class representing all the logic for mining repository issues using the GitHub GraphQL API.
+    All requested labels are sent in a single query, where GitHub applies them with OR semantics,
+    so every issue is received exactly once with its labels, author and timestamps already included.
+    """
+
+    def __init__(self, github_instance: Github, rate_limiter: Optional[HeaderRateLimiter] = None):
+        self.__github_instance: Github = github_instance
+        self.__rate_limiter: Optional[HeaderRateLimiter] = rate_limiter
+
+    def get_repository_issues(self, repository: Repository, labels: list[str]) -> list[Issue]:
+        """
+        Fetch all open and closed repository issues carrying at least one of the given labels.
+        Fetching is supported by pagination.
+
+        @param repository: The repository instance to fetch issues from.
+        @param labels: The list of labels, an issue is fetched if it has any of them.
+        @return: A list of GitHub issue objects.
+        """
+        return self._fetch_issues(
+            repository,
+            lambda after_argument: get_issues_from_repo_query(
+                organization_name=repository.owner.login,
+                repository_name=repository.name,
+                labels=labels,
+                after_argument=after_argument,
+            ),
+        )
+
+    def get_repository_issues_updated_since(self, repository: Repository, since: datetime) -> list[Issue]:
+        """
+        Fetch all open and closed repository issues updated at or after the given time, regardless of their labels.
+        Issues which lost their labels are included as well, so the caller can drop them from older data.
+        Fetching is supported by pagination.
+
+        @param repository: The repository instance to fetch issues from.
+        @param since: The time since which the issues have been updated.
+        @return: A list of GitHub issue objects.
+        """
+        return self._fetch_issues(
+            repository,
+            lambda after_argument: get_issues_updated_since_from_repo_query(
+                organization_name=repository.owner.login,
+                repository_name=repository.name,
+                since=since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                after_argument=after_argument,
+            ),
+        )
+
+    def get_issues_audit_data(self, node_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Fetch the audit data (author, last comment and audit-relevant timeline items) of several issues
+        in a single GraphQL query.
+
+        @param node_ids: The list of issue node ids, at most AUDIT_BATCH_SIZE ids are expected.
+        @return: A dictionary of GraphQL issue nodes by their node id, inaccessible issues are missing.
+        """
+        # Inaccessible issues are returned as null nodes, they do not fail the other issues of the batch
+        response_data = self._send_graphql_query(get_issues_audit_query(node_ids))
+        issue_nodes = {issue_node["id"]: issue_node for issue_node in response_data["nodes"] if issue_node}
+
+        # Only a few issues have more audit-relevant timeline items than fit into the batched query
+        for node_id, issue_node in list(issue_nodes.items()):
+            timeline_items = issue_node["timelineItems"]
+            if not timeline_items["pageInfo"]["hasNextPage"]:
+                continue
+            try:
+                timeline_items["nodes"].extend(
+                    self.get_issue_timeline_items(node_id, timeline_items["pageInfo"]["endCursor"])
+                )
+            except GithubException as e:
+                # The incomplete issue is left to the lazy fetching of its audit data
+                logger.debug("Could not fetch all timeline items of issue `%s`: %s.", node_id, str(e))
+                del issue_nodes[node_id]
+
+        logger.debug("Received audit data of `%i` from `%i` requested issue(s).", len(issue_nodes), len(node_ids))
+        return issue_nodes
+
+    def get_issue_timeline_items(self, node_id: str, cursor: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Fetch the audit-relevant timeline items of the issue. GitHub filters the item types on the server side,
+        so other timeline entries (commits, references, comments, ...) are never transferred.
+        Fetching is supported by pagination.
+
+        @param node_id: The issue node id.
+        @param cursor: The cursor to continue after, None to start from the first item.
+        @return: A list of GraphQL timeline item nodes.
+        @raise GithubException: If the timeline items can not be fetched.
+        """
+        timeline_items: list[dict[str, Any]] = []
+
+        while True:
+            # Add the after argument to the query if a cursor is provided
+            after_argument = f'after: "{cursor}"' if cursor else ""
+
+            response_data = self._send_graphql_query(get_issue_timeline_items_query(node_id, after_argument))
+            if response_data.get("node") is None:
+                raise GithubException(404, {"message": f"Issue `{node_id}` not found."}, None)
+
+            general_response_structure = response_data["node"]["timelineItems"]
+            timeline_items.extend(general_response_structure["nodes"])
+            page_info = general_response_structure["pageInfo"]
+
+            # Check for closing the pagination process
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
+        return timeline_items
+
+    def _fetch_issues(self, repository: Repository, build_query: Callable[[str], str]) -> list[Issue]:
+        """
+        Page through the repository issues returned by the query.
+
+        @param repository: The repository instance to fetch issues from.
+        @param build_query: The function building the query for the given after argument.
+        @return: A list of GitHub issue objects.
+        """
+        issues: list[Issue] = []
+        cursor = None
+
+        while True:
+            # Add the after argument to the query if a cursor is provided
+            after_argument = f'after: "{cursor}"' if cursor else ""
+
+            self._wait()
+            headers, response = self.__github_instance.requester.graphql_query(build_query(after_argument), {})
+            self._record_cost(response)
+
+            general_response_structure = response["data"]["repository"]["issues"]
+            issue_nodes = general_response_structure["nodes"]
+            page_info = general_response_structure["pageInfo"]
+
+            issues.extend(self._to_github_issue(repository, issue_node, headers) for issue_node in issue_nodes)
+            logger.debug("Received `%i` issue(s) records from repository: %s.", len(issue_nodes), repository.full_name)
+
+            # Check for closing the pagination process
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
+        return issues
+
+    def _send_graphql_query(self, query: str) -> dict[str, Any]:
+        """
+        Send the GraphQL query paced by the rate limiter and record its cost. Unlike `Requester.graphql_query`,
+        errors of single nodes (e.g. an inaccessible issue) do not fail the whole query, the failed nodes are
+        returned as null.
+
+        @param query: The GraphQL query.
+        @return: The data of the GraphQL response.
+        @raise GithubException: If the request fails or the response carries no data.
+        """
+        requester = self.__github_instance.requester
+        self._wait()
+        headers, response = requester.requestJsonAndCheck(
+            "POST", requester.graphql_url, input={"query": query, "variables": {}}
+        )
+        if not response.get("data"):
+            raise GithubException(400, response, headers)
+
+        self._record_cost(response)
+        for error in response.get("errors", []):
+            logger.debug("GraphQL query - partial error at `%s`: %s.", error.get("path"), error.get("message"))
+        return response["data"]
+
+    def _wait(self) -> None:
+        """
+        Wait before the GraphQL query, if the known GraphQL rate limit budget asks for it.
+
+        @return: None
+        """
+        if self.__rate_limiter is not None:
+            self.__rate_limiter.wait("graphql")
+
+    def _record_cost(self, response: dict[str, Any]) -> None:
+        """
+        Record the rate limit cost of the GraphQL query in the shared rate budget.
+
+        @param response: The GraphQL response.
+        @return: None
+        """
+        if self.__rate_limiter is not None:
+            self.__rate_limiter.record_graphql_cost(response["data"].get("rateLimit"))
+
+    def _to_github_issue(self, repository: Repository, issue_node: dict[str, Any], headers: dict[str, Any]) -> Issue:
+        """
+        Create a GitHub issue object from a GraphQL issue node.
+        The object is not completed, so it keeps lazy access to the REST API (comments, timeline)
+        exactly as an issue received from the REST issue listing.
+
+        @param repository: The repository instance the issue belongs to.
+        @param issue_node: The GraphQL issue node.
+        @param headers: The headers of the GraphQL response.
+        @return: The GitHub issue object.
+        """
+        attributes: dict[str, Any] = {
+            "node_id": issue_node["id"],
+            "number": issue_node["number"],
+            "title": issue_node["title"],
+            "state": issue_node["state"].lower(),
+            "body": issue_node["body"],
+            "html_url": issue_node["url"],
+            "url": f"{repository.url}/issues/{issue_node['number']}",
+            "created_at": issue_node["createdAt"],
+            "updated_at": issue_node["updatedAt"],
+            "closed_at": issue_node["closedAt"],
+            "user": issue_node["author"],
+            "comments": issue_node["comments"]["totalCount"],
+            "labels": issue_node["labels"]["nodes"],
+        }
+
+        return Issue(self.__github_instance.requester, headers, attributes, completed=False)
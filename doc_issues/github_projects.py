@@ -18,17 +18,24 @@ This module contains the GitHubProjects class, which is responsible for mining d
 """
 
 import logging
-from typing import Optional
+import threading
+from typing import Any, Generator, Optional
 import requests
 
 from github.Repository import Repository
+from living_doc_utilities.model.issues import Issues
+from urllib3.util.retry import Retry
 
 from doc_issues.model.github_project import GitHubProject
 from doc_issues.model.project_issue import ProjectIssue
+from utils import json_codec
+from utils.constants import GRAPHQL_MAX_RETRIES
+from utils.rate_limiter import HeaderRateLimiter
 from utils.github_project_queries import (
     get_projects_from_repo_query,
-    get_project_field_options_query,
     get_issues_from_project_query,
+    get_issues_project_items_query,
+    get_issue_project_items_query,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,10 +48,19 @@ class GitHubProjects:
     processing the responses.
     """
 
-    def __init__(self, token: str, ca_bundle: str | bool = True):
+    def __init__(
+        self,
+        token: str,
+        ca_bundle: str | bool = True,
+        pool_size: int = requests.adapters.DEFAULT_POOLSIZE,
+        rate_limiter: Optional[HeaderRateLimiter] = None,
+    ):
         self.__token = token
         self.__ca_bundle = ca_bundle
+        self.__pool_size = pool_size
+        self.__rate_limiter: Optional[HeaderRateLimiter] = rate_limiter
         self.__session: Optional[requests.Session] = None
+        self.__session_lock = threading.Lock()
 
     def __initialize_request_session(self) -> requests.Session:
         """
@@ -56,6 +72,22 @@ class GitHubProjects:
 
         self.__session = requests.Session()
         self.__session.verify = self.__ca_bundle
+        # GraphQL queries only read data, so retrying the POST on server errors is safe
+        retry = Retry(
+            total=GRAPHQL_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry, pool_connections=self.__pool_size, pool_maxsize=self.__pool_size
+        )
+        self.__session.mount("https://", adapter)
+
+        # The GraphQL budget is shared with the PyGithub calls, both are paced by the same rate limiter
+        if self.__rate_limiter is not None:
+            self.__session.hooks["response"].append(self.__rate_limiter.observe)
 
         headers = {
             "Authorization": f"Bearer {self.__token}",
@@ -74,97 +106,121 @@ class GitHubProjects:
         @return: The response from the GitHub API.
         """
         try:
-            if self.__session is None:
-                self.__initialize_request_session()
+            # The session is shared by all worker threads, so it must be initialized only once
+            with self.__session_lock:
+                if self.__session is None:
+                    self.__initialize_request_session()
+
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.wait("graphql")
 
             # Fetch the response from the API in this line, the session will always be initialized
             response = self.__session.post(  # type: ignore[union-attr]
                 "https://api.github.com/graphql", json={"query": query}
             )
+            # The response is decoded only once, big project pages are expensive to decode
+            response_data = json_codec.loads(response.content)
+
             # Check if the request was successful
-            if "errors" in response.json():
-                logger.error("An error occurred: %s.", response.json()["errors"], exc_info=True)
+            if "errors" in response_data:
+                logger.error("An error occurred: %s.", response_data["errors"], exc_info=True)
                 return None
             response.raise_for_status()
 
-            return response.json()["data"]
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.record_graphql_cost(response_data["data"].get("rateLimit"))
+
+            return response_data["data"]
 
-        except requests.RequestException as req_err:
+        except (requests.RequestException, ValueError) as req_err:
             logger.error("An error occurred: %s.", req_err, exc_info=True)
             return None
 
     def get_repository_projects(self, repository: Repository, projects_title_filter: list[str]) -> list[GitHubProject]:
         """
-        Fetch all projects attached to a given repository using a GraphQL query. Based on the response create
-        GitHub project instances and return them in a list.
+        Fetch all projects attached to a given repository, each with its total count of items.
 
         @param repository: The repository instance to fetch projects from.
         @param projects_title_filter: The list of project titles to filter for.
-        @return: A list of GitHub project instances.
+        @return: A list of GitHub project instances with their `items_total_count`.
         """
-        projects: list[GitHubProject] = []
+        return list(self.iter_repository_projects(repository, projects_title_filter))
 
-        # Fetch the project response from the GraphQL API
-        projects_from_repo_query = get_projects_from_repo_query(
-            organization_name=repository.owner.login, repository_name=repository.name
-        )
+    def iter_repository_projects(
+        self, repository: Repository, projects_title_filter: list[str]
+    ) -> Generator[GitHubProject, None, None]:
+        """
+        Fetch all projects attached to a given repository, each with its total count of items,
+        using GraphQL queries. Fetching is supported by pagination, every project is yielded as soon as
+        its page is received, so the caller can start fetching its items while next pages are requested.
 
-        projects_from_repo_response = self._send_graphql_query(projects_from_repo_query)
+        @param repository: The repository instance to fetch projects from.
+        @param projects_title_filter: The list of project titles to filter for.
+        @return: A generator of GitHub project instances with their `items_total_count`.
+        """
+        cursor = None
 
-        if projects_from_repo_response is None:
-            logger.warning(
-                "Fetching GitHub project data - no project data for repository %s. No data received.",
-                repository.full_name,
+        while True:
+            # Add the after argument to the query if a cursor is provided
+            after_argument = f'after: "{cursor}"' if cursor else ""
+
+            # Fetch the project response from the GraphQL API
+            projects_from_repo_query = get_projects_from_repo_query(
+                organization_name=repository.owner.login,
+                repository_name=repository.name,
+                after_argument=after_argument,
             )
-            return projects
 
-        # This will return `None` at any point if a key is missing or if the data is not found
-        projects_from_repo_nodes = projects_from_repo_response.get("repository", {}).get("projectsV2", {}).get("nodes")
+            projects_from_repo_response = self._send_graphql_query(projects_from_repo_query)
 
-        # If response is not None, parse the project response
-        if projects_from_repo_nodes is not None:
-            projects_from_repo_nodes = projects_from_repo_response["repository"]["projectsV2"]["nodes"]
+            if projects_from_repo_response is None:
+                logger.warning(
+                    "Fetching GitHub project data - no project data for repository %s. No data received.",
+                    repository.full_name,
+                )
+                return
+
+            # This will return `None` at any point if a key is missing or if the data is not found
+            projects_from_repo = projects_from_repo_response.get("repository", {}).get("projectsV2", {})
+            projects_from_repo_nodes = projects_from_repo.get("nodes")
+
+            if projects_from_repo_nodes is None:
+                logger.warning("Repository information is not present in the response")
+                return
 
             for project_json in projects_from_repo_nodes:
                 # Check if the project is required based on the configuration filter
                 project_title = project_json["title"]
-                project_number = project_json["number"]
 
                 # If no filter is provided, all projects are required
                 is_project_required = True if not projects_title_filter else project_title in projects_title_filter
 
-                # Main project structure is loaded and added to the projects list
+                # Main project structure is loaded and yielded
                 if is_project_required:
-                    # Fetch the project field options from the GraphQL API
-                    project_field_options_query = get_project_field_options_query(
-                        organization_name=repository.owner.login,
-                        repository_name=repository.name,
-                        project_number=project_number,
-                    )
-                    field_option_response = self._send_graphql_query(project_field_options_query)
-
-                    # Create the GitHub project instance and add it to the output list
-                    project = GitHubProject().loads(project_json, repository, field_option_response)  # type: ignore
-                    if project not in projects:
-                        projects.append(project)
+                    yield GitHubProject().loads(project_json, repository)
                 else:
                     logger.debug("Project `%s` is not required based on the filter.", project_title)
 
-        else:
-            logger.warning("Repository information is not present in the response")
-
-        return projects
+            # Check for closing the pagination process
+            page_info = projects_from_repo.get("pageInfo", {})
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info["endCursor"]
 
-    def get_project_issues(self, project: GitHubProject) -> list[ProjectIssue]:
+    def get_project_issues(
+        self, project: GitHubProject, wanted_issue_keys: Optional[set[str]] = None
+    ) -> list[ProjectIssue]:
         """
         Fetch all issues that are attached to a GitHub Project using a GraphQL query.
         Fetching is supported by pagination. Based on the response create project issue objects
         and return them in a list.
 
         @param project: The GitHub project object to fetch issues from.
+        @param wanted_issue_keys: The keys of the issues to keep, other items are dropped while parsing every page.
+                                  None keeps all items.
         @return: A list of project issue objects.
         """
-        project_issues_raw = []
+        project_issues: list[ProjectIssue] = []
         cursor = None
 
         while True:
@@ -186,8 +242,11 @@ class GitHubProjects:
             project_issue_data = general_response_structure["nodes"]
             page_info = general_response_structure["pageInfo"]
 
-            # Extend project issues list per every page during pagination
-            project_issues_raw.extend(project_issue_data)
+            # Only wanted project issues are kept from every page during pagination
+            for issue_json in project_issue_data:
+                project_issue = ProjectIssue().loads(issue_json, project)
+                if project_issue is not None and self._is_wanted(project_issue, wanted_issue_keys):
+                    project_issues.append(project_issue)
             logger.debug("Received `%i` issue(s) records from project: %s.", len(project_issue_data), project.title)
 
             # Check for closing the pagination process
@@ -195,11 +254,92 @@ class GitHubProjects:
                 break
             cursor = page_info["endCursor"]
 
-        project_issues = [
-            issue
-            for issue in (ProjectIssue().loads(issue_json, project) for issue_json in project_issues_raw)
-            if issue is not None
-        ]
         logger.debug("Loaded `%i` issue(s) from project: %s.", len(project_issues), project.title)
 
         return project_issues
+
+    def get_issues_project_items(
+        self, node_ids: list[str], projects: dict[str, GitHubProject]
+    ) -> dict[str, list[ProjectIssue]]:
+        """
+        Fetch the project items of several issues in a single GraphQL query (issue-side project lookup).
+        It is the cheaper alternative to paging through a huge project board for a few documented issues.
+
+        @param node_ids: The list of issue node ids, at most PROJECT_ITEMS_BATCH_SIZE ids are expected.
+        @param projects: The projects to keep items of, by their project id. Items of other projects are dropped.
+        @return: A dictionary of project issue lists by their project id.
+        """
+        project_issues: dict[str, list[ProjectIssue]] = {}
+
+        issues_project_items_response = self._send_graphql_query(get_issues_project_items_query(node_ids))
+        if issues_project_items_response is None:
+            return project_issues
+
+        # Inaccessible issues are returned as null nodes
+        for issue_node in filter(None, issues_project_items_response["nodes"]):
+            item_nodes = issue_node["projectItems"]["nodes"]
+            # Only a few issues are part of more projects than fit into the batched query
+            page_info = issue_node["projectItems"].get("pageInfo", {})
+            if page_info.get("hasNextPage"):
+                item_nodes = item_nodes + self._get_issue_project_items(issue_node["id"], page_info["endCursor"])
+
+            for item_node in item_nodes:
+                project = projects.get(item_node["project"]["id"])
+                if project is None:
+                    continue
+
+                # The issue data is shaped as the content of a project board item
+                issue_json = {**item_node, "content": issue_node}
+                project_issue = ProjectIssue().loads(issue_json, project)
+                if project_issue is not None:
+                    project_issues.setdefault(project.id, []).append(project_issue)
+
+        logger.debug("Received project items of `%i` issue(s) in `%i` project(s).", len(node_ids), len(project_issues))
+        return project_issues
+
+    def _get_issue_project_items(self, node_id: str, cursor: str) -> list[dict[str, Any]]:
+        """
+        Fetch the remaining project items of the issue, after the ones received by the batched query.
+        Fetching is supported by pagination.
+
+        @param node_id: The issue node id.
+        @param cursor: The cursor to continue after.
+        @return: A list of GraphQL project item nodes, the items fetched until a failed query.
+        """
+        item_nodes: list[dict[str, Any]] = []
+
+        while True:
+            issue_project_items_response = self._send_graphql_query(
+                get_issue_project_items_query(node_id, f'after: "{cursor}"')
+            )
+            if issue_project_items_response is None or issue_project_items_response.get("node") is None:
+                logger.warning("Could not fetch all project items of issue `%s`.", node_id)
+                break
+
+            general_response_structure = issue_project_items_response["node"]["projectItems"]
+            item_nodes.extend(general_response_structure["nodes"])
+            page_info = general_response_structure["pageInfo"]
+
+            # Check for closing the pagination process
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+
+        return item_nodes
+
+    @staticmethod
+    def _is_wanted(project_issue: ProjectIssue, wanted_issue_keys: Optional[set[str]]) -> bool:
+        """
+        Check if the project issue belongs to the wanted issues.
+
+        @param project_issue: The project issue to check.
+        @param wanted_issue_keys: The keys of the wanted issues, None if all issues are wanted.
+        @return: True if the project issue is wanted, False otherwise.
+        """
+        if wanted_issue_keys is None:
+            return True
+
+        key = Issues.make_issue_key(
+            project_issue.organization_name, project_issue.repository_name, project_issue.number
+        )
+        return key in wanted_issue_keys
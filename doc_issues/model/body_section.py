@@ -0,0 +1,133 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a data container for the Body Section, an entry of the issue body section schema.
+"""
+
+import logging
+from typing import Optional
+
+from utils.constants import BodySectionKind
+
+logger = logging.getLogger(__name__)
+
+SECTION_LEVELS = (2, 3)
+
+
+class BodySection:
+    """
+    A class representing a section of the issue body parsed into an output item field.
+    The section is found by its heading and level, its content is parsed based on the content kind.
+    """
+
+    def __init__(
+        self,
+        field: str = "",
+        heading: str = "",
+        level: int = 2,
+        kind: str = BodySectionKind.TEXT.value,
+        columns: Optional[list[str]] = None,
+    ):
+        self.__field: str = field
+        self.__heading: str = heading
+        self.__level: int = level
+        self.__kind: str = kind
+        self.__columns: list[str] = columns or []
+
+    @property
+    def field(self) -> str:
+        """Getter of the output item field holding the parsed section."""
+        return self.__field
+
+    @property
+    def heading(self) -> str:
+        """Getter of the section heading text (without the # prefix)."""
+        return self.__heading
+
+    @property
+    def level(self) -> int:
+        """Getter of the heading level, 2 for a ## section and 3 for a ### sub-section."""
+        return self.__level
+
+    @property
+    def kind(self) -> str:
+        """Getter of the content kind, one of text, bullet-list or table."""
+        return self.__kind
+
+    @property
+    def columns(self) -> list[str]:
+        """Getter of the table column names, used only by the table content kind."""
+        return self.__columns
+
+    def load_from_json(self, section_json: dict) -> bool:
+        """
+        Load the section from a JSON object.
+
+        @param section_json: The JSON object containing the section configuration.
+        @return: True if the section is loaded and valid, False otherwise.
+        """
+        try:
+            self.__field = section_json["field"]
+            self.__heading = section_json["heading"]
+            self.__level = section_json.get("level", 2)
+            self.__kind = section_json.get("kind", BodySectionKind.TEXT.value)
+            self.__columns = section_json.get("columns", [])
+        except KeyError as e:
+            logger.error("The key is not found in the body section JSON input: %s.", e, exc_info=True)
+            return False
+        except (TypeError, AttributeError) as e:
+            logger.error("The body section JSON input does not have a dictionary structure: %s.", e, exc_info=True)
+            return False
+
+        return self.is_valid()
+
+    def is_valid(self) -> bool:
+        """
+        Check if the section can be parsed.
+
+        @return: True if the section is valid, False otherwise.
+        """
+        if self.__level not in SECTION_LEVELS:
+            logger.error("Body section `%s` - level must be one of %s.", self.__heading, SECTION_LEVELS)
+            return False
+        if self.__kind not in [kind.value for kind in BodySectionKind]:
+            logger.error("Body section `%s` - unsupported content kind `%s`.", self.__heading, self.__kind)
+            return False
+        if self.__kind == BodySectionKind.TABLE.value and not self.__columns:
+            logger.error("Body section `%s` - table content requires column names.", self.__heading)
+            return False
+        return True
+
+    def to_dict(self) -> dict:
+        """
+        Convert the section to its JSON configuration.
+
+        @return: The JSON object of the section.
+        """
+        return {
+            "field": self.__field,
+            "heading": self.__heading,
+            "level": self.__level,
+            "kind": self.__kind,
+            "columns": self.__columns,
+        }
+
+    def __repr__(self):
+        return (
+            f"BodySection(field={self.field}, heading={self.heading}, level={self.level}, kind={self.kind}, "
+            f"columns={self.columns})"
+        )
@@ -19,7 +19,8 @@ This module contains a data container for Consolidated Issue, which holds all th
 """
 
 import logging
-from typing import Optional, Any
+from datetime import datetime
+from typing import Any, Callable, Optional
 
 from living_doc_utilities.factory.issue_factory import IssueFactory
 from living_doc_utilities.model.issue import Issue
@@ -28,9 +29,24 @@ from living_doc_utilities.model.project_status import ProjectStatus
 from github.Issue import Issue as GitHubIssue
 from github.GithubException import GithubException
 
+from doc_issues.model.issue_record import IssueRecord
+
 logger = logging.getLogger(__name__)
 
+# GraphQL timeline item types mapped to the audit event actions of the REST timeline
+TIMELINE_ITEM_ACTIONS = {
+    "LabeledEvent": "labeled",
+    "UnlabeledEvent": "unlabeled",
+    "AssignedEvent": "assigned",
+    "UnassignedEvent": "unassigned",
+    "MilestonedEvent": "milestoned",
+    "DemilestonedEvent": "demilestoned",
+    "ReopenedEvent": "reopened",
+    "ClosedEvent": "closed",
+}
+
 
+# pylint: disable=too-many-instance-attributes, too-many-public-methods
 class ConsolidatedIssue:
     """
     A class representing a consolidated issue from the repository and project data.
@@ -38,11 +54,24 @@ class ConsolidatedIssue:
     properties to access consolidated issue details.
     """
 
-    def __init__(self, repository_id: str, repository_issue: Optional[GitHubIssue] = None):
-        # save issue from repository (got from GitHub library & keep connection to repository for lazy loading)
-        # Warning: several issue properties require additional API calls - use wisely to keep low API usage
-        self.__issue: Optional[GitHubIssue] = repository_issue
+    def __init__(
+        self,
+        repository_id: str,
+        repository_issue: Optional[GitHubIssue | IssueRecord] = None,
+        timeline_items_fetcher: Optional[Callable[[str], Optional[list[dict[str, Any]]]]] = None,
+    ):
+        # Only a slim record of the repository issue is kept, the GitHub library issue is converted right away,
+        # so it can be released. A short-lived GitHub library issue is created for the lazy REST calls only.
+        self.__record: Optional[IssueRecord] = (
+            IssueRecord.from_github_issue(repository_issue)
+            if isinstance(repository_issue, GitHubIssue)
+            else repository_issue
+        )
         self.__repository_id: str = repository_id
+        # Fetches the audit-relevant GraphQL timeline items by the issue node id, returns None if they are unavailable
+        self.__timeline_items_fetcher: Optional[Callable[[str], Optional[list[dict[str, Any]]]]] = (
+            timeline_items_fetcher
+        )
 
         self.issue_type: str = "Issue"
 
@@ -50,9 +79,6 @@ class ConsolidatedIssue:
         self.__linked_to_project: bool = False
         self.__project_issue_statuses: list[ProjectStatus] = []
 
-        # Labels of the issue - saved during mining to reduce API calls and protect against rate limits
-        self.__issue_labels: list[str] = []
-
         self.__errors: dict[str, str] = {}
 
         # Audit-related data (cached to reduce API calls)
@@ -68,7 +94,12 @@ class ConsolidatedIssue:
     @property
     def number(self) -> int:
         """Getter of the issue number."""
-        return self.__issue.number if self.__issue else 0
+        return self.__record.number if self.__record else 0
+
+    @property
+    def node_id(self) -> str:
+        """Getter of the issue GraphQL node id."""
+        return (self.__record.node_id or "") if self.__record else ""
 
     @property
     def repository_id(self) -> str:
@@ -90,53 +121,42 @@ class ConsolidatedIssue:
     @property
     def title(self) -> str:
         """Getter of the issue title."""
-        return self.__issue.title if self.__issue else ""
+        return self.__record.title if self.__record else ""
 
     @property
     def state(self) -> str:
         """Getter of the issue state."""
-        return self.__issue.state if self.__issue else ""
+        return self.__record.state if self.__record else ""
 
     @property
     def created_at(self) -> str:
         """Getter of the info when issue was created."""
-        if self.__issue and self.__issue.created_at:
-            return self.__issue.created_at.isoformat()
-        return ""
+        return self.__record.created_at if self.__record else ""
 
     @property
     def updated_at(self) -> str:
         """Getter of the info when issue was updated"""
-        if self.__issue and self.__issue.updated_at:
-            return self.__issue.updated_at.isoformat()
-        return ""
+        return self.__record.updated_at if self.__record else ""
 
     @property
     def closed_at(self) -> str:
         """Getter of the info when issue was closed."""
-        if self.__issue and self.__issue.closed_at:
-            return self.__issue.closed_at.isoformat()
-        return ""
+        return self.__record.closed_at if self.__record else ""
 
     @property
     def html_url(self) -> str:
         """Getter of the issue GitHub HTML URL."""
-        return self.__issue.html_url if self.__issue else ""
+        return self.__record.html_url if self.__record else ""
 
     @property
     def body(self) -> str:
         """Getter of the issue description."""
-        return self.__issue.body if self.__issue else ""
+        return self.__record.body if self.__record else ""
 
     @property
     def labels(self) -> list[str]:
         """Getter of the issue labels."""
-        if self.__issue_labels:
-            return self.__issue_labels
-
-        if self.__issue:
-            self.__issue_labels = [label.name for label in self.__issue.labels]
-        return self.__issue_labels
+        return self.__record.labels if self.__record else []
 
     # Project properties
     @property
@@ -155,6 +175,11 @@ class ConsolidatedIssue:
         return self.__errors
 
     # Audit properties
+    @property
+    def audit_data_fetched(self) -> bool:
+        """Getter of the info if the audit data is already known."""
+        return self.__audit_data_fetched
+
     @property
     def created_by(self) -> Optional[str]:
         """Getter of the user who created the issue."""
@@ -196,27 +221,36 @@ class ConsolidatedIssue:
         Ensure audit data is fetched from the GitHub API (lazy loading).
         This method fetches data only once and caches it.
         """
-        if self.__audit_data_fetched or not self.__issue:
+        if self.__audit_data_fetched:
+            return
+
+        issue = self.__get_github_issue()
+        if not issue:
             return
 
         self.__audit_data_fetched = True
 
         try:
             # Fetch creator
-            if self.__issue.user:
-                self.__created_by = self.__issue.user.login
+            if issue.user:
+                self.__created_by = issue.user.login
 
             # Fetch closed_by
-            if self.__issue.closed_by:
-                self.__closed_by = self.__issue.closed_by.login
+            if issue.closed_by:
+                self.__closed_by = issue.closed_by.login
 
             # Fetch comments info
-            self.__comments_count = self.__issue.comments
+            self.__comments_count = issue.comments
 
-            # Fetch last comment info
+            # Fetch last comment info - only the last page is requested, as the comments count is already known
             if self.__comments_count > 0:
                 try:
-                    comments = list(self.__issue.get_comments())
+                    last_page = (self.__comments_count - 1) // issue.requester.per_page
+                    issue_comments = issue.get_comments()
+                    comments = issue_comments.get_page(last_page)
+                    # The known comments count may be stale, deleted comments can leave the expected last page empty
+                    if not comments and last_page > 0:
+                        comments = issue_comments.get_page(last_page - 1)
                     if comments:
                         last_comment = comments[-1]
                         _lc_at = last_comment.created_at
@@ -244,23 +278,40 @@ class ConsolidatedIssue:
                 str(e),
             )
 
+    def __get_github_issue(self) -> Optional[GitHubIssue]:
+        """
+        Create a short-lived GitHub library issue for the REST calls.
+
+        @return: The GitHub issue object, or None if not available.
+        """
+        return self.__record.to_github_issue() if self.__record else None
+
     def _fetch_audit_events(self) -> list[dict[str, Any]]:
         """
-        Fetch audit events from the issue timeline (label changes, assignments, milestones).
+        Fetch audit events (label changes, assignments, milestones, state changes). Only the audit-relevant
+        timeline items are requested by the timeline items fetcher, the REST timeline is walked only for issues
+        without a node id or without a fetcher.
 
         @return: List of audit event dictionaries.
         """
         events: list[dict[str, Any]] = []
-        if not self.__issue:
+        issue = self.__get_github_issue()
+        if not issue:
             return events
 
         try:
-            timeline = self.__issue.get_timeline()
-            for event in timeline:
-                event_data = self._parse_timeline_event(event)
-                if event_data:
-                    events.append(event_data)
-        except (GithubException, AttributeError, TypeError) as e:
+            if self.node_id and self.__timeline_items_fetcher is not None:
+                for timeline_item in self.__timeline_items_fetcher(self.node_id) or []:
+                    event_data = self._parse_timeline_item(timeline_item)
+                    if event_data:
+                        events.append(event_data)
+            else:
+                timeline = issue.get_timeline()
+                for event in timeline:
+                    event_data = self._parse_timeline_event(event)
+                    if event_data:
+                        events.append(event_data)
+        except (GithubException, AttributeError, TypeError, KeyError) as e:
             logger.debug(
                 "Could not fetch timeline events for issue #%s (may lack permissions): %s",
                 self.number,
@@ -366,6 +417,94 @@ class ConsolidatedIssue:
 
         return audit_data
 
+    def set_audit_data(self, audit_data: dict[str, Any]) -> None:
+        """
+        Set audit-related data known from a previous run, so no API calls are needed to fetch it.
+
+        @param audit_data: Dictionary containing audit fields in the format of get_audit_data.
+        @return: None
+        """
+        self.__audit_data_fetched = True
+        self.__created_by = audit_data.get("created_by")
+        self.__closed_by = audit_data.get("closed_by")
+        self.__comments_count = audit_data.get("comments_count", 0)
+        self.__last_commented_at = audit_data.get("last_commented_at")
+        self.__last_commented_by = audit_data.get("last_commented_by")
+        self.__audit_events = audit_data.get("audit_events", [])
+
+    def load_audit_data(self, issue_node: dict[str, Any]) -> None:
+        """
+        Load audit-related data from the GraphQL issue node of the bulk audit query,
+        so no REST calls are needed to fetch it.
+
+        @param issue_node: The GraphQL issue node with author, last comment and timeline items.
+        @return: None
+        """
+        self.__audit_data_fetched = True
+
+        author = issue_node.get("author")
+        self.__created_by = author["login"] if author else None
+
+        comments = issue_node["comments"]
+        self.__comments_count = comments["totalCount"]
+        if comments["nodes"]:
+            last_comment = comments["nodes"][-1]
+            self.__last_commented_at = self._normalize_timestamp(last_comment["createdAt"])
+            self.__last_commented_by = last_comment["author"]["login"] if last_comment["author"] else None
+
+        self.__audit_events = []
+        self.__closed_by = None
+        for timeline_item in issue_node["timelineItems"]["nodes"]:
+            event_data = self._parse_timeline_item(timeline_item)
+            if event_data is None:
+                continue
+
+            self.__audit_events.append(event_data)
+            # The closer of a closed issue is the actor of its last closing event
+            if event_data["action"] == "closed" and self.state == "closed":
+                self.__closed_by = event_data.get("actor")
+
+    def _parse_timeline_item(self, timeline_item: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Parse a GraphQL timeline item into a structured audit event, same as a REST timeline event.
+
+        @param timeline_item: The GraphQL timeline item node.
+        @return: Parsed event dictionary or None if not relevant.
+        """
+        event_type = TIMELINE_ITEM_ACTIONS.get(timeline_item.get("__typename", ""))
+        if event_type is None:
+            return None
+
+        event_data: dict[str, Any] = {
+            "action": event_type,
+            "timestamp": self._normalize_timestamp(timeline_item.get("createdAt")),
+        }
+
+        # Add actor info
+        if timeline_item.get("actor"):
+            event_data["actor"] = timeline_item["actor"]["login"]
+
+        # Add event-specific details
+        if event_type in ("labeled", "unlabeled"):
+            event_data["label"] = timeline_item["label"]["name"] if timeline_item.get("label") else None
+        elif event_type in ("assigned", "unassigned"):
+            assignee = timeline_item.get("assignee")
+            event_data["assignee"] = assignee.get("login") if assignee else None
+        elif event_type in ("milestoned", "demilestoned"):
+            event_data["milestone"] = timeline_item.get("milestoneTitle")
+
+        return event_data
+
+    @staticmethod
+    def _normalize_timestamp(timestamp: Optional[str]) -> Optional[str]:
+        """
+        Convert a GraphQL timestamp (e.g. `2025-01-20T12:00:00Z`) to the ISO format used for REST data.
+
+        @param timestamp: The GraphQL timestamp.
+        @return: The timestamp in ISO format, or None if not provided.
+        """
+        return datetime.fromisoformat(timestamp).isoformat() if timestamp else None
+
     def convert_to_issue_for_persist(self) -> Issue:
         """
         Convert the consolidated issue to a standard Issue object for persistence.
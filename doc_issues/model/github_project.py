@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 class GitHubProject:
     """
     A class representing a GitHub Project is responsible for loading JSON format data,
-    fetching project field options, along with properties to access project specifics.
+    along with properties to access project specifics.
     """
 
     def __init__(self):
@@ -36,7 +36,7 @@ class GitHubProject:
         self.__number: int = 0
         self.__title: str = ""
         self.__organization_name: str = ""
-        self.__field_options: dict[str, list[str]] = {}
+        self.__items_total_count: int = 0
 
     def __repr__(self) -> str:
         """String representation of the GitHub project."""
@@ -73,22 +73,16 @@ class GitHubProject:
         return self.__organization_name
 
     @property
-    def field_options(self) -> dict[str, list[str]]:
-        """Getter of the project field options."""
-        return self.__field_options
+    def items_total_count(self) -> int:
+        """Getter of the total number of project items."""
+        return self.__items_total_count
 
-    @field_options.setter
-    def field_options(self, field_options: dict[str, list[str]]) -> None:
-        """Setter of the project field options."""
-        self.__field_options = field_options
-
-    def loads(self, project_json: dict, repository: Repository, field_option_response: dict) -> "GitHubProject":
+    def loads(self, project_json: dict, repository: Repository) -> "GitHubProject":
         """
         Load the project data from several inputs.
 
         @param project_json: The JSON object containing the data about the project.
         @param repository: The GH repository object where the project is located.
-        @param field_option_response: The response containing the field options for the project.
         @return: The GithubProject object with the loaded data.
         """
         try:
@@ -96,8 +90,7 @@ class GitHubProject:
             self.__number = project_json["number"]
             self.__title = project_json["title"]
             self.__organization_name = repository.owner.login
-
-            logger.debug("Updating field options for projects in repository `%s`.", repository.full_name)
+            self.__items_total_count = project_json.get("items", {}).get("totalCount", 0)
         except KeyError as e:
             logger.error(
                 "Missing key in the project json for repository `%s`: %s",
@@ -107,31 +100,4 @@ class GitHubProject:
             )
             return self
 
-        self._update_field_options(field_option_response)
-
         return self
-
-    def _update_field_options(self, field_option_response: dict) -> None:
-        """
-        Parse and update the field options of the project from a JSON response.
-
-        @param field_option_response: The JSON API response containing the field options.
-        @return: None
-        """
-        try:
-            field_options_nodes = field_option_response["repository"]["projectV2"]["fields"]["nodes"]
-        except KeyError:
-            logger.error(
-                "There is no expected response structure for field options fetched from project: %s",
-                self.title,
-                exc_info=True,
-            )
-            return
-
-        for field_option in field_options_nodes:
-            if "name" in field_option and "options" in field_option:
-                field_name = field_option["name"]
-                options = [option["name"] for option in field_option["options"]]
-
-                # Update the project structure with field options
-                self.field_options.update({field_name: options})
@@ -0,0 +1,135 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains a slim data container for a mined repository issue.
+"""
+
+from typing import Any, Optional
+
+from github.Issue import Issue as GitHubIssue
+from github.Requester import Requester
+
+
+# pylint: disable=too-many-instance-attributes, too-many-arguments, too-few-public-methods
+class IssueRecord:
+    """
+    A class representing a repository issue with only the fields used by the collector.
+    Unlike a GitHub library issue, it keeps neither the raw response data nor nested user and label objects,
+    so the mined issues take a fraction of the memory until the end of the run.
+    """
+
+    __slots__ = (
+        "node_id",
+        "number",
+        "title",
+        "state",
+        "body",
+        "html_url",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "labels",
+        "created_by",
+        "comments_count",
+        "url",
+        "requester",
+    )
+
+    def __init__(
+        self,
+        number: int,
+        title: str,
+        state: str,
+        *,
+        node_id: Optional[str] = None,
+        body: str = "",
+        html_url: str = "",
+        created_at: str = "",
+        updated_at: str = "",
+        closed_at: str = "",
+        labels: Optional[list[str]] = None,
+        created_by: Optional[str] = None,
+        comments_count: int = 0,
+        url: Optional[str] = None,
+        requester: Optional[Requester] = None,
+    ):
+        self.node_id: Optional[str] = node_id
+        self.number: int = number
+        self.title: str = title
+        self.state: str = state
+        self.body: str = body
+        self.html_url: str = html_url
+        # Timestamps are kept in the ISO format used for the output
+        self.created_at: str = created_at
+        self.updated_at: str = updated_at
+        self.closed_at: str = closed_at
+        self.labels: list[str] = labels if labels is not None else []
+        self.created_by: Optional[str] = created_by
+        self.comments_count: int = comments_count
+        # The REST URL and requester allow fetching the audit data lazily, if it is not received in bulk
+        self.url: Optional[str] = url
+        self.requester: Optional[Requester] = requester
+
+    def __repr__(self) -> str:
+        """String representation of the IssueRecord object."""
+        return f"IssueRecord(number={self.number}, title={self.title})"
+
+    @classmethod
+    def from_github_issue(cls, issue: GitHubIssue) -> "IssueRecord":
+        """
+        Create the issue record from a GitHub library issue. Only fields already known to the issue are read,
+        so no API call is made.
+
+        @param issue: The GitHub issue object.
+        @return: The issue record.
+        """
+        return cls(
+            node_id=issue.node_id,
+            number=issue.number,
+            title=issue.title,
+            state=issue.state,
+            body=issue.body,
+            html_url=issue.html_url,
+            created_at=issue.created_at.isoformat() if issue.created_at else "",
+            updated_at=issue.updated_at.isoformat() if issue.updated_at else "",
+            closed_at=issue.closed_at.isoformat() if issue.closed_at else "",
+            labels=[label.name for label in issue.labels],
+            created_by=issue.user.login if issue.user else None,
+            comments_count=issue.comments or 0,
+            url=issue.url,
+            requester=issue.requester,
+        )
+
+    def to_github_issue(self) -> Optional[GitHubIssue]:
+        """
+        Create a short-lived GitHub library issue for the REST calls of the lazy audit data fetching.
+        An issue without a known REST URL is created as completed, so it never triggers an additional API call.
+
+        @return: The GitHub issue object, or None if the record has no requester.
+        """
+        if self.requester is None:
+            return None
+
+        attributes: dict[str, Any] = {
+            "node_id": self.node_id,
+            "number": self.number,
+            "state": self.state,
+            "url": self.url,
+            "user": {"login": self.created_by} if self.created_by else None,
+            "comments": self.comments_count,
+        }
+        return GitHubIssue(self.requester, {}, attributes, completed=self.url is None)
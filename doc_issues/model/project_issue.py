@@ -25,6 +25,7 @@ from typing import Optional
 from living_doc_utilities.model.project_status import ProjectStatus
 
 from doc_issues.model.github_project import GitHubProject
+from utils.constants import PROJECT_STATUS_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -90,22 +91,10 @@ class ProjectIssue:
 
         self.__project_status.project_title = project.title
 
-        # Parse the field types from the response
-        field_types = []
-        if "fieldValues" in issue_json:
-            for node in issue_json["fieldValues"]["nodes"]:
-                if node["__typename"] == "ProjectV2ItemFieldSingleSelectValue":
-                    field_types.append(node["name"])
-
-        # Update the project status with the field type values
-        for field_type in field_types:
-            if field_type in project.field_options.get("Status", []):
-                self.__project_status.status = field_type
-            elif field_type in project.field_options.get("Priority", []):
-                self.__project_status.priority = field_type
-            elif field_type in project.field_options.get("Size", []):
-                self.__project_status.size = field_type
-            elif field_type in project.field_options.get("MoSCoW", []):
-                self.__project_status.moscow = field_type
+        # Every project status field is received under its own alias, so no classification is needed
+        for alias in PROJECT_STATUS_FIELDS:
+            field_value = issue_json.get(alias)
+            if field_value and "name" in field_value:
+                setattr(self.__project_status, alias, field_value["name"])
 
         return self
@@ -0,0 +1,180 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the ParsedBodyCache class, which persists the parsed issue bodies between runs.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Any, Optional
+
+from doc_issues import body_parser
+from doc_issues.body_parser import DEFAULT_SECTION_SCHEMA, SectionSchema
+from utils import json_codec
+from utils.constants import PARSE_CACHE_MAX_SIZE_MB
+
+logger = logging.getLogger(__name__)
+
+
+def get_parser_version(schema: SectionSchema) -> str:
+    """
+    Get the version of the body parser as the hash of its source code and the section schema,
+    so any parser or schema change invalidates the cache.
+
+    @param schema: The section schema used to parse the bodies.
+    @return: The parser version.
+    """
+    with open(body_parser.__file__, "rb") as f:
+        return hashlib.sha256(f.read() + schema.version.encode("utf-8")).hexdigest()
+
+
+class ParsedBodyCache:
+    """
+    A class representing the on-disk cache of parsed issue bodies by the hash of the body text.
+    The least recently used entries are evicted when the encoded cache exceeds its maximum size.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        schema: SectionSchema = DEFAULT_SECTION_SCHEMA,
+        max_size_bytes: int = PARSE_CACHE_MAX_SIZE_MB * 1024**2,
+    ):
+        self.__file_path: str = file_path
+        self.__schema: SectionSchema = schema
+        self.__max_size_bytes: int = max_size_bytes
+        self.__parser_version: str = get_parser_version(schema)
+        # Parsed bodies by the body hash, ordered from the least to the most recently used
+        self.__entries: dict[str, dict[str, Any]] = {}
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Getter of the number of bodies taken from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Getter of the number of parsed bodies."""
+        return self.__misses
+
+    def load(self) -> bool:
+        """
+        Load the cache from the file. A missing, unreadable or outdated cache is ignored.
+
+        @return: True if the cache was loaded, False otherwise.
+        """
+        if not os.path.exists(self.__file_path):
+            logger.debug("Parse cache - no cache found at `%s`.", self.__file_path)
+            return False
+
+        try:
+            with open(self.__file_path, "r", encoding="utf-8") as f:
+                data = json_codec.loads(f.read())
+
+            if data.get("parser_version") != self.__parser_version:
+                logger.info("Parse cache - the body parser has changed, parsing all issue bodies.")
+                return False
+
+            self.__entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Parse cache - could not load cache `%s`: %s.", self.__file_path, str(e))
+            self.__entries = {}
+            return False
+
+        logger.debug("Parse cache - loaded `%i` parsed bodies.", len(self.__entries))
+        return True
+
+    def parse_body(self, body: Optional[str]) -> dict:
+        """
+        Parse the issue body, the parsed body is taken from the cache when the same body was parsed before.
+
+        @param body: Raw markdown string from a GitHub issue body, or None.
+        @return: The parsed body with the section fields as keys.
+        """
+        parsed_body = self.get(body)
+        if parsed_body is None:
+            parsed_body = self.__schema.parse(body)
+            self.put(body, parsed_body)
+        return parsed_body
+
+    def get(self, body: Optional[str]) -> Optional[dict]:
+        """
+        Get the parsed body from the cache, the entry becomes the most recently used one.
+
+        @param body: Raw markdown string from a GitHub issue body, or None.
+        @return: The parsed body, or None if the body is not in the cache. Empty bodies are never cached.
+        """
+        if not body:
+            return None
+
+        key = self.__get_key(body)
+        parsed_body = self.__entries.pop(key, None)
+        if parsed_body is None:
+            self.__misses += 1
+            return None
+
+        # Re-inserted entries become the most recently used ones
+        self.__hits += 1
+        self.__entries[key] = parsed_body
+        return dict(parsed_body)
+
+    def put(self, body: Optional[str], parsed_body: dict) -> None:
+        """
+        Put the parsed body into the cache as the most recently used entry.
+
+        @param body: Raw markdown string from a GitHub issue body, or None.
+        @param parsed_body: The parsed body.
+        @return: None
+        """
+        if body:
+            self.__entries[self.__get_key(body)] = parsed_body
+
+    @staticmethod
+    def __get_key(body: str) -> str:
+        """
+        Get the cache key of the body.
+
+        @param body: Raw markdown string from a GitHub issue body.
+        @return: The hash of the body text.
+        """
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    def save(self) -> None:
+        """
+        Save the cache to the file, only the most recently used entries fitting into the size limit are kept.
+
+        @return: None
+        """
+        # The entries are measured by their encoded size, from the most to the least recently used one
+        kept_keys: list[str] = []
+        size = 0
+        for key in reversed(self.__entries):
+            size += len(json_codec.dumps({key: self.__entries[key]}).encode("utf-8"))
+            if size > self.__max_size_bytes:
+                break
+            kept_keys.append(key)
+
+        entries = {key: self.__entries[key] for key in reversed(kept_keys)}
+        evicted_count = len(self.__entries) - len(entries)
+
+        json_codec.dump_to_file({"parser_version": self.__parser_version, "entries": entries}, self.__file_path)
+
+        self.__entries = entries
+        logger.debug("Parse cache - saved `%i` parsed bodies, `%i` evicted.", len(entries), evicted_count)
@@ -0,0 +1,220 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the IssuesSnapshot class, which persists the consolidated issues between runs
+to allow incremental mining.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from github.Requester import Requester
+
+from doc_issues.model.consolidated_issue import ConsolidatedIssue
+from doc_issues.model.issue_record import IssueRecord
+from utils import json_codec
+from utils.constants import SNAPSHOT_FULL_REFRESH_DAYS, SNAPSHOT_SINCE_OVERLAP_MINUTES, SNAPSHOT_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class IssuesSnapshot:
+    """
+    A class representing the snapshot of the consolidated issues from the last successful run.
+    The snapshot keeps the issue data together with their audit data, so issues not updated since
+    the last run do not need to be fetched nor audited again.
+
+    Note:
+        Deleted and transferred issues are never reported as updated. Every repository is therefore mined
+        fully again once its last full mining is older than SNAPSHOT_FULL_REFRESH_DAYS, which drops them.
+    """
+
+    def __init__(self, file_path: str):
+        self.__file_path: str = file_path
+        self.__last_run_at: Optional[datetime] = None
+        # Start time of the current run, the age of the last full mining is measured against it
+        self.__run_started_at: Optional[datetime] = None
+        # Snapshot entries per repository id, every repository holds its entries by the issue key
+        self.__repositories: dict[str, dict[str, dict[str, Any]]] = {}
+        # Start time of the last run mining all issues of the repository, per repository id
+        self.__fully_mined_at: dict[str, datetime] = {}
+
+    @property
+    def last_run_at(self) -> Optional[datetime]:
+        """Getter of the start time of the last successful run."""
+        return self.__last_run_at
+
+    def load(self, run_started_at: datetime) -> bool:
+        """
+        Load the snapshot from the file. A missing, unreadable or outdated snapshot is ignored,
+        which leads to a full mining of all repositories.
+
+        @param run_started_at: The start time of the current run.
+        @return: True if the snapshot was loaded, False otherwise.
+        """
+        self.__run_started_at = run_started_at
+        if not os.path.exists(self.__file_path):
+            logger.info("Incremental mining - no snapshot found at `%s`, mining all issues.", self.__file_path)
+            return False
+
+        try:
+            with open(self.__file_path, "r", encoding="utf-8") as f:
+                data = json_codec.loads(f.read())
+
+            if data.get("version") != SNAPSHOT_VERSION:
+                logger.warning("Incremental mining - snapshot version is not supported, mining all issues.")
+                return False
+
+            self.__last_run_at = datetime.fromisoformat(data["last_run_at"])
+            self.__repositories = data["repositories"]
+            self.__fully_mined_at = {
+                repository_id: datetime.fromisoformat(fully_mined_at)
+                for repository_id, fully_mined_at in data["fully_mined_at"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Incremental mining - could not load snapshot `%s`: %s.", self.__file_path, str(e))
+            self.__last_run_at = None
+            self.__repositories = {}
+            self.__fully_mined_at = {}
+            return False
+
+        logger.info("Incremental mining - loaded snapshot from the run started at `%s`.", data["last_run_at"])
+        return True
+
+    def get_since(self, repository_id: str) -> Optional[datetime]:
+        """
+        Get the time since which the repository issues have to be fetched.
+
+        @param repository_id: The repository id in the `organization/repository` format.
+        @return: The time with an overlap margin, or None if all repository issues have to be fetched.
+        """
+        if self.__last_run_at is None or self._is_full_mining_due(repository_id):
+            if repository_id in self.__repositories:
+                logger.info("Incremental mining - periodic full mining of `%s`.", repository_id)
+            return None
+
+        return self.__last_run_at - timedelta(minutes=SNAPSHOT_SINCE_OVERLAP_MINUTES)
+
+    def get_repository_issues(self, repository_id: str, requester: Requester) -> list[IssueRecord]:
+        """
+        Restore the repository issues from the snapshot as issue records.
+        Records without a REST URL never trigger an additional API call.
+
+        @param repository_id: The repository id in the `organization/repository` format.
+        @param requester: The requester of the GitHub instance.
+        @return: A list of issue records.
+        """
+        return [
+            IssueRecord(
+                node_id=entry.get("node_id"),
+                number=entry["number"],
+                title=entry["title"],
+                state=entry["state"],
+                body=entry["body"],
+                html_url=entry["html_url"],
+                created_at=entry["created_at"],
+                updated_at=entry["updated_at"],
+                closed_at=entry["closed_at"],
+                labels=entry["labels"],
+                requester=requester,
+            )
+            for entry in self.__repositories.get(repository_id, {}).values()
+        ]
+
+    def get_audit_data(self, repository_id: str, key: str, updated_at: str) -> Optional[dict[str, Any]]:
+        """
+        Get the audit data of the issue from the snapshot.
+
+        @param repository_id: The repository id in the `organization/repository` format.
+        @param key: The unique issue key.
+        @param updated_at: The current update time of the issue.
+        @return: The audit data, or None if the issue is not in the snapshot or was updated since.
+        """
+        entry = self.__repositories.get(repository_id, {}).get(key)
+        if entry is None or entry["updated_at"] != updated_at:
+            return None
+
+        return entry["audit"]
+
+    def save(
+        self, run_started_at: datetime, repository_ids: list[str], consolidated_issues: dict[str, ConsolidatedIssue]
+    ) -> None:
+        """
+        Save the consolidated issues of the finished run as the new snapshot.
+        Repositories the snapshot asked to mine fully in this run are recorded as fully mined at its start.
+
+        @param run_started_at: The start time of the finished run.
+        @param repository_ids: The ids of all mined repositories, including repositories without issues.
+        @param consolidated_issues: A dictionary containing all consolidated issues.
+        @return: None
+        """
+        repositories: dict[str, dict[str, dict[str, Any]]] = {repository_id: {} for repository_id in repository_ids}
+        for key, consolidated_issue in consolidated_issues.items():
+            repositories.setdefault(consolidated_issue.repository_id, {})[key] = {
+                "node_id": consolidated_issue.node_id,
+                "number": consolidated_issue.number,
+                "title": consolidated_issue.title,
+                "state": consolidated_issue.state,
+                "body": consolidated_issue.body,
+                "html_url": consolidated_issue.html_url,
+                "created_at": consolidated_issue.created_at,
+                "updated_at": consolidated_issue.updated_at,
+                "closed_at": consolidated_issue.closed_at,
+                "labels": consolidated_issue.labels,
+                "audit": consolidated_issue.get_audit_data(),
+            }
+
+        # The decision is made on the loaded snapshot, the same way as for the mining of this run
+        fully_mined_at: dict[str, datetime] = {
+            repository_id: (
+                run_started_at if self._is_full_mining_due(repository_id) else self.__fully_mined_at[repository_id]
+            )
+            for repository_id in repositories
+        }
+
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "last_run_at": run_started_at.isoformat(),
+            "fully_mined_at": {repository_id: value.isoformat() for repository_id, value in fully_mined_at.items()},
+            "repositories": repositories,
+        }
+
+        json_codec.dump_to_file(data, self.__file_path)
+
+        self.__last_run_at = run_started_at
+        self.__run_started_at = run_started_at
+        self.__repositories = repositories
+        self.__fully_mined_at = fully_mined_at
+        logger.info(
+            "Incremental mining - saved snapshot of `%i` issues to `%s`.", len(consolidated_issues), self.__file_path
+        )
+
+    def _is_full_mining_due(self, repository_id: str) -> bool:
+        """
+        Check if all repository issues have to be fetched, because the repository is not in the snapshot
+        or its last full mining is older than SNAPSHOT_FULL_REFRESH_DAYS.
+
+        @param repository_id: The repository id in the `organization/repository` format.
+        @return: True if the full mining is due, False otherwise.
+        """
+        fully_mined_at = self.__fully_mined_at.get(repository_id)
+        if repository_id not in self.__repositories or fully_mined_at is None or self.__run_started_at is None:
+            return True
+
+        return self.__run_started_at - fully_mined_at >= timedelta(days=SNAPSHOT_FULL_REFRESH_DAYS)
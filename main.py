@@ -58,8 +58,10 @@ def run() -> None:
         logger.info("Liv-Doc collector for GitHub - Starting the `doc-issues` mode.")
 
         # Generate the Living documentation
-        if GHDocIssuesCollector(output_path).collect():
+        doc_issues_collector = GHDocIssuesCollector(output_path)
+        if doc_issues_collector.collect():
             logger.info("Liv-Doc collector for GitHub - `doc-issues` mode completed successfully.")
+            set_action_output("doc-issues-output-file", doc_issues_collector.output_file_path)
         else:
             logger.info("Liv-Doc collector for GitHub - `doc-issues` mode failed.")
             all_modes_success = False
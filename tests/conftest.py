@@ -75,8 +75,7 @@ def github_project_setup(mocker):
     repository.owner.login = "organizationABC"
     repository.full_name = "organizationABC/repoABC"
 
-    field_option_response = {}
-    project.loads(project_json, repository, field_option_response)
+    project.loads(project_json, repository)
 
     return project
 
@@ -105,6 +104,8 @@ def doc_issues_collector(mocker):
     mock_github_instance.get_rate_limit.return_value = mocker.Mock(core=mock_rate_limit, rate=mock_rate_limit)
     mock_github_instance.get_repo.return_value = mocker.Mock()
 
+    mocker.patch("doc_issues.collector.SharedSessionHTTPSConnection.install")
+    mocker.patch("doc_issues.collector.SharedSessionHTTPSConnection.set_response_hook")
     mocker.patch(
         "doc_issues.collector.ActionInputs.get_github_token",
         return_value="FakeGithubToken",
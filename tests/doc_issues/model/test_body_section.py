@@ -0,0 +1,96 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from doc_issues.model.body_section import BodySection
+
+
+def test_load_from_json_with_valid_input_loads_correctly():
+    # Arrange
+    body_section = BodySection()
+    section_json = {"field": "risks", "heading": "Risks", "level": 3, "kind": "table", "columns": ["id", "risk"]}
+
+    # Act
+    actual = body_section.load_from_json(section_json)
+
+    # Assert
+    assert actual
+    assert "risks" == body_section.field
+    assert "Risks" == body_section.heading
+    assert 3 == body_section.level
+    assert "table" == body_section.kind
+    assert ["id", "risk"] == body_section.columns
+
+
+def test_load_from_json_with_valid_input_check_default_values():
+    # Arrange
+    body_section = BodySection()
+
+    # Act
+    actual = body_section.load_from_json({"field": "postconditions", "heading": "Postconditions"})
+
+    # Assert
+    assert actual
+    assert 2 == body_section.level
+    assert "text" == body_section.kind
+    assert [] == body_section.columns
+
+
+def test_load_from_json_with_missing_key_logs_error(mocker):
+    # Arrange
+    mock_log_error = mocker.patch("doc_issues.model.body_section.logger.error")
+
+    # Act
+    actual = BodySection().load_from_json({"heading": "Postconditions"})
+
+    # Assert
+    assert not actual
+    mock_log_error.assert_called_once_with(
+        "The key is not found in the body section JSON input: %s.", mocker.ANY, exc_info=True
+    )
+
+
+@pytest.mark.parametrize(
+    "section_json",
+    [
+        {"field": "risks", "heading": "Risks", "level": 4},
+        {"field": "risks", "heading": "Risks", "kind": "numbered-list"},
+        {"field": "risks", "heading": "Risks", "kind": "table"},
+    ],
+)
+def test_load_from_json_with_invalid_section(mocker, section_json):
+    # Arrange
+    mock_log_error = mocker.patch("doc_issues.model.body_section.logger.error")
+
+    # Act
+    actual = BodySection().load_from_json(section_json)
+
+    # Assert
+    assert not actual
+    mock_log_error.assert_called_once()
+
+
+def test_repr():
+    # Arrange
+    body_section = BodySection("postconditions", "Postconditions", 2, "bullet-list")
+
+    # Act
+    actual = repr(body_section)
+
+    # Assert
+    assert (
+        "BodySection(field=postconditions, heading=Postconditions, level=2, kind=bullet-list, columns=[])" == actual
+    )
@@ -15,7 +15,11 @@
 #
 from living_doc_utilities.model.project_status import ProjectStatus
 
+from github import Auth, Github
+from github.Issue import Issue
+
 from doc_issues.model.consolidated_issue import ConsolidatedIssue
+from doc_issues.model.issue_record import IssueRecord
 
 
 def test_consolidated_issue_initialization():
@@ -81,31 +85,51 @@ def test_to_issue_for_persist(mocker):
     assert issue.project_statuses == []
 
 
-def test_consolidated_issue_labels_fetches_from_issue_when_internal_empty(mocker):
+def test_consolidated_issue_from_github_issue():
     # Arrange
-    issue = ConsolidatedIssue("test_org/test_repo")
-    mock_label1 = mocker.Mock()
-    mock_label1.name = "bug"
-    mock_label2 = mocker.Mock()
-    mock_label2.name = "enhancement"
-    mock_github_issue = mocker.Mock()
-    mock_github_issue.labels = [mock_label1, mock_label2]
-    # Inject the mock GitHub issue
-    issue._ConsolidatedIssue__issue = mock_github_issue
-    issue._ConsolidatedIssue__issue_labels = []
+    attributes = {
+        "node_id": "I_1",
+        "number": 1,
+        "title": "Issue 1",
+        "state": "open",
+        "body": "Issue body",
+        "html_url": "https://github.com/test_org/test_repo/issues/1",
+        "url": "https://api.github.com/repos/test_org/test_repo/issues/1",
+        "created_at": "2025-01-20T12:00:00Z",
+        "updated_at": "2025-01-21T12:00:00Z",
+        "closed_at": None,
+        "user": {"login": "author"},
+        "comments": 0,
+        "labels": [{"name": "bug"}, {"name": "enhancement"}],
+    }
+    github_issue = Issue(Github(auth=Auth.Token("token123")).requester, {}, attributes, completed=False)
 
     # Act
-    result_1 = issue.labels       # get labels from mock github issue
-    result_2 = issue.labels       # get labels from internal cache
+    issue = ConsolidatedIssue("test_org/test_repo", github_issue)
 
     # Assert
-    assert result_1 == ["bug", "enhancement"]
-    assert result_2 == ["bug", "enhancement"]
+    assert 1 == issue.number
+    assert "I_1" == issue.node_id
+    assert "Issue 1" == issue.title
+    assert "2025-01-20T12:00:00+00:00" == issue.created_at
+    assert "" == issue.closed_at
+    assert ["bug", "enhancement"] == issue.labels
+    assert not hasattr(issue, "_ConsolidatedIssue__issue")
 
 
 # Audit data tests
 
 
+def _consolidated_issue(
+    mocker, github_issue, state: str = "open", node_id=None, timeline_items_fetcher=None
+) -> ConsolidatedIssue:
+    # The REST fallback works on the short-lived GitHub issue created from the issue record
+    mocker.patch.object(IssueRecord, "to_github_issue", return_value=github_issue)
+    return ConsolidatedIssue(
+        "test_org/test_repo", IssueRecord(1, "Issue 1", state, node_id=node_id), timeline_items_fetcher
+    )
+
+
 def test_get_audit_data_with_no_github_issue():
     # Arrange
     issue = ConsolidatedIssue("test_org/test_repo", repository_issue=None)
@@ -129,7 +153,7 @@ def test_get_audit_data_with_creator_and_closer(mocker):
     mock_github_issue.closed_by = mock_closer
     mock_github_issue.comments = 0
 
-    issue = ConsolidatedIssue("test_org/test_repo", repository_issue=mock_github_issue)
+    issue = _consolidated_issue(mocker, mock_github_issue)
 
     # Act
     audit_data = issue.get_audit_data()
@@ -154,9 +178,10 @@ def test_get_audit_data_with_comments(mocker):
     mock_github_issue.user = mock_user
     mock_github_issue.closed_by = None
     mock_github_issue.comments = 1
-    mock_github_issue.get_comments.return_value = [mock_comment]
+    mock_github_issue.requester.per_page = 100
+    mock_github_issue.get_comments.return_value.get_page.return_value = [mock_comment]
 
-    issue = ConsolidatedIssue("test_org/test_repo", repository_issue=mock_github_issue)
+    issue = _consolidated_issue(mocker, mock_github_issue)
 
     # Act
     audit_data = issue.get_audit_data()
@@ -168,6 +193,60 @@ def test_get_audit_data_with_comments(mocker):
     assert audit_data["last_commented_by"] == "commenter"
 
 
+def test_get_audit_data_fetches_only_last_comment_page(mocker):
+    # Arrange
+    mock_first_comment = mocker.Mock()
+    mock_first_comment.created_at = "2025-01-20T11:00:00"
+    mock_first_comment.user.login = "first_commenter"
+    mock_last_comment = mocker.Mock()
+    mock_last_comment.created_at = "2025-01-20T12:00:00"
+    mock_last_comment.user.login = "last_commenter"
+
+    mock_github_issue = mocker.Mock()
+    mock_github_issue.user = None
+    mock_github_issue.closed_by = None
+    mock_github_issue.comments = 502
+    mock_github_issue.requester.per_page = 100
+    mock_comments = mock_github_issue.get_comments.return_value
+    mock_comments.get_page.return_value = [mock_first_comment, mock_last_comment]
+
+    issue = _consolidated_issue(mocker, mock_github_issue)
+
+    # Act
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert audit_data["last_commented_at"] == "2025-01-20T12:00:00"
+    assert audit_data["last_commented_by"] == "last_commenter"
+    mock_comments.get_page.assert_called_once_with(5)
+
+
+def test_get_audit_data_stale_comments_count_empty_last_page(mocker):
+    # Arrange
+    mock_last_comment = mocker.Mock()
+    mock_last_comment.created_at = "2025-01-20T12:00:00"
+    mock_last_comment.user.login = "last_commenter"
+
+    mock_github_issue = mocker.Mock()
+    mock_github_issue.user = None
+    mock_github_issue.closed_by = None
+    # The count still includes comments deleted since it was read, page 1 is empty by now
+    mock_github_issue.comments = 101
+    mock_github_issue.requester.per_page = 100
+    mock_comments = mock_github_issue.get_comments.return_value
+    mock_comments.get_page.side_effect = lambda page: [] if page == 1 else [mock_last_comment]
+
+    issue = _consolidated_issue(mocker, mock_github_issue)
+
+    # Act
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert audit_data["last_commented_at"] == "2025-01-20T12:00:00"
+    assert audit_data["last_commented_by"] == "last_commenter"
+    assert [mocker.call(1), mocker.call(0)] == mock_comments.get_page.call_args_list
+
+
 def test_get_audit_data_graceful_degradation_on_comment_fetch_error(mocker):
     # Arrange
     from github.GithubException import GithubException
@@ -181,7 +260,7 @@ def test_get_audit_data_graceful_degradation_on_comment_fetch_error(mocker):
     mock_github_issue.comments = 1
     mock_github_issue.get_comments.side_effect = GithubException(403, "API error", {})
 
-    issue = ConsolidatedIssue("test_org/test_repo", repository_issue=mock_github_issue)
+    issue = _consolidated_issue(mocker, mock_github_issue)
 
     # Act
     audit_data = issue.get_audit_data()
@@ -192,6 +271,116 @@ def test_get_audit_data_graceful_degradation_on_comment_fetch_error(mocker):
     assert "last_commented_by" not in audit_data
 
 
+def test_set_audit_data_skips_api_calls(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    issue = _consolidated_issue(mocker, mock_github_issue)
+    known_audit_data = {
+        "created_by": "test_creator",
+        "comments_count": 2,
+        "last_commented_at": "2025-01-20T12:00:00+00:00",
+        "last_commented_by": "commenter",
+        "audit_events": [{"action": "closed", "timestamp": "2025-01-21T12:00:00+00:00"}],
+    }
+
+    # Act
+    issue.set_audit_data(known_audit_data)
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert known_audit_data == audit_data
+    assert issue.closed_by is None
+    mock_github_issue.get_comments.assert_not_called()
+    mock_github_issue.get_timeline.assert_not_called()
+
+
+def _audit_issue_node(timeline_items: list[dict]) -> dict:
+    return {
+        "id": "I_1",
+        "author": {"login": "test_creator"},
+        "comments": {
+            "totalCount": 42,
+            "nodes": [{"createdAt": "2025-01-20T12:00:00Z", "author": {"login": "commenter"}}],
+        },
+        "timelineItems": {"nodes": timeline_items},
+    }
+
+
+def test_load_audit_data_closed_issue(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    issue = _consolidated_issue(mocker, mock_github_issue, state="closed")
+    timeline_items = [
+        {
+            "__typename": "LabeledEvent",
+            "createdAt": "2025-01-20T10:00:00Z",
+            "actor": {"login": "labeler"},
+            "label": {"name": "DocumentedFeature"},
+        },
+        {
+            "__typename": "AssignedEvent",
+            "createdAt": "2025-01-20T11:00:00Z",
+            "actor": {"login": "labeler"},
+            "assignee": {"login": "assignee"},
+        },
+        {"__typename": "ClosedEvent", "createdAt": "2025-01-21T10:00:00Z", "actor": {"login": "first_closer"}},
+        {"__typename": "ReopenedEvent", "createdAt": "2025-01-21T11:00:00Z", "actor": None},
+        {
+            "__typename": "MilestonedEvent",
+            "createdAt": "2025-01-21T11:30:00Z",
+            "actor": {"login": "labeler"},
+            "milestoneTitle": "v1.0",
+        },
+        {"__typename": "ClosedEvent", "createdAt": "2025-01-21T12:00:00Z", "actor": {"login": "test_closer"}},
+    ]
+
+    # Act
+    issue.load_audit_data(_audit_issue_node(timeline_items))
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert audit_data["created_by"] == "test_creator"
+    assert audit_data["closed_by"] == "test_closer"
+    assert audit_data["comments_count"] == 42
+    assert audit_data["last_commented_at"] == "2025-01-20T12:00:00+00:00"
+    assert audit_data["last_commented_by"] == "commenter"
+    assert audit_data["audit_events"] == [
+        {
+            "action": "labeled",
+            "timestamp": "2025-01-20T10:00:00+00:00",
+            "actor": "labeler",
+            "label": "DocumentedFeature",
+        },
+        {"action": "assigned", "timestamp": "2025-01-20T11:00:00+00:00", "actor": "labeler", "assignee": "assignee"},
+        {"action": "closed", "timestamp": "2025-01-21T10:00:00+00:00", "actor": "first_closer"},
+        {"action": "reopened", "timestamp": "2025-01-21T11:00:00+00:00"},
+        {"action": "milestoned", "timestamp": "2025-01-21T11:30:00+00:00", "actor": "labeler", "milestone": "v1.0"},
+        {"action": "closed", "timestamp": "2025-01-21T12:00:00+00:00", "actor": "test_closer"},
+    ]
+    mock_github_issue.get_comments.assert_not_called()
+    mock_github_issue.get_timeline.assert_not_called()
+
+
+def test_load_audit_data_reopened_issue_has_no_closer(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    issue = _consolidated_issue(mocker, mock_github_issue)
+    issue_node = _audit_issue_node(
+        [{"__typename": "ClosedEvent", "createdAt": "2025-01-21T10:00:00Z", "actor": {"login": "test_closer"}}]
+    )
+    issue_node["author"] = None
+    issue_node["comments"] = {"totalCount": 0, "nodes": []}
+
+    # Act
+    issue.load_audit_data(issue_node)
+
+    # Assert
+    assert issue.closed_by is None
+    assert issue.created_by is None
+    assert issue.last_commented_at is None
+    assert issue.audit_data_fetched is True
+
+
 def test_parse_timeline_event_labeled(mocker):
     # Arrange
     issue = ConsolidatedIssue("test_org/test_repo")
@@ -291,7 +480,7 @@ def test_fetch_audit_events_timeline_unavailable(mocker):
     mock_github_issue = mocker.Mock()
     mock_github_issue.get_timeline.side_effect = GithubException(403, "Timeline not available", {})
 
-    issue = ConsolidatedIssue("test_org/test_repo", repository_issue=mock_github_issue)
+    issue = _consolidated_issue(mocker, mock_github_issue)
 
     # Act
     events = issue._fetch_audit_events()  # pylint: disable=protected-access
@@ -299,3 +488,121 @@ def test_fetch_audit_events_timeline_unavailable(mocker):
     # Assert - should return empty list gracefully
     assert events == []
 
+
+
+def test_fetch_audit_events_filtered_timeline(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    mock_get_timeline_items = mocker.Mock(
+        return_value=[
+            {"__typename": "ClosedEvent", "createdAt": "2025-01-21T12:00:00Z", "actor": {"login": "test_closer"}},
+            {"__typename": "UnknownEvent", "createdAt": "2025-01-21T12:00:00Z"},
+        ],
+    )
+
+    issue = _consolidated_issue(mocker, mock_github_issue, node_id="I_1", timeline_items_fetcher=mock_get_timeline_items)
+
+    # Act
+    events = issue._fetch_audit_events()  # pylint: disable=protected-access
+
+    # Assert
+    assert events == [{"action": "closed", "timestamp": "2025-01-21T12:00:00+00:00", "actor": "test_closer"}]
+    mock_get_timeline_items.assert_called_once_with("I_1")
+    mock_github_issue.get_timeline.assert_not_called()
+
+
+def test_fetch_audit_events_filtered_timeline_unavailable(mocker):
+    # Arrange
+    from github.GithubException import GithubException
+
+    mock_github_issue = mocker.Mock()
+    mock_get_timeline_items = mocker.Mock(side_effect=GithubException(403, "Timeline not available", {}))
+
+    issue = _consolidated_issue(mocker, mock_github_issue, node_id="I_1", timeline_items_fetcher=mock_get_timeline_items)
+
+    # Act
+    events = issue._fetch_audit_events()  # pylint: disable=protected-access
+
+    # Assert - should return empty list gracefully
+    assert events == []
+
+
+def test_fetch_audit_events_without_timeline_items_fetcher(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    mock_github_issue.get_timeline.return_value = []
+
+    issue = _consolidated_issue(mocker, mock_github_issue, node_id="I_1")
+
+    # Act
+    events = issue._fetch_audit_events()  # pylint: disable=protected-access
+
+    # Assert - the REST timeline is used if no fetcher is injected
+    assert events == []
+    mock_github_issue.get_timeline.assert_called_once()
+
+
+# issue record
+
+
+def test_consolidated_issue_from_issue_record():
+    # Arrange
+    record = IssueRecord(
+        node_id="I_1",
+        number=1,
+        title="Issue 1",
+        state="closed",
+        body="Issue body",
+        html_url="https://github.com/test_org/test_repo/issues/1",
+        created_at="2025-01-20T12:00:00+00:00",
+        updated_at="2025-01-21T12:00:00+00:00",
+        closed_at="2025-01-21T12:00:00+00:00",
+        labels=["DocumentedFeature"],
+    )
+
+    # Act
+    issue = ConsolidatedIssue("test_org/test_repo", record)
+
+    # Assert
+    assert 1 == issue.number
+    assert "I_1" == issue.node_id
+    assert "Issue 1" == issue.title
+    assert "closed" == issue.state
+    assert "Issue body" == issue.body
+    assert "https://github.com/test_org/test_repo/issues/1" == issue.html_url
+    assert "2025-01-20T12:00:00+00:00" == issue.created_at
+    assert "2025-01-21T12:00:00+00:00" == issue.updated_at
+    assert "2025-01-21T12:00:00+00:00" == issue.closed_at
+    assert ["DocumentedFeature"] == issue.labels
+
+
+def test_get_audit_data_from_issue_record_uses_short_lived_github_issue(mocker):
+    # Arrange
+    mock_github_issue = mocker.Mock()
+    mock_github_issue.user.login = "test_creator"
+    mock_github_issue.closed_by = None
+    mock_github_issue.comments = 0
+    mock_github_issue.get_timeline.return_value = []
+    record = IssueRecord(1, "Issue 1", "open")
+    mock_to_github_issue = mocker.patch.object(IssueRecord, "to_github_issue", return_value=mock_github_issue)
+    issue = ConsolidatedIssue("test_org/test_repo", record)
+
+    # Act
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert {"created_by": "test_creator"} == audit_data
+    assert mock_to_github_issue.call_count == 2
+    mock_github_issue.get_timeline.assert_called_once()
+
+
+def test_get_audit_data_from_issue_record_without_requester():
+    # Arrange
+    issue = ConsolidatedIssue("test_org/test_repo", IssueRecord(1, "Issue 1", "open", created_by="test_creator"))
+
+    # Act
+    audit_data = issue.get_audit_data()
+
+    # Assert
+    assert {} == audit_data
+    assert issue.audit_data_fetched is False
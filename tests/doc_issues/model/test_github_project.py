@@ -23,26 +23,18 @@ from doc_issues.model.github_project import GitHubProject
 
 def test_loads_with_valid_input_loads_correctly(mocker):
     github_project = GitHubProject()
-    project_json = {"id": "123", "number": 1, "title": "Test Project"}
-    expected_field_options = {"field": ["option1", "option2"]}
+    project_json = {"id": "123", "number": 1, "title": "Test Project", "items": {"totalCount": 42}}
     repository = mocker.Mock(spec=Repository)
     repository.owner.login = "organizationABC"
     repository.full_name = "organizationABC/repoABC"
-    field_option_response = {
-        "repository": {
-            "projectV2": {
-                "fields": {"nodes": [{"name": "field", "options": [{"name": "option1"}, {"name": "option2"}]}]}
-            }
-        }
-    }
 
-    actual = github_project.loads(project_json, repository, field_option_response)
+    actual = github_project.loads(project_json, repository)
 
     assert project_json["id"] == actual.id
     assert project_json["number"] == actual.number
     assert project_json["title"] == actual.title
     assert repository.owner.login == actual.organization_name
-    assert expected_field_options == actual.field_options
+    assert 42 == actual.items_total_count
 
 
 def test_loads_with_missing_key(mocker):
@@ -52,39 +44,14 @@ def test_loads_with_missing_key(mocker):
     repository = mocker.Mock(spec=Repository)
     repository.owner.login = "organizationABC"
     repository.full_name = "organizationABC/repoABC"
-    field_option_response = {
-        "repository": {
-            "projectV2": {
-                "fields": {"nodes": [{"name": "field1", "options": [{"name": "option1"}, {"name": "option2"}]}]}
-            }
-        }
-    }
 
-    github_project.loads(project_json, repository, field_option_response)
+    github_project.loads(project_json, repository)
 
     mock_log_error.assert_called_once_with(
         "Missing key in the project json for repository `%s`: %s", "organizationABC/repoABC", "'number'", exc_info=True
     )
 
 
-# _update_field_options
-
-
-def test_update_field_options_with_no_expected_response_structure(mocker):
-    github_project = GitHubProject()
-    mock_log_error = mocker.patch("doc_issues.model.github_project.logger.error")
-    field_option_response = {"unexpected_structure": {"unexpected_key": "unexpected_value"}}
-
-    github_project._update_field_options(field_option_response)
-
-    assert {} == github_project.field_options
-    mock_log_error.assert_called_once_with(
-        "There is no expected response structure for field options fetched from project: %s",
-        github_project.title,
-        exc_info=True,
-    )
-
-
 # __repr__
 
 
@@ -94,14 +61,7 @@ def test_repr(mocker):
     repository = mocker.Mock(spec=Repository)
     repository.owner.login = "organizationABC"
     repository.full_name = "organizationABC/repoABC"
-    field_option_response = {
-        "repository": {
-            "projectV2": {
-                "fields": {"nodes": [{"name": "field", "options": [{"name": "option1"}, {"name": "option2"}]}]}
-            }
-        }
-    }
-
-    actual = github_project.loads(project_json, repository, field_option_response)
+
+    actual = github_project.loads(project_json, repository)
 
     assert repr(actual) == f"GitHubProject(id={project_json['id']}, number={project_json['number']}, title={project_json['title']}, organization_name={repository.owner.login})"
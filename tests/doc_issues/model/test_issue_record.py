@@ -0,0 +1,128 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+from github import Auth, Github
+from github.Issue import Issue
+
+from doc_issues.model.issue_record import IssueRecord
+
+
+def _github_issue(requester, closed: bool = False) -> Issue:
+    attributes = {
+        "node_id": "I_1",
+        "number": 1,
+        "title": "Issue 1",
+        "state": "closed" if closed else "open",
+        "body": "Issue body",
+        "html_url": "https://github.com/test_org/test_repo/issues/1",
+        "url": "https://api.github.com/repos/test_org/test_repo/issues/1",
+        "created_at": "2025-01-20T12:00:00Z",
+        "updated_at": "2025-01-21T12:00:00Z",
+        "closed_at": "2025-01-21T12:00:00Z" if closed else None,
+        "user": {"login": "author"},
+        "comments": 3,
+        "labels": [{"name": "DocumentedFeature"}, {"name": "bug"}],
+    }
+    return Issue(requester, {}, attributes, completed=False)
+
+
+# from_github_issue
+
+
+def test_from_github_issue():
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+
+    # Act
+    record = IssueRecord.from_github_issue(_github_issue(requester, closed=True))
+
+    # Assert
+    assert "I_1" == record.node_id
+    assert 1 == record.number
+    assert "Issue 1" == record.title
+    assert "closed" == record.state
+    assert "Issue body" == record.body
+    assert "https://github.com/test_org/test_repo/issues/1" == record.html_url
+    assert "2025-01-20T12:00:00+00:00" == record.created_at
+    assert "2025-01-21T12:00:00+00:00" == record.updated_at
+    assert "2025-01-21T12:00:00+00:00" == record.closed_at
+    assert ["DocumentedFeature", "bug"] == record.labels
+    assert "author" == record.created_by
+    assert 3 == record.comments_count
+    assert "https://api.github.com/repos/test_org/test_repo/issues/1" == record.url
+    assert requester is record.requester
+
+
+def test_from_github_issue_not_closed():
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+
+    # Act
+    record = IssueRecord.from_github_issue(_github_issue(requester))
+
+    # Assert
+    assert "" == record.closed_at
+
+
+def test_issue_record_has_no_instance_dict():
+    # Arrange
+    record = IssueRecord(1, "Issue 1", "open")
+
+    # Act, Assert
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.raw_data = {}
+
+
+# to_github_issue
+
+
+def test_to_github_issue():
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+    record = IssueRecord.from_github_issue(_github_issue(requester))
+
+    # Act
+    actual = record.to_github_issue()
+
+    # Assert
+    assert 1 == actual.number
+    assert "I_1" == actual.node_id
+    assert "author" == actual.user.login
+    assert 3 == actual.comments
+    assert requester is actual.requester
+
+
+def test_to_github_issue_without_url_is_completed():
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+    record = IssueRecord(1, "Issue 1", "closed", requester=requester)
+
+    # Act
+    actual = record.to_github_issue()
+
+    # Assert
+    assert actual.user is None
+    # A completed issue returns unknown fields without requesting the REST API
+    assert actual.closed_by is None
+
+
+def test_to_github_issue_without_requester():
+    # Arrange
+    record = IssueRecord(1, "Issue 1", "open")
+
+    # Act, Assert
+    assert record.to_github_issue() is None
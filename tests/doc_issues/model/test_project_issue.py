@@ -24,22 +24,12 @@ def test_loads_with_valid_input(github_project_setup):
     project_issue = ProjectIssue()
     issue_json = {
         "content": {"number": 1, "repository": {"owner": {"login": "organizationABC"}, "name": "repoABC"}},
-        "fieldValues": {
-            "nodes": [
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Status1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Priority1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Size1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "MoSCoW1"},
-            ]
-        },
+        "status": {"name": "Status1"},
+        "priority": {"name": "Priority1"},
+        "size": {"name": "Size1"},
+        "moscow": {"name": "MoSCoW1"},
     }
     project = github_project_setup()
-    project.field_options = {
-        "Status": ["Status1", "Status2"],
-        "Priority": ["Priority1", "Priority2"],
-        "Size": ["Size1", "Size2"],
-        "MoSCoW": ["MoSCoW1", "MoSCoW2"],
-    }
 
     actual = project_issue.loads(issue_json, project)
 
@@ -54,6 +44,23 @@ def test_loads_with_valid_input(github_project_setup):
     assert "MoSCoW1" == actual.project_status.moscow
 
 
+def test_loads_with_missing_field_values(github_project_setup):
+    project_issue = ProjectIssue()
+    # Fields missing in the project are received as null, fields of another type as an empty object
+    issue_json = {
+        "content": {"number": 1, "repository": {"owner": {"login": "organizationABC"}, "name": "repoABC"}},
+        "status": {"name": "Status1"},
+        "priority": None,
+        "size": {},
+    }
+
+    actual = project_issue.loads(issue_json, github_project_setup())
+
+    assert "Status1" == actual.project_status.status
+    assert actual.project_status.priority == ProjectIssue().project_status.priority
+    assert actual.project_status.size == ProjectIssue().project_status.size
+
+
 def test_loads_without_content_key_logs_debug(mocker):
     project_issue = ProjectIssue()
     mock_log = mocker.patch("doc_issues.model.project_issue.logger")
@@ -90,22 +97,12 @@ def test_repr(github_project_setup):
     project_issue = ProjectIssue()
     issue_json = {
         "content": {"number": 1, "repository": {"owner": {"login": "organizationABC"}, "name": "repoABC"}},
-        "fieldValues": {
-            "nodes": [
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Status1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Priority1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "Size1"},
-                {"__typename": "ProjectV2ItemFieldSingleSelectValue", "name": "MoSCoW1"},
-            ]
-        },
+        "status": {"name": "Status1"},
+        "priority": {"name": "Priority1"},
+        "size": {"name": "Size1"},
+        "moscow": {"name": "MoSCoW1"},
     }
     project = github_project_setup()
-    project.field_options = {
-        "Status": ["Status1", "Status2"],
-        "Priority": ["Priority1", "Priority2"],
-        "Size": ["Size1", "Size2"],
-        "MoSCoW": ["MoSCoW1", "MoSCoW2"],
-    }
 
     project_issue.loads(issue_json, project)
     expected_repr = (
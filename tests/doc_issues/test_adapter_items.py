@@ -0,0 +1,85 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import pickle
+
+from doc_issues.adapter_items import build_adapter_item, encode_adapter_items, get_item_issue_data
+from doc_issues.body_parser import DEFAULT_BODY_SECTIONS, DEFAULT_SECTION_SCHEMA, SectionSchema, parse_body
+from doc_issues.model.body_section import BodySection
+from utils.json_codec import EncodedJSON
+
+ISSUE_DATA = {
+    "title": "Issue 1",
+    "state": "open",
+    "labels": ["DocumentedFeature"],
+    "html_url": "https://github.com/test_org/test_repo/issues/1",
+    "created_at": "2025-01-20",
+    "updated_at": "2025-01-21",
+    "body": "## Description\n\nSome description.\n",
+}
+
+
+def test_get_item_issue_data():
+    # Arrange
+    issue_dict = {**ISSUE_DATA, "issue_number": 1, "audit_events": []}
+
+    # Act
+    actual = get_item_issue_data(issue_dict)
+
+    # Assert
+    assert ISSUE_DATA == actual
+
+
+def test_build_adapter_item():
+    # Act
+    actual = build_adapter_item("test_org/test_repo#1", ISSUE_DATA, parse_body(ISSUE_DATA["body"]))
+
+    # Assert
+    assert "test_org/test_repo#1" == actual["id"]
+    assert ["DocumentedFeature"] == actual["tags"]
+    assert {"created": "2025-01-20", "updated": "2025-01-21"} == actual["timestamps"]
+    assert "Some description." == actual["description"]
+    assert ["id", "title", "state", "tags", "url", "timestamps"] + DEFAULT_SECTION_SCHEMA.fields == list(actual)
+
+
+def test_encode_adapter_items():
+    # Arrange
+    known_parsed_body = {**parse_body(None), "description": "Known"}
+    chunk = [("test_org/test_repo#1", ISSUE_DATA, None), ("test_org/test_repo#2", ISSUE_DATA, known_parsed_body)]
+
+    # Act
+    actual = encode_adapter_items(chunk, DEFAULT_SECTION_SCHEMA, 4)
+
+    # Assert
+    assert 2 == len(actual)
+    assert isinstance(actual[0][0], EncodedJSON)
+    expected_item = build_adapter_item("test_org/test_repo#1", ISSUE_DATA, parse_body(ISSUE_DATA["body"]))
+    assert json.dumps(expected_item, indent=4, ensure_ascii=False) == actual[0][0]
+    assert parse_body(ISSUE_DATA["body"]) == actual[0][1]
+    assert "Known" == json.loads(actual[1][0])["description"]
+    assert actual[1][1] is None
+
+
+def test_section_schema_is_picklable():
+    # Arrange
+    schema = SectionSchema(DEFAULT_BODY_SECTIONS + [BodySection("risks", "Risks", 2, "table", ["id", "risk"])])
+
+    # Act
+    actual = pickle.loads(pickle.dumps(schema))
+
+    # Assert
+    assert schema.version == actual.version
+    assert schema.parse(ISSUE_DATA["body"]) == actual.parse(ISSUE_DATA["body"])
@@ -19,6 +19,8 @@
 import pytest
 
 from doc_issues.body_parser import (
+    DEFAULT_BODY_SECTIONS,
+    SectionSchema,
     _extract_section,
     _extract_subsection,
     _parse_ac_table,
@@ -26,6 +28,7 @@ from doc_issues.body_parser import (
     _remove_subsections,
     parse_body,
 )
+from doc_issues.model.body_section import BodySection
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -102,6 +105,17 @@ def test_extract_section_stops_at_next_section():
     assert "As a user" in result
 
 
+def test_extract_section_keeps_subsections():
+    result = _extract_section(FULL_BODY, "Connections")
+    assert result == "### Related User stories\n- #2"
+
+
+def test_extract_section_uses_first_heading_of_title():
+    body = "## Preconditions\n- First.\n## Other\n## Preconditions\n- Second.\n"
+    result = _extract_section(body, "Preconditions")
+    assert result == "- First."
+
+
 # ---------------------------------------------------------------------------
 # _extract_subsection
 # ---------------------------------------------------------------------------
@@ -308,3 +322,58 @@ def test_parse_body_change_log_not_included_in_any_field():
     # Change Log table rows must not bleed into acceptance_criteria
     ac_ids = [ac["id"] for ac in result["acceptance_criteria"]]
     assert "v1" not in ac_ids
+
+
+def test_parse_body_many_headings():
+    body = "".join(f"## Section {i}\n### Sub {i}\n- item {i}\n" for i in range(500)) + BODY_MULTIPLE_BV
+    result = parse_body(body)
+    assert result["description"] == "As a user, I want to search among all domains."
+    assert result["business_value"] == ["Saves time for users managing numerous domains.", "Improves navigation and clarity."]
+    assert result["preconditions"] == ["User logged in."]
+
+
+# ---------------------------------------------------------------------------
+# SectionSchema
+# ---------------------------------------------------------------------------
+
+EXTRA_SECTIONS = [
+    BodySection("postconditions", "Postconditions", 2, "bullet-list"),
+    BodySection("non_functional_requirements", "Non-functional requirements", 3, "text"),
+    BodySection("risks", "Risks", 2, "table", ["id", "risk", "mitigation"]),
+]
+
+BODY_WITH_EXTRA_SECTIONS = (
+    BODY_MULTIPLE_BV
+    + "\n## Postconditions\n\n- Domain is selected.\n\n"
+    "## Risks\n\n"
+    "| ID | Risk | Mitigation |\n"
+    "|----|------|------------|\n"
+    "| `R-1` | Slow search | Index domains |\n\n"
+    "### Non-functional requirements\n\n"
+    "Search responds within a second.\n"
+)
+
+
+def test_section_schema_parses_extra_sections():
+    schema = SectionSchema(DEFAULT_BODY_SECTIONS + EXTRA_SECTIONS)
+    result = schema.parse(BODY_WITH_EXTRA_SECTIONS)
+    assert result["postconditions"] == ["Domain is selected."]
+    assert result["risks"] == [{"id": "R-1", "risk": "Slow search", "mitigation": "Index domains"}]
+    assert result["non_functional_requirements"] == "Search responds within a second."
+    assert result["preconditions"] == ["User logged in."]
+
+
+def test_section_schema_keeps_field_order_and_missing_sections():
+    schema = SectionSchema(DEFAULT_BODY_SECTIONS + EXTRA_SECTIONS)
+    result = schema.parse(FULL_BODY)
+    assert list(result) == schema.fields
+    assert result["postconditions"] is None
+    assert result["risks"] is None
+
+
+def test_section_schema_default_matches_parse_body():
+    assert SectionSchema(DEFAULT_BODY_SECTIONS).parse(FULL_BODY) == parse_body(FULL_BODY)
+
+
+def test_section_schema_version_changes_with_sections():
+    assert SectionSchema(DEFAULT_BODY_SECTIONS).version != SectionSchema(DEFAULT_BODY_SECTIONS + EXTRA_SECTIONS).version
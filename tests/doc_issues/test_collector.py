@@ -11,35 +11,140 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from dataclasses import dataclass
+import json
+import threading
 from datetime import datetime, timezone
 from os import fspath
 
+import pytest
+import requests
+from github import Auth, Github
+from github.GithubException import GithubException
+from github.Issue import Issue as GitHubIssue
+from github.Requester import Requester
 from living_doc_utilities.model.issue import Issue
 from living_doc_utilities.model.issues import Issues
 
 from doc_issues.collector import GHDocIssuesCollector
 from doc_issues.model.consolidated_issue import ConsolidatedIssue
+from doc_issues.model.issue_record import IssueRecord
 from doc_issues.model.project_issue import ProjectIssue
+from utils.github_connection import SharedSessionHTTPSConnection
 
-from utils.constants import DOC_USER_STORY_LABEL, DOC_FEATURE_LABEL, DOC_FUNCTIONALITY_LABEL
+from utils.constants import DOC_USER_STORY_LABEL, DOC_FEATURE_LABEL, DOC_FUNCTIONALITY_LABEL, SUPPORTED_ISSUE_LABELS
 
 
-@dataclass
-class FakeGitHubIssue:
-    def __init__(self, number: int, title: str):
-        self.number = number
-        self.title = title
-        self.state = "open"
-        self.created_at = datetime(2023, 1, 1, tzinfo=timezone.utc)
-        self.updated_at = datetime(2023, 1, 2, tzinfo=timezone.utc)
-        self.closed_at = None
-        self.html_url = "https://github.com/test/repo/issues/1"
-        self.body = "Issue body"
-        self.labels = []
-        self.user = None
-        self.closed_by = None
-        self.comments = 0
+def _issue_record(number: int, title: str) -> IssueRecord:
+    return IssueRecord(
+        number,
+        title,
+        "open",
+        created_at="2023-01-01T00:00:00+00:00",
+        updated_at="2023-01-02T00:00:00+00:00",
+        html_url="https://github.com/test/repo/issues/1",
+        body="Issue body",
+    )
+
+
+def _github_issue(number: int, labels: list[str], title: str = "Issue") -> GitHubIssue:
+    attributes = {
+        "node_id": f"I_{number}",
+        "number": number,
+        "title": title,
+        "state": "open",
+        "body": "Issue body",
+        "html_url": f"https://github.com/test_org/test_repo/issues/{number}",
+        "url": f"https://api.github.com/repos/test_org/test_repo/issues/{number}",
+        "created_at": "2025-01-20T12:00:00Z",
+        "updated_at": "2025-01-21T12:00:00Z",
+        "closed_at": None,
+        "user": {"login": "author"},
+        "comments": 0,
+        "labels": [{"name": label} for label in labels],
+    }
+    return GitHubIssue(Github(auth=Auth.Token("token123")).requester, {}, attributes, completed=False)
+
+
+# __init__
+
+
+@pytest.fixture
+def restore_connection_classes():
+    yield
+    SharedSessionHTTPSConnection.set_response_hook(None)
+    Requester.resetConnectionClasses()
+
+
+def test_init_github_instance_uses_shared_session_connection(mocker, restore_connection_classes):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.get_github_token", return_value="FakeGithubToken")
+
+    # Act
+    collector = GHDocIssuesCollector("./output")
+
+    # Assert
+    requester = collector._GHDocIssuesCollector__github_instance.requester
+    assert SharedSessionHTTPSConnection is requester._Requester__connectionClass
+    rate_limiter = collector._GHDocIssuesCollector__rate_limiter
+    connection = requester._Requester__createConnection()
+    assert isinstance(connection, SharedSessionHTTPSConnection)
+    assert rate_limiter.observe in connection.session.hooks["response"]
+
+
+# _get_http_cache_identity
+
+
+def test_get_http_cache_identity_of_user(doc_issues_collector):
+    # Arrange
+    github_instance = doc_issues_collector._GHDocIssuesCollector__github_instance
+    github_instance.get_user.return_value.login = "test_user"
+
+    # Act
+    actual = doc_issues_collector._get_http_cache_identity()
+
+    # Assert
+    assert "user:test_user" == actual
+
+
+def test_get_http_cache_identity_of_installation_token(mocker, monkeypatch, doc_issues_collector):
+    # Arrange
+    github_instance = doc_issues_collector._GHDocIssuesCollector__github_instance
+    type(github_instance.get_user.return_value).login = mocker.PropertyMock(
+        side_effect=GithubException(403, {"message": "Resource not accessible by integration"}, {})
+    )
+    monkeypatch.setenv("GITHUB_REPOSITORY", "test_org/test_repo")
+
+    # Act
+    actual = doc_issues_collector._get_http_cache_identity()
+
+    # Assert
+    assert "installation:test_org/test_repo" == actual
+
+
+def test_get_http_cache_identity_unknown(mocker, monkeypatch, doc_issues_collector):
+    # Arrange
+    github_instance = doc_issues_collector._GHDocIssuesCollector__github_instance
+    type(github_instance.get_user.return_value).login = mocker.PropertyMock(side_effect=GithubException(401, {}, {}))
+    monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+
+    # Act
+    actual = doc_issues_collector._get_http_cache_identity()
+
+    # Assert
+    assert actual is None
+
+
+def test_get_http_cache_identity_network_error(mocker, monkeypatch, doc_issues_collector):
+    # Arrange
+    github_instance = doc_issues_collector._GHDocIssuesCollector__github_instance
+    github_instance.get_user.side_effect = requests.ConnectionError("Connection refused")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "test_org/test_repo")
+
+    # Act
+    actual = doc_issues_collector._get_http_cache_identity()
+
+    # Assert
+    assert "installation:test_org/test_repo" == actual
 
 
 # collect
@@ -83,7 +188,7 @@ def test_collect_correct_behaviour(mocker, doc_issues_collector):
     mock_fetch_github_issues.assert_called_once()
     mock_fetch_github_project_issues.assert_called_once()
     mock_consolidate_issues_data.assert_called_once_with(
-        {"test_org/test_repo": [mock_issue]}, {"test_org/test_repo#1": [project_issue_mock]}
+        {"test_org/test_repo": [mock_issue]}, {"test_org/test_repo#1": [project_issue_mock]}, mocker.ANY
     )
     # mock_generate_markdown_pages.assert_called_once_with({"test_org/test_repo#1": consolidated_issue_mock})
     mock_logger_debug.assert_called_once_with("'doc-issues' mode output directory cleaned.")
@@ -95,6 +200,8 @@ def test_collect_correct_behaviour(mocker, doc_issues_collector):
             mocker.call("Fetching GitHub project data - finished."),
             mocker.call("Issue and project data consolidation - started."),
             mocker.call("Issue and project data consolidation - finished."),
+            mocker.call("Audit data enrichment - started."),
+            mocker.call("Audit data enrichment - finished."),
             mocker.call("Exporting consolidated issues - started."),
             mocker.call("Exporting consolidated issues - finished."),
         ],
@@ -119,6 +226,78 @@ def test_collect_returns_false_when_store_fails(mocker, doc_issues_collector):
     doc_issues_collector._consolidate_issues_data.assert_called_once()
 
 
+def test_collect_passes_safe_timeline_items_fetcher(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch.object(doc_issues_collector, "_clean_output_directory")
+    mocker.patch.object(doc_issues_collector, "_fetch_github_issues", return_value={})
+    mocker.patch.object(doc_issues_collector, "_fetch_github_project_issues", return_value={})
+    mocker.patch.object(doc_issues_collector, "_store_consolidated_issues", return_value=True)
+    mock_consolidate_issues_data = mocker.patch.object(doc_issues_collector, "_consolidate_issues_data", return_value={})
+    mock_get_timeline_items = mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_issue_timeline_items",
+        side_effect=GithubException(502, "Bad Gateway", {}),
+    )
+    mock_get_timeline_items.__name__ = "get_issue_timeline_items"
+
+    # Act
+    doc_issues_collector.collect()
+    timeline_items_fetcher = mock_consolidate_issues_data.call_args.args[2]
+
+    # Assert - the failure of the lazy audit data fetching does not propagate
+    assert timeline_items_fetcher("I_1") is None
+    mock_get_timeline_items.assert_called_once_with("I_1")
+
+
+def test_collect_incremental_saves_snapshot_after_success(mocker, doc_issues_collector):
+    # Arrange
+    mock_snapshot = mocker.Mock()
+    mocker.patch.object(doc_issues_collector, "_GHDocIssuesCollector__snapshot", mock_snapshot)
+    mocker.patch.object(doc_issues_collector, "_clean_output_directory")
+    mocker.patch.object(doc_issues_collector, "_fetch_github_issues", return_value={"test_org/test_repo": []})
+    mocker.patch.object(doc_issues_collector, "_fetch_github_project_issues", return_value={})
+    consolidated_issue = mocker.Mock()
+    consolidated_issue.repository_id = "test_org/test_repo"
+    consolidated_issue.updated_at = "2025-01-21T12:00:00+00:00"
+    mocker.patch.object(
+        doc_issues_collector, "_consolidate_issues_data", return_value={"test_org/test_repo/1": consolidated_issue}
+    )
+    mocker.patch.object(doc_issues_collector, "_store_consolidated_issues", return_value=True)
+    mock_snapshot.get_audit_data.return_value = {"created_by": "author"}
+
+    # Act
+    result = doc_issues_collector.collect()
+
+    # Assert
+    assert result is True
+    mock_snapshot.load.assert_called_once_with(mocker.ANY)
+    mock_snapshot.get_audit_data.assert_called_once_with(
+        "test_org/test_repo", "test_org/test_repo/1", "2025-01-21T12:00:00+00:00"
+    )
+    consolidated_issue.set_audit_data.assert_called_once_with({"created_by": "author"})
+    mock_snapshot.save.assert_called_once_with(
+        mocker.ANY, ["test_org/test_repo"], {"test_org/test_repo/1": consolidated_issue}
+    )
+
+
+def test_collect_incremental_keeps_snapshot_after_failure(mocker, doc_issues_collector):
+    # Arrange
+    mock_snapshot = mocker.Mock()
+    mocker.patch.object(doc_issues_collector, "_GHDocIssuesCollector__snapshot", mock_snapshot)
+    mocker.patch.object(doc_issues_collector, "_clean_output_directory")
+    mocker.patch.object(doc_issues_collector, "_fetch_github_issues", return_value={})
+    mocker.patch.object(doc_issues_collector, "_fetch_github_project_issues", return_value={})
+    mocker.patch.object(doc_issues_collector, "_consolidate_issues_data", return_value={})
+    mocker.patch.object(doc_issues_collector, "_store_consolidated_issues", return_value=False)
+
+    # Act
+    result = doc_issues_collector.collect()
+
+    # Assert
+    assert result is False
+    mock_snapshot.save.assert_not_called()
+
+
 # _clean_output_directory
 
 
@@ -150,14 +329,112 @@ def test_fetch_github_issues_success(mocker, config_repository, repository_setup
         "get_repo",
         return_value=repository_setup,
     )
+    mock_get_repository_issues = mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_repository_issues",
+        return_value=[],
+    )
 
     # Act
     actual = doc_issues_collector._fetch_github_issues()
 
     # Assert
     assert {'test_org/test_repo': []} == actual
+    mock_get_repository_issues.assert_called_once_with(repository=repository_setup, labels=SUPPORTED_ISSUE_LABELS)
 
 
+def test_fetch_github_issues_issues_none(mocker, config_repository, repository_setup, doc_issues_collector):
+    # Arrange
+    mocker.patch(
+        "doc_issues.collector.ActionInputs.get_repositories",
+        return_value=[config_repository],
+    )
+    doc_issues_collector._GHDocIssuesCollector__github_instance.get_repo.return_value = repository_setup
+    mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_repository_issues",
+        return_value=None,
+    )
+
+    # Act
+    actual = doc_issues_collector._fetch_github_issues()
+
+    # Assert
+    assert {} == actual
+
+
+
+def test_fetch_github_issues_concurrent_keeps_config_order(mocker, config_repository, doc_issues_collector):
+    # Arrange
+    second_config_repository = mocker.Mock()
+    second_config_repository.organization_name = "test_org"
+    second_config_repository.repository_name = "other_repo"
+    mocker.patch(
+        "doc_issues.collector.ActionInputs.get_repositories",
+        return_value=[config_repository, second_config_repository],
+    )
+    mocker.patch.object(doc_issues_collector, "_GHDocIssuesCollector__concurrency", 2)
+    mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_instance,
+        "get_repo",
+        side_effect=lambda repository_id: mocker.Mock(full_name=repository_id),
+    )
+    mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_repository_issues",
+        side_effect=lambda repository, labels: [_github_issue(1, labels, title=repository.full_name)],
+    )
+
+    # Act
+    actual = doc_issues_collector._fetch_github_issues()
+
+    # Assert
+    assert ["test_org/test_repo", "test_org/other_repo"] == list(actual.keys())
+    assert ["test_org/test_repo"] == [issue.title for issue in actual["test_org/test_repo"]]
+    assert ["test_org/other_repo"] == [issue.title for issue in actual["test_org/other_repo"]]
+
+
+def test_fetch_github_issues_incremental_merges_snapshot(mocker, config_repository, repository_setup, doc_issues_collector):
+    # Arrange
+    unchanged_issue = IssueRecord(1, "Issue 1", "open", labels=[DOC_FEATURE_LABEL])
+    outdated_issue = IssueRecord(2, "Issue 2", "open", labels=[DOC_FEATURE_LABEL])
+    unlabeled_outdated_issue = IssueRecord(3, "Issue 3", "open", labels=[DOC_FEATURE_LABEL])
+    updated_issue = _github_issue(2, [DOC_FEATURE_LABEL], title="Updated issue 2")
+    unlabeled_issue = _github_issue(3, ["bug"])
+    new_issue = _github_issue(4, [DOC_USER_STORY_LABEL])
+
+    since = datetime(2025, 1, 21, tzinfo=timezone.utc)
+    mock_snapshot = mocker.Mock()
+    mock_snapshot.get_since.return_value = since
+    mock_snapshot.get_repository_issues.return_value = [unchanged_issue, outdated_issue, unlabeled_outdated_issue]
+    mocker.patch.object(doc_issues_collector, "_GHDocIssuesCollector__snapshot", mock_snapshot)
+    mocker.patch(
+        "doc_issues.collector.ActionInputs.get_repositories",
+        return_value=[config_repository],
+    )
+    doc_issues_collector._GHDocIssuesCollector__github_instance.get_repo.return_value = repository_setup
+    mock_get_repository_issues = mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance, "get_repository_issues"
+    )
+    mock_get_updated_issues = mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_repository_issues_updated_since",
+        return_value=[updated_issue, unlabeled_issue, new_issue],
+    )
+
+    # Act
+    actual = doc_issues_collector._fetch_github_issues()
+
+    # Assert
+    assert ["test_org/test_repo"] == list(actual.keys())
+    assert unchanged_issue is actual["test_org/test_repo"][0]
+    assert [1, 2, 4] == [issue.number for issue in actual["test_org/test_repo"]]
+    assert "Updated issue 2" == actual["test_org/test_repo"][1].title
+    assert [DOC_USER_STORY_LABEL] == actual["test_org/test_repo"][2].labels
+    mock_snapshot.get_since.assert_called_once_with("test_org/test_repo")
+    mock_get_updated_issues.assert_called_once_with(repository=repository_setup, since=since)
+    mock_get_repository_issues.assert_not_called()
+
 
 def test_fetch_github_issues_repository_none(mocker, doc_issues_collector, config_repository):
     # Arrange
@@ -216,9 +493,9 @@ def test_fetch_github_project_issues_correct_behaviour(mocker, doc_issues_collec
         repo_b,
     ]
 
-    project_a = mocker.Mock(title="Project A")
-    project_b = mocker.Mock(title="Project B")
-    mock_github_projects_instance.get_repository_projects.side_effect = [[project_a], [project_b]]
+    project_a = mocker.Mock(id="PVT_A", title="Project A")
+    project_b = mocker.Mock(id="PVT_B", title="Project B")
+    mock_github_projects_instance.iter_repository_projects.side_effect = [iter([project_a]), iter([project_b])]
 
     project_status_1 = mocker.Mock()
     project_status_1.status = "In Progress"
@@ -258,12 +535,12 @@ def test_fetch_github_project_issues_correct_behaviour(mocker, doc_issues_collec
 
     doc_issues_collector._GHDocIssuesCollector__github_instance.get_repo.assert_any_call("OrgA/RepoA")
     doc_issues_collector._GHDocIssuesCollector__github_instance.get_repo.assert_any_call("OrgA/RepoB")
-    mock_github_projects_instance.get_repository_projects.assert_any_call(repository=repo_a, projects_title_filter="")
-    mock_github_projects_instance.get_repository_projects.assert_any_call(
+    mock_github_projects_instance.iter_repository_projects.assert_any_call(repository=repo_a, projects_title_filter="")
+    mock_github_projects_instance.iter_repository_projects.assert_any_call(
         repository=repo_b, projects_title_filter="ProjectB"
     )
-    mock_github_projects_instance.get_project_issues.assert_any_call(project=project_a)
-    mock_github_projects_instance.get_project_issues.assert_any_call(project=project_b)
+    mock_github_projects_instance.get_project_issues.assert_any_call(project=project_a, wanted_issue_keys=None)
+    mock_github_projects_instance.get_project_issues.assert_any_call(project=project_b, wanted_issue_keys=None)
     mock_logger_info.assert_has_calls(
         [
             mocker.call("Fetching GitHub project data - for repository `%s` found `%i` project/s.", "OrgA/RepoA", 1),
@@ -287,6 +564,117 @@ def test_fetch_github_project_issues_correct_behaviour(mocker, doc_issues_collec
     )
 
 
+def test_fetch_github_project_issues_overlaps_discovery_with_fetching(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.is_project_state_mining_enabled", return_value=True)
+    mocker.patch("doc_issues.collector.ActionInputs.get_repositories", return_value=["OrgA/RepoA", "OrgA/RepoB"])
+    project_a = mocker.Mock(id="PVT_A", title="Project A")
+    fetch_started = threading.Event()
+    fetch_started_during_discovery: list[bool] = []
+
+    def discover_repository_projects(config_repository, register_project):
+        if config_repository == "OrgA/RepoA":
+            register_project(project_a)
+            return [project_a.id]
+        # The items of the first project are fetched, while the next repository is still being discovered
+        fetch_started_during_discovery.append(fetch_started.wait(timeout=5))
+        return []
+
+    def fetch_project_issues(_project, _wanted_issue_keys):
+        fetch_started.set()
+        return []
+
+    mocker.patch.object(doc_issues_collector, "_discover_repository_projects", side_effect=discover_repository_projects)
+    mocker.patch.object(doc_issues_collector, "_fetch_project_issues", side_effect=fetch_project_issues)
+
+    # Act
+    actual = doc_issues_collector._fetch_github_project_issues()
+
+    # Assert
+    assert {} == actual
+    assert [True] == fetch_started_during_discovery
+
+
+def test_fetch_github_project_issues_fetches_shared_project_once(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.is_project_state_mining_enabled", return_value=True)
+    repository_1 = mocker.Mock(organization_name="OrgA", repository_name="RepoA", projects_title_filter=[])
+    repository_2 = mocker.Mock(organization_name="OrgA", repository_name="RepoB", projects_title_filter=[])
+    mocker.patch("doc_issues.collector.ActionInputs.get_repositories", return_value=[repository_1, repository_2])
+    mock_github_projects_instance = mocker.patch.object(
+        doc_issues_collector, "_GHDocIssuesCollector__github_projects_instance"
+    )
+
+    # The same board is returned for both repositories as a separate object
+    shared_project_1 = mocker.Mock(id="PVT_SHARED", title="Roadmap")
+    shared_project_2 = mocker.Mock(id="PVT_SHARED", title="Roadmap")
+    mock_github_projects_instance.iter_repository_projects.side_effect = [
+        iter([shared_project_1]),
+        iter([shared_project_2]),
+    ]
+
+    project_issue_a = mocker.Mock(spec=ProjectIssue, organization_name="OrgA", repository_name="RepoA", number=1)
+    project_issue_b = mocker.Mock(spec=ProjectIssue, organization_name="OrgA", repository_name="RepoB", number=2)
+    mock_github_projects_instance.get_project_issues.return_value = [project_issue_a, project_issue_b]
+
+    # Act
+    actual = doc_issues_collector._fetch_github_project_issues()
+
+    # Assert
+    mock_github_projects_instance.get_project_issues.assert_called_once_with(project=shared_project_1, wanted_issue_keys=None)
+    assert {"OrgA/RepoA/1": [project_issue_a], "OrgA/RepoB/2": [project_issue_b]} == actual
+
+
+def test_fetch_github_project_issues_reads_huge_board_from_issue_side(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.is_project_state_mining_enabled", return_value=True)
+    repository_1 = mocker.Mock(organization_name="OrgA", repository_name="RepoA", projects_title_filter=[])
+    mocker.patch("doc_issues.collector.ActionInputs.get_repositories", return_value=[repository_1])
+    mock_github_projects_instance = mocker.patch.object(
+        doc_issues_collector, "_GHDocIssuesCollector__github_projects_instance"
+    )
+    huge_project = mocker.Mock(id="PVT_HUGE", title="Roadmap", items_total_count=6000)
+    small_project = mocker.Mock(id="PVT_SMALL", title="Team", items_total_count=50)
+    mock_github_projects_instance.iter_repository_projects.return_value = iter([huge_project, small_project])
+
+    project_issue_huge = mocker.Mock(spec=ProjectIssue, organization_name="OrgA", repository_name="RepoA", number=1)
+    project_issue_small = mocker.Mock(spec=ProjectIssue, organization_name="OrgA", repository_name="RepoA", number=1)
+    mock_github_projects_instance.get_issues_project_items.return_value = {"PVT_HUGE": [project_issue_huge]}
+    mock_github_projects_instance.get_project_issues.return_value = [project_issue_small]
+
+    # Act
+    actual = doc_issues_collector._fetch_github_project_issues({"OrgA/RepoA/1": "I_1", "OrgA/RepoA/2": "I_2"})
+
+    # Assert
+    mock_github_projects_instance.get_issues_project_items.assert_called_once_with(
+        ["I_1", "I_2"], {"PVT_HUGE": huge_project}
+    )
+    mock_github_projects_instance.get_project_issues.assert_called_once_with(
+        project=small_project, wanted_issue_keys={"OrgA/RepoA/1", "OrgA/RepoA/2"}
+    )
+    assert {"OrgA/RepoA/1": [project_issue_huge, project_issue_small]} == actual
+
+
+def test_fetch_github_project_issues_board_side_without_node_ids(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.is_project_state_mining_enabled", return_value=True)
+    repository_1 = mocker.Mock(organization_name="OrgA", repository_name="RepoA", projects_title_filter=[])
+    mocker.patch("doc_issues.collector.ActionInputs.get_repositories", return_value=[repository_1])
+    mock_github_projects_instance = mocker.patch.object(
+        doc_issues_collector, "_GHDocIssuesCollector__github_projects_instance"
+    )
+    huge_project = mocker.Mock(id="PVT_HUGE", title="Roadmap", items_total_count=6000)
+    mock_github_projects_instance.iter_repository_projects.return_value = iter([huge_project])
+    mock_github_projects_instance.get_project_issues.return_value = []
+
+    # Act
+    doc_issues_collector._fetch_github_project_issues({"OrgA/RepoA/1": None})
+
+    # Assert
+    mock_github_projects_instance.get_issues_project_items.assert_not_called()
+    mock_github_projects_instance.get_project_issues.assert_called_once()
+
+
 def test_fetch_github_project_issues_project_mining_disabled(mocker, doc_issues_collector):
     # Arrange
     mock_get_project_mining_enabled = mocker.patch(
@@ -342,10 +730,10 @@ def test_fetch_github_project_issues_with_no_projects(mocker, doc_issues_collect
         return_value=[config_repository],
     )
     mock_logger_info = mocker.patch("doc_issues.collector.logger.info")
-    mock_get_repository_projects = mocker.patch.object(
+    mock_iter_repository_projects = mocker.patch.object(
         doc_issues_collector._GHDocIssuesCollector__github_projects_instance,
-        "get_repository_projects",
-        return_value=[],
+        "iter_repository_projects",
+        return_value=iter([]),
     )
 
     # Act
@@ -354,7 +742,7 @@ def test_fetch_github_project_issues_with_no_projects(mocker, doc_issues_collect
     # Assert
     assert {} == actual
     mock_get_repo.assert_called_once_with("test_org/test_repo")
-    mock_get_repository_projects.assert_called_once_with(repository=repo_a, projects_title_filter=[])
+    mock_iter_repository_projects.assert_called_once_with(repository=repo_a, projects_title_filter=[])
     mock_logger_info.assert_called_once_with(
         "Fetching GitHub project data - no project data found for repository `%s`.", "test_org/test_repo"
     )
@@ -365,24 +753,9 @@ def test_fetch_github_project_issues_with_no_projects(mocker, doc_issues_collect
 
 def test__consolidate_issues_data_sets_type_and_updates_project(mocker):
     # --- Arrange ---
-    # Mock a GitHub issue
-    github_issue_us = mocker.Mock()
-    github_issue_us.number = 42
-    label_mock_us = mocker.Mock()
-    label_mock_us.name = DOC_USER_STORY_LABEL
-    github_issue_us.labels = [label_mock_us]
-
-    github_issue_feat = mocker.Mock()
-    github_issue_feat.number = 43
-    label_mock_feat = mocker.Mock()
-    label_mock_feat.name = DOC_FEATURE_LABEL
-    github_issue_feat.labels = [label_mock_feat]
-
-    github_issue_func = mocker.Mock()
-    github_issue_func.number = 44
-    label_mock_func = mocker.Mock()
-    label_mock_func.name = DOC_FUNCTIONALITY_LABEL
-    github_issue_func.labels = [label_mock_func]
+    github_issue_us = IssueRecord(42, "User story", "open", labels=[DOC_USER_STORY_LABEL])
+    github_issue_feat = IssueRecord(43, "Feature", "open", labels=[DOC_FEATURE_LABEL])
+    github_issue_func = IssueRecord(44, "Functionality", "open", labels=[DOC_FUNCTIONALITY_LABEL])
 
     repository_issues = {
         "TestOrg/TestRepo": [github_issue_us, github_issue_feat, github_issue_func]
@@ -423,14 +796,82 @@ def test__consolidate_issues_data_sets_type_and_updates_project(mocker):
         "Issue and project data consolidation - consolidated `%i` repository issues with extra project data.", 3
     )
 
+def test__consolidate_issues_data_multiple_living_doc_labels(mocker):
+    # Arrange
+    github_issue = IssueRecord(42, "User story", "open", labels=[DOC_USER_STORY_LABEL, "bug", DOC_FEATURE_LABEL])
+    mock_logger_error = mocker.patch("doc_issues.collector.logger.error")
+
+    # Act
+    result = GHDocIssuesCollector._consolidate_issues_data({"TestOrg/TestRepo": [github_issue]}, {})
+
+    # Assert
+    consolidated_issue = result["TestOrg/TestRepo/42"]
+    assert consolidated_issue.issue_type == "UserStoryIssue"
+    assert "multiple_labels" in consolidated_issue.errors
+    mock_logger_error.assert_called_once_with(
+        "Issue with key `%s` has multiple Living-Doc labels `%s`.",
+        "TestOrg/TestRepo/42",
+        [DOC_USER_STORY_LABEL, DOC_FEATURE_LABEL],
+    )
+
+# _enrich_audit_data
+
+
+def test_enrich_audit_data_in_batches(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.AUDIT_BATCH_SIZE", 2)
+    consolidated_issues = {}
+    for number in range(1, 4):
+        consolidated_issue = mocker.Mock()
+        consolidated_issue.audit_data_fetched = False
+        consolidated_issue.node_id = f"I_{number}"
+        consolidated_issues[f"test_org/test_repo/{number}"] = consolidated_issue
+    restored_issue = mocker.Mock()
+    restored_issue.audit_data_fetched = True
+    consolidated_issues["test_org/test_repo/4"] = restored_issue
+    mock_get_issues_audit_data = mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_issues_audit_data",
+        side_effect=lambda node_ids: {node_id: {"id": node_id} for node_id in node_ids if node_id != "I_3"},
+    )
+
+    # Act
+    doc_issues_collector._enrich_audit_data(consolidated_issues)
+
+    # Assert
+    assert [mocker.call(["I_1", "I_2"]), mocker.call(["I_3"])] == mock_get_issues_audit_data.call_args_list
+    consolidated_issues["test_org/test_repo/1"].load_audit_data.assert_called_once_with({"id": "I_1"})
+    consolidated_issues["test_org/test_repo/2"].load_audit_data.assert_called_once_with({"id": "I_2"})
+    consolidated_issues["test_org/test_repo/3"].load_audit_data.assert_not_called()
+    restored_issue.load_audit_data.assert_not_called()
+
+
+def test_enrich_audit_data_failed_batch(mocker, doc_issues_collector):
+    # Arrange
+    consolidated_issue = mocker.Mock()
+    consolidated_issue.audit_data_fetched = False
+    consolidated_issue.node_id = "I_1"
+    mocker.patch.object(
+        doc_issues_collector._GHDocIssuesCollector__github_issues_instance,
+        "get_issues_audit_data",
+        side_effect=lambda node_ids: None,
+    )
+
+    # Act
+    doc_issues_collector._enrich_audit_data({"test_org/test_repo/1": consolidated_issue})
+
+    # Assert
+    consolidated_issue.load_audit_data.assert_not_called()
+
+
 # _store_consolidated_issues
 
 
 def test_store_consolidated_issues_correct_behaviour(mocker, doc_issues_collector):
     # Arrange
     # Create real ConsolidatedIssue instances with the fake GitHub issue
-    issue1 = ConsolidatedIssue("test_org/test_repo", FakeGitHubIssue(1, "Issue 1"))
-    issue2 = ConsolidatedIssue("test_org/test_repo", FakeGitHubIssue(2, "Issue 2"))
+    issue1 = ConsolidatedIssue("test_org/test_repo", _issue_record(1, "Issue 1"))
+    issue2 = ConsolidatedIssue("test_org/test_repo", _issue_record(2, "Issue 2"))
 
     issue1.issue_type = "UserStoryIssue"
     issue2.issue_type = "UserStoryIssue"
@@ -454,9 +895,31 @@ def test_store_consolidated_issues_correct_behaviour(mocker, doc_issues_collecto
     mock_logger_error.assert_not_called()
 
 
+def test_store_consolidated_issues_json_lines(mocker, doc_issues_collector):
+    # Arrange
+    issue1 = ConsolidatedIssue("test_org/test_repo", _issue_record(1, "Issue 1"))
+    issue1.issue_type = "UserStoryIssue"
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_format", return_value="jsonl")
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_compression", return_value="gzip")
+    collector = GHDocIssuesCollector("./output")
+    mock_save = mocker.patch.object(collector, "_save_issues_with_audit_data")
+    mock_save_json_lines = mocker.patch.object(collector, "_save_issues_as_json_lines")
+
+    # Act
+    actual = collector._store_consolidated_issues({"test_org/test_repo#1": issue1})
+
+    # Assert
+    assert actual
+    mock_save.assert_not_called()
+    mock_save_json_lines.assert_called_once()
+    assert mock_save_json_lines.call_args[0][0].endswith("doc-issues.jsonl.gz")
+    assert mock_save_json_lines.call_args[0][0] == collector.output_file_path
+    assert mock_save_json_lines.call_args[0][1].endswith("doc-issues.metadata.json")
+
+
 def test_store_consolidated_issues_not_valid(mocker, doc_issues_collector):
     # Arrange
-    issue1 = ConsolidatedIssue("test_org/test_repo", FakeGitHubIssue(1, "Issue 1"))
+    issue1 = ConsolidatedIssue("test_org/test_repo", _issue_record(1, "Issue 1"))
     issue1.issue_type = "UserStoryIssue"
     mocker.patch.object(Issue, "is_valid_issue", return_value=False)
 
@@ -501,15 +964,17 @@ def test_save_issues_with_audit_data(mocker, doc_issues_collector, tmp_path):
     mock_github_issue.closed_by = None
     mock_github_issue.comments = 0
 
-    consolidated_issue = ConsolidatedIssue("test_org/test_repo", repository_issue=mock_github_issue)
-    consolidated_issue._ConsolidatedIssue__issue.number = 1
-    consolidated_issue._ConsolidatedIssue__issue.title = "Test Issue"
-    consolidated_issue._ConsolidatedIssue__issue.state = "open"
-    consolidated_issue._ConsolidatedIssue__issue.created_at = "2025-01-20"
-    consolidated_issue._ConsolidatedIssue__issue.updated_at = "2025-01-21"
-    consolidated_issue._ConsolidatedIssue__issue.closed_at = None
-    consolidated_issue._ConsolidatedIssue__issue.html_url = "https://github.com/test/issue/1"
-    consolidated_issue._ConsolidatedIssue__issue.body = "Issue body"
+    mocker.patch.object(IssueRecord, "to_github_issue", return_value=mock_github_issue)
+    record = IssueRecord(
+        1,
+        "Test Issue",
+        "open",
+        created_at="2025-01-20",
+        updated_at="2025-01-21",
+        html_url="https://github.com/test/issue/1",
+        body="Issue body",
+    )
+    consolidated_issue = ConsolidatedIssue("test_org/test_repo", repository_issue=record)
 
     # Create an Issue object using IssueFactory
     from living_doc_utilities.factory.issue_factory import IssueFactory
@@ -568,6 +1033,181 @@ def test_save_issues_with_audit_data(mocker, doc_issues_collector, tmp_path):
     assert "timestamps" in item
 
 
+    # Streamed file is byte-identical to the whole document dumped at once
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert json.dumps(data, indent=4, ensure_ascii=False) == f.read()
+
+
+@pytest.mark.parametrize("compact, indent", [(False, 4), (True, None)])
+def test_save_issues_with_audit_data_gzip(mocker, doc_issues_collector, tmp_path, compact, indent):
+    # Arrange
+    import gzip
+    import json
+    from living_doc_utilities.factory.issue_factory import IssueFactory
+    from living_doc_utilities.model.issues import Issues
+
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_compression", return_value="gzip")
+    mocker.patch("doc_issues.collector.ActionInputs.is_output_compact", return_value=compact)
+    collector = GHDocIssuesCollector("./output")
+    issues = Issues()
+    issue_obj = IssueFactory.get(
+        "FeatureIssue", {"repository_id": "test_org/test_repo", "title": "Issue 1", "issue_number": 1}
+    )
+    issues.add_issue("test_org/test_repo#1", issue_obj)
+    file_path = tmp_path / "doc-issues.json.gz"
+
+    # Act
+    collector._save_issues_with_audit_data(str(file_path), issues, {})
+
+    # Assert
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        content = f.read()
+    data = json.loads(content)
+    assert "test_org/test_repo#1" == data["items"][0]["id"]
+    separators = (",", ":") if compact else None
+    assert json.dumps(data, indent=indent, separators=separators, ensure_ascii=False) == content
+
+
+def test_iter_adapter_items_uses_parse_cache(mocker, doc_issues_collector):
+    # Arrange
+    from living_doc_utilities.factory.issue_factory import IssueFactory
+    from living_doc_utilities.model.issues import Issues
+
+    mock_parse_cache = mocker.Mock()
+    mock_parse_cache.parse_body.return_value = {
+        "description": "Cached",
+        "business_value": None,
+        "preconditions": None,
+        "acceptance_criteria": None,
+    }
+    mocker.patch.object(doc_issues_collector, "_GHDocIssuesCollector__parse_cache", mock_parse_cache)
+    issues = Issues()
+    issue_obj = IssueFactory.get(
+        "FeatureIssue", {"repository_id": "test_org/test_repo", "title": "Issue 1", "issue_number": 1}
+    )
+    issues.add_issue("test_org/test_repo#1", issue_obj)
+
+    # Act
+    actual = list(doc_issues_collector._iter_adapter_items(issues, {}))
+
+    # Assert
+    assert "Cached" == actual[0]["description"]
+    mock_parse_cache.parse_body.assert_called_once()
+
+
+def test_iter_adapter_items_with_extra_body_sections(mocker, doc_issues_collector):
+    # Arrange
+    from living_doc_utilities.factory.issue_factory import IssueFactory
+    from living_doc_utilities.model.issues import Issues
+    from doc_issues.model.body_section import BodySection
+
+    mocker.patch(
+        "doc_issues.collector.ActionInputs.get_body_sections",
+        return_value=[BodySection("postconditions", "Postconditions", 2, "bullet-list")],
+    )
+    collector = GHDocIssuesCollector("./output")
+    issues = Issues()
+    issue_obj = IssueFactory.get(
+        "FeatureIssue", {"repository_id": "test_org/test_repo", "title": "Issue 1", "issue_number": 1}
+    )
+    issue_obj.body = "## Description\nText\n## Postconditions\n- Done.\n"
+    issues.add_issue("test_org/test_repo#1", issue_obj)
+
+    # Act
+    actual = list(collector._iter_adapter_items(issues, {}))
+
+    # Assert
+    assert "Text" == actual[0]["description"]
+    assert ["Done."] == actual[0]["postconditions"]
+    assert "postconditions" == list(actual[0])[-1]
+
+
+def _issues_with_bodies(count: int) -> Issues:
+    from living_doc_utilities.factory.issue_factory import IssueFactory
+
+    issues = Issues()
+    for number in range(1, count + 1):
+        issue_obj = IssueFactory.get(
+            "FeatureIssue", {"repository_id": "test_org/test_repo", "title": f"Issue {number}", "issue_number": number}
+        )
+        issue_obj.body = f"## Description\nŽluťoučký kůň {number}\n### Business Value\n- Value {number}\n"
+        issues.add_issue(f"test_org/test_repo#{number}", issue_obj)
+    return issues
+
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_save_issues_output_workers_match_sequential_output(mocker, doc_issues_collector, tmp_path, output_format):
+    # Arrange
+    mocker.patch("doc_issues.collector.OUTPUT_WORKERS_CHUNK_SIZE", 3)
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_format", return_value=output_format)
+    mocker.patch.object(GHDocIssuesCollector, "_get_file_metadata", return_value={"producer": "test"})
+    issues = _issues_with_bodies(10)
+    sequential_collector = GHDocIssuesCollector("./output")
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_workers", return_value=2)
+    parallel_collector = GHDocIssuesCollector("./output")
+    save_method = "_save_issues_with_audit_data" if output_format == "json" else "_save_issues_as_json_lines"
+    extra_args = [] if output_format == "json" else [str(tmp_path / "sidecar.json")]
+
+    # Act
+    getattr(sequential_collector, save_method)(str(tmp_path / "sequential"), *extra_args, issues, {})
+    getattr(parallel_collector, save_method)(str(tmp_path / "parallel"), *extra_args, issues, {})
+
+    # Assert
+    expected = (tmp_path / "sequential").read_text(encoding="utf-8")
+    assert "test_org/test_repo#10" in expected
+    assert expected == (tmp_path / "parallel").read_text(encoding="utf-8")
+
+
+def test_iter_encoded_adapter_items_uses_parse_cache(mocker, doc_issues_collector):
+    # Arrange
+    mocker.patch("doc_issues.collector.ActionInputs.get_output_workers", return_value=2)
+    collector = GHDocIssuesCollector("./output")
+    mock_parse_cache = mocker.Mock()
+    mock_parse_cache.get.side_effect = lambda body: {"description": "Cached"} if "1\n" in body else None
+    mocker.patch.object(collector, "_GHDocIssuesCollector__parse_cache", mock_parse_cache)
+
+    # Act
+    actual = [json.loads(item) for item in collector._iter_encoded_adapter_items(_issues_with_bodies(2), {}, None)]
+
+    # Assert
+    assert ["Cached", "Žluťoučký kůň 2"] == [item["description"] for item in actual]
+    mock_parse_cache.put.assert_called_once()
+    assert "Žluťoučký kůň 2" == mock_parse_cache.put.call_args[0][1]["description"]
+
+
+def test_save_issues_as_json_lines(doc_issues_collector, tmp_path):
+    # Arrange
+    from living_doc_utilities.factory.issue_factory import IssueFactory
+    from living_doc_utilities.model.issues import Issues
+
+    issues = Issues()
+    for number in (1, 2):
+        issue_obj = IssueFactory.get(
+            "FeatureIssue",
+            {"repository_id": "test_org/test_repo", "title": f"Issue {number}", "issue_number": number},
+        )
+        issues.add_issue(f"test_org/test_repo#{number}", issue_obj)
+
+    file_path = tmp_path / "doc-issues.jsonl"
+    sidecar_file_path = tmp_path / "doc-issues.metadata.json"
+
+    # Act
+    doc_issues_collector._save_issues_as_json_lines(str(file_path), str(sidecar_file_path), issues, {})
+
+    # Assert
+    import json
+    with open(file_path, "r", encoding="utf-8") as f:
+        items = [json.loads(line) for line in f]
+    assert ["test_org/test_repo#1", "test_org/test_repo#2"] == [item["id"] for item in items]
+    assert items == list(doc_issues_collector._iter_adapter_items(issues, {}))
+
+    with open(sidecar_file_path, "r", encoding="utf-8") as f:
+        sidecar = json.load(f)
+    assert ["metadata", "warnings"] == list(sidecar)
+    assert "AbsaOSS/living-doc-collector-gh" == sidecar["metadata"]["producer"]["name"]
+    assert [] == sidecar["warnings"]
+
+
 def test_get_file_metadata(doc_issues_collector, monkeypatch):
     # Arrange
     monkeypatch.setenv("GITHUB_WORKFLOW", "Test Workflow")
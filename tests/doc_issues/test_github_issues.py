@@ -0,0 +1,287 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from datetime import datetime, timezone
+
+import pytest
+from github import Auth, Github
+from github.GithubException import GithubException
+
+from doc_issues.github_issues import GitHubIssues
+
+
+def _issue_node(number: int, labels: list[str], author: str | None = "author") -> dict:
+    return {
+        "id": f"I_{number}",
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "OPEN",
+        "body": "Issue body",
+        "url": f"https://github.com/test_owner/test_repo/issues/{number}",
+        "createdAt": "2025-01-20T12:00:00Z",
+        "updatedAt": "2025-01-21T12:00:00Z",
+        "closedAt": None,
+        "author": {"login": author} if author else None,
+        "comments": {"totalCount": 3},
+        "labels": {"nodes": [{"name": label} for label in labels]},
+    }
+
+
+def _response(nodes: list[dict], has_next_page: bool, end_cursor: str) -> tuple[dict, dict]:
+    return {}, {
+        "data": {
+            "repository": {
+                "issues": {
+                    "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
+                    "nodes": nodes,
+                }
+            }
+        }
+    }
+
+
+# get_repository_issues
+
+
+def test_get_repository_issues_correct_behaviour(mocker, repository_setup):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    mock_graphql_query = mocker.patch.object(github.requester, "graphql_query")
+    mock_graphql_query.side_effect = [
+        _response([_issue_node(1, ["DocumentedFeature"]), _issue_node(2, ["DocumentedUserStory", "bug"])], True, "c1"),
+        _response([_issue_node(3, ["DocumentedFunctionality"], author=None)], False, "c2"),
+    ]
+    repository_setup.url = "https://api.github.com/repos/test_owner/test_repo"
+    mock_get_query = mocker.patch(
+        "doc_issues.github_issues.get_issues_from_repo_query", side_effect=["query_page_1", "query_page_2"]
+    )
+
+    # Act
+    actual = GitHubIssues(github).get_repository_issues(repository_setup, ["DocumentedFeature", "DocumentedUserStory"])
+
+    # Assert
+    assert [1, 2, 3] == [issue.number for issue in actual]
+    assert ["DocumentedUserStory", "bug"] == [label.name for label in actual[1].labels]
+    assert "open" == actual[0].state
+    assert "author" == actual[0].user.login
+    assert actual[2].user is None
+    assert datetime(2025, 1, 20, 12, tzinfo=timezone.utc) == actual[0].created_at
+    assert 3 == actual[0].comments
+    assert "I_1" == actual[0].node_id
+    assert "https://api.github.com/repos/test_owner/test_repo/issues/1" == actual[0].url
+    mock_get_query.assert_any_call(
+        organization_name="test_owner",
+        repository_name="test_repo",
+        labels=["DocumentedFeature", "DocumentedUserStory"],
+        after_argument="",
+    )
+    mock_get_query.assert_any_call(
+        organization_name="test_owner",
+        repository_name="test_repo",
+        labels=["DocumentedFeature", "DocumentedUserStory"],
+        after_argument='after: "c1"',
+    )
+    assert 2 == mock_graphql_query.call_count
+
+
+def test_get_repository_issues_no_issues(mocker, repository_setup):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    mocker.patch.object(github.requester, "graphql_query", return_value=_response([], False, None))
+
+    # Act
+    actual = GitHubIssues(github).get_repository_issues(repository_setup, ["DocumentedFeature"])
+
+    # Assert
+    assert [] == actual
+
+
+# get_repository_issues_updated_since
+
+
+def test_get_repository_issues_updated_since_correct_behaviour(mocker, repository_setup):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    mocker.patch.object(
+        github.requester,
+        "graphql_query",
+        return_value=_response([_issue_node(1, ["DocumentedFeature"]), _issue_node(2, ["bug"])], False, "c1"),
+    )
+    mock_get_query = mocker.patch(
+        "doc_issues.github_issues.get_issues_updated_since_from_repo_query", return_value="query_page_1"
+    )
+
+    # Act
+    actual = GitHubIssues(github).get_repository_issues_updated_since(
+        repository_setup, datetime(2025, 1, 20, 12, 30, tzinfo=timezone.utc)
+    )
+
+    # Assert
+    assert [1, 2] == [issue.number for issue in actual]
+    mock_get_query.assert_called_once_with(
+        organization_name="test_owner",
+        repository_name="test_repo",
+        since="2025-01-20T12:30:00Z",
+        after_argument="",
+    )
+
+
+# get_issues_audit_data
+
+
+def _timeline_items(nodes: list[dict], has_next_page: bool, end_cursor: str | None) -> dict:
+    return {"pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor}, "nodes": nodes}
+
+
+def test_get_issues_audit_data_correct_behaviour(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    issue_node = {"id": "I_1", "author": {"login": "author"}, "timelineItems": _timeline_items([], False, None)}
+    mock_request = mocker.patch.object(
+        github.requester, "requestJsonAndCheck", return_value=({}, {"data": {"nodes": [issue_node, None]}})
+    )
+    mock_get_query = mocker.patch("doc_issues.github_issues.get_issues_audit_query", return_value="audit_query")
+
+    # Act
+    actual = GitHubIssues(github).get_issues_audit_data(["I_1", "I_2"])
+
+    # Assert
+    assert {"I_1": issue_node} == actual
+    mock_get_query.assert_called_once_with(["I_1", "I_2"])
+    mock_request.assert_called_once_with(
+        "POST", github.requester.graphql_url, input={"query": "audit_query", "variables": {}}
+    )
+
+
+def test_get_issues_audit_data_node_error_keeps_batch(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    issue_node = {"id": "I_1", "author": {"login": "author"}, "timelineItems": _timeline_items([], False, None)}
+    mocker.patch.object(
+        github.requester,
+        "requestJsonAndCheck",
+        return_value=(
+            {},
+            {
+                "data": {"nodes": [issue_node, None]},
+                "errors": [{"path": ["nodes", 1], "message": "Could not resolve to a node with the global id."}],
+            },
+        ),
+    )
+    mocker.patch("doc_issues.github_issues.get_issues_audit_query", return_value="audit_query")
+
+    # Act
+    actual = GitHubIssues(github).get_issues_audit_data(["I_1", "I_2"])
+
+    # Assert
+    assert {"I_1": issue_node} == actual
+
+
+def test_get_issues_audit_data_without_data_raises(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    mocker.patch.object(
+        github.requester, "requestJsonAndCheck", return_value=({}, {"errors": [{"message": "Parse error."}]})
+    )
+    mocker.patch("doc_issues.github_issues.get_issues_audit_query", return_value="audit_query")
+
+    # Act, Assert
+    with pytest.raises(GithubException):
+        GitHubIssues(github).get_issues_audit_data(["I_1"])
+
+
+def test_get_issues_audit_data_paginates_long_timeline(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    first_item = {"__typename": "LabeledEvent"}
+    second_item = {"__typename": "ClosedEvent"}
+    third_item = {"__typename": "ReopenedEvent"}
+    mocker.patch.object(
+        github.requester,
+        "requestJsonAndCheck",
+        side_effect=[
+            ({}, {"data": {"nodes": [{"id": "I_1", "timelineItems": _timeline_items([first_item], True, "c1")}]}}),
+            ({}, {"data": {"node": {"timelineItems": _timeline_items([second_item], True, "c2")}}}),
+            ({}, {"data": {"node": {"timelineItems": _timeline_items([third_item], False, "c3")}}}),
+        ],
+    )
+    mock_get_query = mocker.patch(
+        "doc_issues.github_issues.get_issue_timeline_items_query", side_effect=["timeline_query_1", "timeline_query_2"]
+    )
+
+    # Act
+    actual = GitHubIssues(github).get_issues_audit_data(["I_1"])
+
+    # Assert
+    assert [first_item, second_item, third_item] == actual["I_1"]["timelineItems"]["nodes"]
+    assert [mocker.call("I_1", 'after: "c1"'), mocker.call("I_1", 'after: "c2"')] == mock_get_query.call_args_list
+
+
+def test_get_issues_audit_data_failed_timeline_page_drops_issue(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    complete_node = {"id": "I_1", "timelineItems": _timeline_items([], False, None)}
+    incomplete_node = {"id": "I_2", "timelineItems": _timeline_items([{"__typename": "ClosedEvent"}], True, "c1")}
+    mocker.patch.object(
+        github.requester,
+        "requestJsonAndCheck",
+        side_effect=[
+            ({}, {"data": {"nodes": [complete_node, incomplete_node]}}),
+            GithubException(502, "Bad Gateway", {}),
+        ],
+    )
+
+    # Act
+    actual = GitHubIssues(github).get_issues_audit_data(["I_1", "I_2"])
+
+    # Assert
+    assert {"I_1": complete_node} == actual
+
+
+# get_issue_timeline_items
+
+
+def test_get_issue_timeline_items_paced_by_rate_limiter(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    rate_limit = {"cost": 1, "remaining": 4999, "resetAt": "2025-01-01T00:00:00Z"}
+    timeline_item = {"__typename": "ClosedEvent"}
+    mocker.patch.object(
+        github.requester,
+        "requestJsonAndCheck",
+        return_value=(
+            {},
+            {"data": {"rateLimit": rate_limit, "node": {"timelineItems": _timeline_items([timeline_item], False, None)}}},
+        ),
+    )
+    mock_rate_limiter = mocker.Mock()
+
+    # Act
+    actual = GitHubIssues(github, rate_limiter=mock_rate_limiter).get_issue_timeline_items("I_1")
+
+    # Assert
+    assert [timeline_item] == actual
+    mock_rate_limiter.wait.assert_called_once_with("graphql")
+    mock_rate_limiter.record_graphql_cost.assert_called_once_with(rate_limit)
+
+
+def test_get_issue_timeline_items_missing_issue_raises(mocker):
+    # Arrange
+    github = Github(auth=Auth.Token("token123"))
+    mocker.patch.object(github.requester, "requestJsonAndCheck", return_value=({}, {"data": {"node": None}}))
+
+    # Act, Assert
+    with pytest.raises(GithubException):
+        GitHubIssues(github).get_issue_timeline_items("I_1")
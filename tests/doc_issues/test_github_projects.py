@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
+
 import requests
 
 from doc_issues.github_projects import GitHubProjects
@@ -42,6 +44,21 @@ def test___initialize_request_session_sets_session_and_headers(mocker):
     )
 
 
+def test___initialize_request_session_registers_rate_limiter(mocker):
+    # Arrange
+    mock_session = mocker.patch("requests.Session", autospec=True).return_value
+    mock_session.headers = mocker.Mock()
+    mock_session.hooks = {"response": []}
+    mock_rate_limiter = mocker.Mock()
+    github_projects = GitHubProjects("test_token", rate_limiter=mock_rate_limiter)
+
+    # Act
+    github_projects._GitHubProjects__initialize_request_session()
+
+    # Assert
+    assert [mock_rate_limiter.observe] == mock_session.hooks["response"]
+
+
 # _send_graphql_query
 
 
@@ -50,7 +67,7 @@ def test_send_graphql_query_correct_behaviour(mocker):
     expected_response = {"data": expected_data}
 
     mock_session = mocker.Mock()
-    mock_session.post.return_value.json.return_value = expected_response
+    mock_session.post.return_value.content = json.dumps(expected_response)
     mock_session.post.return_value.raise_for_status = lambda: None
 
     mocker.patch.object(
@@ -64,10 +81,28 @@ def test_send_graphql_query_correct_behaviour(mocker):
     assert expected_data == actual_data
 
 
+def test_send_graphql_query_records_rate_limit_cost(mocker):
+    rate_limit = {"cost": 1, "remaining": 4999, "resetAt": "2025-01-01T00:00:00Z"}
+    mock_session = mocker.Mock()
+    mock_session.post.return_value.content = json.dumps({"data": {"rateLimit": rate_limit}})
+    mock_session.post.return_value.raise_for_status = lambda: None
+    mocker.patch.object(
+        GitHubProjects,
+        "_GitHubProjects__initialize_request_session",
+        lambda self: setattr(self, "_GitHubProjects__session", mock_session),
+    )
+    mock_rate_limiter = mocker.Mock()
+
+    GitHubProjects("token123", rate_limiter=mock_rate_limiter)._send_graphql_query("query")
+
+    mock_rate_limiter.wait.assert_called_once_with("graphql")
+    mock_rate_limiter.record_graphql_cost.assert_called_once_with(rate_limit)
+
+
 def test_send_graphql_query_http_error(mocker):
     expected_response = {"data": {"repository": "null"},"errors": [{"type": "NOT_FOUND","path": ["repository"],"locations": [{"line": 7,"column": 19}],"message": "Could not resolve to a Repository with the name 'name/repo'."}]}
     mock_session = mocker.Mock()
-    mock_session.post.return_value.json.return_value = expected_response
+    mock_session.post.return_value.content = json.dumps(expected_response)
     mock_session.post.return_value.raise_for_status = lambda: None
 
     mocker.patch.object(
@@ -83,6 +118,22 @@ def test_send_graphql_query_http_error(mocker):
     mock_log_error.assert_called_once_with("An error occurred: %s.", mocker.ANY, exc_info=True)
 
 
+def test_send_graphql_query_invalid_json(mocker):
+    mock_session = mocker.Mock()
+    mock_session.post.return_value.content = b"<html>Bad Gateway</html>"
+    mocker.patch.object(
+        GitHubProjects,
+        "_GitHubProjects__initialize_request_session",
+        lambda self: setattr(self, "_GitHubProjects__session", mock_session),
+    )
+    mock_log_error = mocker.patch("doc_issues.github_projects.logger.error")
+
+    actual = GitHubProjects("token123")._send_graphql_query("query")
+
+    assert actual is None
+    mock_log_error.assert_called_once_with("An error occurred: %s.", mocker.ANY, exc_info=True)
+
+
 def test_send_graphql_query_request_exception(mocker):
     mock_session = mocker.Mock()
     mocker.patch.object(
@@ -112,19 +163,12 @@ def test_get_repository_projects_correct_behaviour(mocker, repository_setup):
         "doc_issues.github_projects.get_projects_from_repo_query",
         return_value="mocked_projects_query",
     )
-    mocker.patch(
-        "doc_issues.github_projects.get_project_field_options_query",
-        return_value="mocked_project_field_options_query",
-    )
     mock_send_query = mocker.patch.object(GitHubProjects, "_send_graphql_query")
-    mock_send_query.side_effect = [
-        {
-            "repository": {
-                "projectsV2": {"nodes": [{"title": "Project A", "number": 1}, {"title": "Project B", "number": 2}]}
-            }
-        },
-        {"data": {}},
-    ]
+    mock_send_query.return_value = {
+        "repository": {
+            "projectsV2": {"nodes": [{"title": "Project A", "number": 1}, {"title": "Project B", "number": 2}]}
+        }
+    }
 
     mock_github_project = mocker.patch("doc_issues.github_projects.GitHubProject")
     mock_github_project_instance = mock_github_project.return_value
@@ -137,10 +181,8 @@ def test_get_repository_projects_correct_behaviour(mocker, repository_setup):
     # Assert
     assert 1 == len(actual)
     assert mock_github_project_instance in actual
-    mock_send_query.assert_called()
-    mock_github_project_instance.loads.assert_called_once_with(
-        {"title": "Project A", "number": 1}, mock_repository, {"data": {}}
-    )
+    mock_send_query.assert_called_once_with("mocked_projects_query")
+    mock_github_project_instance.loads.assert_called_once_with({"title": "Project A", "number": 1}, mock_repository)
     mock_logger_debug.assert_called_once_with("Project `%s` is not required based on the filter.", "Project B")
 
 
@@ -153,10 +195,6 @@ def test_get_repository_projects_response_none(mocker, repository_setup):
         "doc_issues.github_projects.get_projects_from_repo_query",
         return_value="mocked_projects_query",
     )
-    mocker.patch(
-        "doc_issues.github_projects.get_project_field_options_query",
-        return_value="mocked_project_field_options_query",
-    )
     mock_send_query = mocker.patch.object(GitHubProjects, "_send_graphql_query", return_value=None)
 
     # Act
@@ -180,10 +218,6 @@ def test_get_repository_projects_response_nodes_none(mocker, repository_setup):
         "doc_issues.github_projects.get_projects_from_repo_query",
         return_value="mocked_projects_query",
     )
-    mocker.patch(
-        "doc_issues.github_projects.get_project_field_options_query",
-        return_value="mocked_project_field_options_query",
-    )
     mock_send_query = mocker.patch.object(
         GitHubProjects, "_send_graphql_query", return_value={"repository": {"projectsV2": {"nodes": None}}}
     )
@@ -198,6 +232,50 @@ def test_get_repository_projects_response_nodes_none(mocker, repository_setup):
     mock_logger_warning.assert_called_once_with("Repository information is not present in the response")
 
 
+# iter_repository_projects
+
+
+def test_iter_repository_projects_paginates(mocker, repository_setup):
+    # Arrange
+    mock_repository = repository_setup()
+    mock_query = mocker.patch(
+        "doc_issues.github_projects.get_projects_from_repo_query", return_value="mocked_projects_query"
+    )
+    mock_send_query = mocker.patch.object(GitHubProjects, "_send_graphql_query")
+    mock_send_query.side_effect = [
+        {
+            "repository": {
+                "projectsV2": {
+                    "nodes": [{"id": "PVT_1", "title": "Project A", "number": 1}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": "cursor_1"},
+                }
+            }
+        },
+        {
+            "repository": {
+                "projectsV2": {
+                    "nodes": [{"id": "PVT_2", "title": "Project B", "number": 2}],
+                    "pageInfo": {"hasNextPage": False, "endCursor": "cursor_2"},
+                }
+            }
+        },
+    ]
+
+    # Act
+    projects = GitHubProjects("token123").iter_repository_projects(mock_repository, [])
+    first_project = next(projects)
+
+    # Assert
+    assert "PVT_1" == first_project.id
+    mock_send_query.assert_called_once()
+    assert ["PVT_2"] == [project.id for project in projects]
+    mock_query.assert_called_with(
+        organization_name=mock_repository.owner.login,
+        repository_name=mock_repository.name,
+        after_argument='after: "cursor_1"',
+    )
+
+
 # get_project_issues
 
 
@@ -253,6 +331,29 @@ def test_get_project_issues_correct_behaviour(mocker, github_project_setup):
     mock_logger_debug.assert_any_call("Loaded `%i` issue(s) from project: %s.", 4, mock_project.title)
 
 
+def test_get_project_issues_keeps_only_wanted_issues(mocker, github_project_setup):
+    # Arrange
+    mock_project = github_project_setup()
+    mocker.patch("doc_issues.github_projects.get_issues_from_project_query", return_value="mocked_issues_query")
+    issue_nodes = [
+        {"content": {"number": number, "repository": {"name": repository_name, "owner": {"login": "org"}}}}
+        for number, repository_name in [(1, "documented"), (2, "documented"), (1, "unconfigured")]
+    ]
+    mocker.patch.object(
+        GitHubProjects,
+        "_send_graphql_query",
+        return_value={"node": {"items": {"nodes": issue_nodes, "pageInfo": {"hasNextPage": False}}}},
+    )
+
+    # Act
+    actual = GitHubProjects("token123").get_project_issues(mock_project, wanted_issue_keys={"org/documented/1"})
+
+    # Assert
+    assert [("org", "documented", 1)] == [
+        (issue.organization_name, issue.repository_name, issue.number) for issue in actual
+    ]
+
+
 def test_get_project_issues_no_response(mocker, github_project_setup):
     # Arrange
     mock_project = github_project_setup()
@@ -270,3 +371,114 @@ def test_get_project_issues_no_response(mocker, github_project_setup):
     # Assert
     assert result == []
     mock_send_query.assert_called_once_with("mocked_issues_query")
+
+
+# get_issues_project_items
+
+
+def test_get_issues_project_items_keeps_requested_projects(mocker):
+    # Arrange
+    project = mocker.Mock(id="PVT_1", title="Roadmap")
+    issue_node = {
+        "id": "I_1",
+        "number": 7,
+        "repository": {"name": "repo", "owner": {"login": "org"}},
+        "projectItems": {
+            "nodes": [
+                {"project": {"id": "PVT_1"}, "status": {"name": "Done"}, "priority": None},
+                {"project": {"id": "PVT_OTHER"}, "status": {"name": "Todo"}},
+            ]
+        },
+    }
+    mock_send_query = mocker.patch.object(
+        GitHubProjects, "_send_graphql_query", return_value={"nodes": [issue_node, None]}
+    )
+
+    # Act
+    actual = GitHubProjects("token123").get_issues_project_items(["I_1", "I_2"], {"PVT_1": project})
+
+    # Assert
+    assert ["PVT_1"] == list(actual.keys())
+    project_issue = actual["PVT_1"][0]
+    assert ("org", "repo", 7) == (project_issue.organization_name, project_issue.repository_name, project_issue.number)
+    assert "Done" == project_issue.project_status.status
+    assert 'nodes(ids: ["I_1", "I_2"])' in mock_send_query.call_args.args[0]
+
+
+def test_get_issues_project_items_paginates_many_projects(mocker):
+    # Arrange
+    projects = {project_id: mocker.Mock(id=project_id, title=project_id) for project_id in ("PVT_1", "PVT_2", "PVT_3")}
+    issue_node = {
+        "id": "I_1",
+        "number": 7,
+        "repository": {"name": "repo", "owner": {"login": "org"}},
+        "projectItems": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            "nodes": [{"project": {"id": "PVT_1"}}],
+        },
+    }
+    mock_send_query = mocker.patch.object(
+        GitHubProjects,
+        "_send_graphql_query",
+        side_effect=[
+            {"nodes": [issue_node]},
+            {
+                "node": {
+                    "projectItems": {
+                        "pageInfo": {"hasNextPage": True, "endCursor": "c2"},
+                        "nodes": [{"project": {"id": "PVT_2"}}],
+                    }
+                }
+            },
+            {
+                "node": {
+                    "projectItems": {
+                        "pageInfo": {"hasNextPage": False, "endCursor": "c3"},
+                        "nodes": [{"project": {"id": "PVT_3"}}],
+                    }
+                }
+            },
+        ],
+    )
+
+    # Act
+    actual = GitHubProjects("token123").get_issues_project_items(["I_1"], projects)
+
+    # Assert
+    assert ["PVT_1", "PVT_2", "PVT_3"] == list(actual.keys())
+    assert 'after: "c1"' in mock_send_query.call_args_list[1].args[0]
+    assert 'after: "c2"' in mock_send_query.call_args_list[2].args[0]
+
+
+def test_get_issues_project_items_failed_page_keeps_fetched_items(mocker):
+    # Arrange
+    project = mocker.Mock(id="PVT_1", title="Roadmap")
+    issue_node = {
+        "id": "I_1",
+        "number": 7,
+        "repository": {"name": "repo", "owner": {"login": "org"}},
+        "projectItems": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            "nodes": [{"project": {"id": "PVT_1"}}],
+        },
+    }
+    mocker.patch.object(GitHubProjects, "_send_graphql_query", side_effect=[{"nodes": [issue_node]}, None])
+    mock_log_warning = mocker.patch("doc_issues.github_projects.logger.warning")
+
+    # Act
+    actual = GitHubProjects("token123").get_issues_project_items(["I_1"], {"PVT_1": project})
+
+    # Assert
+    assert ["PVT_1"] == list(actual.keys())
+    mock_log_warning.assert_called_once_with("Could not fetch all project items of issue `%s`.", "I_1")
+
+
+def test_get_issues_project_items_no_response(mocker):
+    # Arrange
+    mocker.patch.object(GitHubProjects, "_send_graphql_query", return_value=None)
+
+    # Act
+    actual = GitHubProjects("token123").get_issues_project_items(["I_1"], {})
+
+    # Assert
+    assert {} == actual
@@ -0,0 +1,148 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import hashlib
+import json
+
+from doc_issues.body_parser import parse_body
+from doc_issues.parse_cache import ParsedBodyCache
+from utils import json_codec
+
+BODY = "## Description\n\nSome description.\n\n## Preconditions\n\n- Logged in.\n"
+
+
+# load
+
+
+def test_load_missing_file(tmp_path):
+    # Arrange
+    cache = ParsedBodyCache(str(tmp_path / "parse-cache.json"))
+
+    # Act
+    actual = cache.load()
+
+    # Assert
+    assert actual is False
+
+
+def test_load_changed_parser(tmp_path):
+    # Arrange
+    file_path = tmp_path / "parse-cache.json"
+    file_path.write_text(json.dumps({"parser_version": "old", "entries": {}}), encoding="utf-8")
+
+    # Act
+    actual = ParsedBodyCache(str(file_path)).load()
+
+    # Assert
+    assert actual is False
+
+
+def test_load_broken_file(mocker, tmp_path):
+    # Arrange
+    file_path = tmp_path / "parse-cache.json"
+    file_path.write_text("{broken", encoding="utf-8")
+    mock_log_warning = mocker.patch("doc_issues.parse_cache.logger.warning")
+
+    # Act
+    actual = ParsedBodyCache(str(file_path)).load()
+
+    # Assert
+    assert actual is False
+    mock_log_warning.assert_called_once()
+
+
+# parse_body
+
+
+def test_parse_body_round_trip(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "cache" / "parse-cache.json")
+    cache = ParsedBodyCache(file_path)
+    cache.load()
+    first_run = cache.parse_body(BODY)
+    cache.save()
+
+    # Act
+    next_cache = ParsedBodyCache(file_path)
+    loaded = next_cache.load()
+    actual = next_cache.parse_body(BODY)
+
+    # Assert
+    assert loaded is True
+    assert parse_body(BODY) == first_run == actual
+    assert (0, 1) == (cache.hits, cache.misses)
+    assert (1, 0) == (next_cache.hits, next_cache.misses)
+
+
+def test_parse_body_empty_body_not_cached(tmp_path):
+    # Arrange
+    cache = ParsedBodyCache(str(tmp_path / "parse-cache.json"))
+
+    # Act
+    actual = cache.parse_body(None)
+
+    # Assert
+    assert parse_body(None) == actual
+    assert (0, 0) == (cache.hits, cache.misses)
+
+
+# save
+
+
+def _entry_size(body: str) -> int:
+    key = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return len(json_codec.dumps({key: parse_body(body)}).encode("utf-8"))
+
+
+def test_save_evicts_least_recently_used(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "parse-cache.json")
+    # The bodies are of the same size, the size limit fits two of them
+    cache = ParsedBodyCache(file_path, max_size_bytes=2 * _entry_size("## Description\nA\n"))
+    for body in ("## Description\nA\n", "## Description\nB\n", "## Description\nC\n"):
+        cache.parse_body(body)
+    # The oldest body becomes the most recently used one
+    cache.parse_body("## Description\nA\n")
+
+    # Act
+    cache.save()
+
+    # Assert
+    next_cache = ParsedBodyCache(file_path)
+    next_cache.load()
+    next_cache.parse_body("## Description\nA\n")
+    next_cache.parse_body("## Description\nB\n")
+    next_cache.parse_body("## Description\nC\n")
+    assert (2, 1) == (next_cache.hits, next_cache.misses)
+
+
+def test_save_evicts_large_body_above_size_limit(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "parse-cache.json")
+    small_body = "## Description\nA\n"
+    large_body = "## Description\n" + "x" * 10000 + "\n"
+    cache = ParsedBodyCache(file_path, max_size_bytes=_entry_size(small_body) + 1000)
+    cache.parse_body(large_body)
+    cache.parse_body(small_body)
+
+    # Act
+    cache.save()
+
+    # Assert - the file stays below the limit, even though only two bodies were parsed
+    next_cache = ParsedBodyCache(file_path)
+    next_cache.load()
+    next_cache.parse_body(small_body)
+    next_cache.parse_body(large_body)
+    assert (1, 1) == (next_cache.hits, next_cache.misses)
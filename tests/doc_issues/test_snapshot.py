@@ -0,0 +1,206 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+from datetime import datetime, timedelta, timezone
+
+from github import Auth, Github
+from github.Issue import Issue
+
+from doc_issues.model.consolidated_issue import ConsolidatedIssue
+from doc_issues.snapshot import IssuesSnapshot
+from utils.constants import SNAPSHOT_FULL_REFRESH_DAYS, SNAPSHOT_SINCE_OVERLAP_MINUTES
+
+RUN_STARTED_AT = datetime(2025, 1, 22, 12, tzinfo=timezone.utc)
+NEXT_RUN_STARTED_AT = RUN_STARTED_AT + timedelta(days=1)
+
+
+def _consolidated_issue(requester, number: int) -> ConsolidatedIssue:
+    attributes = {
+        "node_id": f"I_{number}",
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "closed",
+        "body": "Issue body",
+        "html_url": f"https://github.com/test_org/test_repo/issues/{number}",
+        "created_at": "2025-01-20T12:00:00Z",
+        "updated_at": "2025-01-21T12:00:00Z",
+        "closed_at": "2025-01-21T12:00:00Z",
+        "labels": [{"name": "DocumentedFeature"}],
+    }
+    consolidated_issue = ConsolidatedIssue("test_org/test_repo", Issue(requester, {}, attributes, completed=True))
+    consolidated_issue.set_audit_data({"created_by": "author", "closed_by": "closer"})
+    return consolidated_issue
+
+
+# load
+
+
+def test_load_missing_file(tmp_path):
+    # Arrange
+    snapshot = IssuesSnapshot(str(tmp_path / "snapshot.json"))
+
+    # Act
+    actual = snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Assert
+    assert actual is False
+    assert snapshot.get_since("test_org/test_repo") is None
+
+
+def test_load_unsupported_version(tmp_path):
+    # Arrange
+    file_path = tmp_path / "snapshot.json"
+    file_path.write_text(json.dumps({"version": 0, "last_run_at": RUN_STARTED_AT.isoformat(), "repositories": {}}))
+    snapshot = IssuesSnapshot(str(file_path))
+
+    # Act
+    actual = snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Assert
+    assert actual is False
+    assert snapshot.last_run_at is None
+
+
+def test_load_broken_file(tmp_path):
+    # Arrange
+    file_path = tmp_path / "snapshot.json"
+    file_path.write_text("{broken")
+    snapshot = IssuesSnapshot(str(file_path))
+
+    # Act
+    actual = snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Assert
+    assert actual is False
+
+
+# save
+
+
+def test_save_and_load_round_trip(tmp_path):
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+    file_path = str(tmp_path / "cache" / "snapshot.json")
+    consolidated_issues = {"test_org/test_repo/1": _consolidated_issue(requester, 1)}
+    IssuesSnapshot(file_path).save(RUN_STARTED_AT, ["test_org/test_repo", "test_org/empty_repo"], consolidated_issues)
+    snapshot = IssuesSnapshot(file_path)
+
+    # Act
+    loaded = snapshot.load(NEXT_RUN_STARTED_AT)
+    restored = snapshot.get_repository_issues("test_org/test_repo", requester)
+
+    # Assert
+    assert loaded is True
+    assert RUN_STARTED_AT - timedelta(minutes=SNAPSHOT_SINCE_OVERLAP_MINUTES) == snapshot.get_since("test_org/test_repo")
+    assert snapshot.get_since("test_org/empty_repo") is not None
+    assert snapshot.get_since("test_org/other_repo") is None
+    assert [] == snapshot.get_repository_issues("test_org/empty_repo", requester)
+    assert 1 == len(restored)
+    restored_issue = ConsolidatedIssue("test_org/test_repo", restored[0])
+    assert consolidated_issues["test_org/test_repo/1"].updated_at == restored_issue.updated_at
+    assert consolidated_issues["test_org/test_repo/1"].closed_at == restored_issue.closed_at
+    assert ["DocumentedFeature"] == restored_issue.labels
+    assert "Issue 1" == restored_issue.title
+    assert "I_1" == restored_issue.node_id
+
+
+# get_since
+
+
+def test_get_since_full_mining_due_after_refresh_period(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "snapshot.json")
+    IssuesSnapshot(file_path).save(RUN_STARTED_AT, ["test_org/test_repo"], {})
+    within_period = IssuesSnapshot(file_path)
+    within_period.load(RUN_STARTED_AT + timedelta(days=SNAPSHOT_FULL_REFRESH_DAYS - 1))
+    after_period = IssuesSnapshot(file_path)
+    after_period.load(RUN_STARTED_AT + timedelta(days=SNAPSHOT_FULL_REFRESH_DAYS))
+
+    # Act, Assert
+    assert within_period.get_since("test_org/test_repo") is not None
+    assert after_period.get_since("test_org/test_repo") is None
+
+
+def test_save_keeps_full_mining_time_of_incremental_run(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "snapshot.json")
+    IssuesSnapshot(file_path).save(RUN_STARTED_AT, ["test_org/test_repo"], {})
+    snapshot = IssuesSnapshot(file_path)
+    snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Act
+    snapshot.save(NEXT_RUN_STARTED_AT, ["test_org/test_repo"], {})
+
+    # Assert - the incremental run does not restart the refresh period
+    reloaded = IssuesSnapshot(file_path)
+    reloaded.load(RUN_STARTED_AT + timedelta(days=SNAPSHOT_FULL_REFRESH_DAYS))
+    assert reloaded.get_since("test_org/test_repo") is None
+
+
+def test_save_after_full_mining_restarts_refresh_period(tmp_path):
+    # Arrange
+    file_path = str(tmp_path / "snapshot.json")
+    IssuesSnapshot(file_path).save(RUN_STARTED_AT - timedelta(days=SNAPSHOT_FULL_REFRESH_DAYS), ["test_org/test_repo"], {})
+    snapshot = IssuesSnapshot(file_path)
+    snapshot.load(RUN_STARTED_AT)
+    assert snapshot.get_since("test_org/test_repo") is None
+
+    # Act
+    snapshot.save(RUN_STARTED_AT, ["test_org/test_repo"], {})
+
+    # Assert
+    reloaded = IssuesSnapshot(file_path)
+    reloaded.load(NEXT_RUN_STARTED_AT)
+    assert reloaded.get_since("test_org/test_repo") is not None
+
+
+def test_load_snapshot_without_full_mining_times(tmp_path):
+    # Arrange
+    file_path = tmp_path / "snapshot.json"
+    file_path.write_text(
+        json.dumps({"version": 2, "last_run_at": RUN_STARTED_AT.isoformat(), "repositories": {"test_org/test_repo": {}}})
+    )
+    snapshot = IssuesSnapshot(str(file_path))
+
+    # Act
+    actual = snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Assert
+    assert actual is False
+    assert snapshot.get_since("test_org/test_repo") is None
+
+
+# get_audit_data
+
+
+def test_get_audit_data_only_for_unchanged_issue(tmp_path):
+    # Arrange
+    requester = Github(auth=Auth.Token("token123")).requester
+    file_path = str(tmp_path / "snapshot.json")
+    consolidated_issue = _consolidated_issue(requester, 1)
+    IssuesSnapshot(file_path).save(RUN_STARTED_AT, ["test_org/test_repo"], {"test_org/test_repo/1": consolidated_issue})
+    snapshot = IssuesSnapshot(file_path)
+    snapshot.load(NEXT_RUN_STARTED_AT)
+
+    # Act
+    unchanged = snapshot.get_audit_data("test_org/test_repo", "test_org/test_repo/1", consolidated_issue.updated_at)
+    changed = snapshot.get_audit_data("test_org/test_repo", "test_org/test_repo/1", "2025-01-23T12:00:00+00:00")
+    missing = snapshot.get_audit_data("test_org/test_repo", "test_org/test_repo/2", consolidated_issue.updated_at)
+
+    # Assert
+    assert {"created_by": "author", "closed_by": "closer"} == unchanged
+    assert changed is None
+    assert missing is None
@@ -19,8 +19,9 @@ import os
 import pytest
 
 from action_inputs import ActionInputs
+from doc_issues.model.body_section import BodySection
 from doc_issues.model.config_repository import ConfigRepository
-from utils.exceptions import FetchRepositoriesException
+from utils.exceptions import FetchBodySectionsException, FetchRepositoriesException
 
 
 # Check Action Inputs default values
@@ -53,6 +54,139 @@ def test_verbose_logging_default():
     assert not actual
 
 
+def test_incremental_mining_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_INCREMENTAL", None)
+
+    # Act
+    actual = ActionInputs.is_incremental_mining_enabled()
+
+    # Assert
+    assert not actual
+
+
+def test_snapshot_path_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_SNAPSHOT_PATH", None)
+
+    # Act
+    actual = ActionInputs.get_snapshot_path()
+
+    # Assert
+    assert "./.living-doc-cache/doc-issues-snapshot.json" == actual
+
+
+def test_parse_cache_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_PARSE_CACHE", None)
+    os.environ.pop("INPUT_DOC_ISSUES_PARSE_CACHE_PATH", None)
+
+    # Act
+    actual = ActionInputs.is_parse_cache_enabled()
+
+    # Assert
+    assert not actual
+    assert "./.living-doc-cache/doc-issues-parse-cache.json" == ActionInputs.get_parse_cache_path()
+
+
+def test_output_format_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_OUTPUT_FORMAT", None)
+
+    # Act
+    actual = ActionInputs.get_output_format()
+
+    # Assert
+    assert "json" == actual
+
+
+def test_output_compression_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_OUTPUT_COMPRESSION", None)
+    os.environ.pop("INPUT_DOC_ISSUES_OUTPUT_COMPACT", None)
+
+    # Act
+    actual = ActionInputs.get_output_compression()
+
+    # Assert
+    assert "none" == actual
+    assert not ActionInputs.is_output_compact()
+
+
+def test_output_workers_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_OUTPUT_WORKERS", None)
+
+    # Act
+    actual = ActionInputs.get_output_workers()
+
+    # Assert
+    assert 1 == actual
+
+
+# get_concurrency
+
+
+def test_get_concurrency_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_CONCURRENCY", None)
+
+    # Act
+    actual = ActionInputs.get_concurrency()
+
+    # Assert
+    assert 1 == actual
+
+
+def test_get_concurrency_invalid_value(mocker):
+    # Arrange
+    mocker.patch("action_inputs.get_action_input", return_value="four")
+
+    # Act
+    actual = ActionInputs.get_concurrency()
+
+    # Assert
+    assert 0 == actual
+
+
+# get_body_sections
+
+
+def test_get_body_sections_default():
+    # Arrange
+    os.environ.pop("INPUT_DOC_ISSUES_BODY_SECTIONS", None)
+
+    # Act
+    actual = ActionInputs.get_body_sections()
+
+    # Assert
+    assert [] == actual
+
+
+def test_get_body_sections_correct_behaviour(mocker):
+    # Arrange
+    sections_json = [{"field": "postconditions", "heading": "Postconditions", "kind": "bullet-list"}]
+    mocker.patch("action_inputs.get_action_input", return_value=json.dumps(sections_json))
+
+    # Act
+    actual = ActionInputs.get_body_sections()
+
+    # Assert
+    assert 1 == len(actual)
+    assert "postconditions" == actual[0].field
+    assert "bullet-list" == actual[0].kind
+
+
+@pytest.mark.parametrize("action_input", ["{invalid", '[{"heading": "Postconditions"}]', "5"])
+def test_get_body_sections_invalid_input(mocker, action_input):
+    # Arrange
+    mocker.patch("action_inputs.get_action_input", return_value=action_input)
+
+    # Act, Assert
+    with pytest.raises(FetchBodySectionsException):
+        ActionInputs.get_body_sections()
+
+
 # get_repositories
 
 
@@ -247,3 +381,113 @@ def test_validate_user_configuration_wrong_repository_non_200(mocker, config_rep
         ],
         any_order=False,
     )
+
+
+def test_validate_user_configuration_invalid_concurrency(mocker, config_repository):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+
+    mocker.patch("action_inputs.ActionInputs.get_repositories", return_value=[config_repository])
+    mocker.patch("action_inputs.ActionInputs.get_github_token", return_value="correct_token")
+    mocker.patch("action_inputs.ActionInputs.get_concurrency", return_value=0)
+    mocker.patch("action_inputs.get_action_input", return_value="0")
+    mock_response_200 = mocker.Mock()
+    mock_response_200.status_code = 200
+    mocker.patch("action_inputs.requests.get", return_value=mock_response_200)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "Invalid `doc-issues-concurrency` input: `%s`. Expected a positive integer.", "0"
+    )
+
+
+def test_validate_user_configuration_invalid_output_format(mocker, config_repository):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+
+    mocker.patch("action_inputs.ActionInputs.get_repositories", return_value=[config_repository])
+    mocker.patch("action_inputs.ActionInputs.get_github_token", return_value="correct_token")
+    mocker.patch("action_inputs.ActionInputs.get_output_format", return_value="xml")
+    mock_response_200 = mocker.Mock()
+    mock_response_200.status_code = 200
+    mocker.patch("action_inputs.requests.get", return_value=mock_response_200)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "Invalid `doc-issues-output-format` input: `%s`. Expected one of %s.", "xml", ["json", "jsonl"]
+    )
+
+
+def test_validate_user_configuration_unavailable_output_compression(mocker, config_repository):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+
+    mocker.patch("action_inputs.ActionInputs.get_repositories", return_value=[config_repository])
+    mocker.patch("action_inputs.ActionInputs.get_github_token", return_value="correct_token")
+    mocker.patch("action_inputs.ActionInputs.get_output_compression", return_value="zstd")
+    mocker.patch("action_inputs.compression.is_available", return_value=False)
+    mock_response_200 = mocker.Mock()
+    mock_response_200.status_code = 200
+    mocker.patch("action_inputs.requests.get", return_value=mock_response_200)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "The `%s` output compression is not available. Install the `zstandard` package or use Python 3.14+.", "zstd"
+    )
+
+
+def test_validate_user_configuration_body_section_field_already_used(mocker, config_repository):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+
+    mocker.patch("action_inputs.ActionInputs.get_repositories", return_value=[config_repository])
+    mocker.patch("action_inputs.ActionInputs.get_github_token", return_value="correct_token")
+    mocker.patch(
+        "action_inputs.ActionInputs.get_body_sections", return_value=[BodySection("preconditions", "Pre", 2, "text")]
+    )
+    mock_response_200 = mocker.Mock()
+    mock_response_200.status_code = 200
+    mocker.patch("action_inputs.requests.get", return_value=mock_response_200)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "Invalid `doc-issues-body-sections` input: field `%s` is already used.", "preconditions"
+    )
+
+
+def test_validate_user_configuration_invalid_output_workers(mocker, config_repository):
+    # Arrange
+    mock_log_error = mocker.patch("action_inputs.logger.error")
+
+    mocker.patch("action_inputs.ActionInputs.get_repositories", return_value=[config_repository])
+    mocker.patch("action_inputs.ActionInputs.get_github_token", return_value="correct_token")
+    mocker.patch("action_inputs.ActionInputs.get_output_workers", return_value=0)
+    mocker.patch("action_inputs.get_action_input", return_value="0")
+    mock_response_200 = mocker.Mock()
+    mock_response_200.status_code = 200
+    mocker.patch("action_inputs.requests.get", return_value=mock_response_200)
+
+    # Act
+    return_value = ActionInputs().validate_user_configuration()
+
+    # Assert
+    assert return_value is False
+    mock_log_error.assert_any_call(
+        "Invalid `doc-issues-output-workers` input: `%s`. Expected a positive integer.", "0"
+    )
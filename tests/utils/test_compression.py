@@ -0,0 +1,80 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import gzip
+
+import pytest
+
+from utils import compression
+
+
+@pytest.mark.parametrize(
+    "output_compression, expected", [("none", "doc-issues.json"), ("gzip", "doc-issues.json.gz"), ("zstd", "doc-issues.json.zst")]
+)
+def test_get_file_path(output_compression, expected):
+    # Act
+    actual = compression.get_file_path("doc-issues.json", output_compression)
+
+    # Assert
+    assert expected == actual
+
+
+def test_is_available(mocker):
+    # Arrange
+    mocker.patch("utils.compression._ZSTD", None)
+
+    # Act, Assert
+    assert compression.is_available("none")
+    assert compression.is_available("gzip")
+    assert not compression.is_available("zstd")
+    assert not compression.is_available("brotli")
+
+
+def test_open_text_file_gzip(tmp_path):
+    # Arrange
+    file_path = tmp_path / "doc-issues.json.gz"
+
+    # Act
+    with compression.open_text_file(str(file_path), "gzip") as f:
+        f.write('{"title": "Žluťoučký kůň"}')
+
+    # Assert
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        assert '{"title": "Žluťoučký kůň"}' == f.read()
+
+
+def test_open_text_file_zstd(mocker, tmp_path):
+    # Arrange
+    mock_zstd = mocker.patch("utils.compression._ZSTD")
+    file_path = str(tmp_path / "doc-issues.json.zst")
+
+    # Act
+    actual = compression.open_text_file(file_path, "zstd")
+
+    # Assert
+    assert mock_zstd.open.return_value == actual
+    mock_zstd.open.assert_called_once_with(file_path, "wt", encoding="utf-8")
+
+
+def test_open_text_file_none(tmp_path):
+    # Arrange
+    file_path = tmp_path / "doc-issues.json"
+
+    # Act
+    with compression.open_text_file(str(file_path), "none") as f:
+        f.write("{}")
+
+    # Assert
+    assert "{}" == file_path.read_text(encoding="utf-8")
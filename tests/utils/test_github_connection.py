@@ -0,0 +1,124 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from github import Auth, Github
+from github.Requester import HTTPRequestsConnectionClass, Requester
+
+from utils.github_connection import SharedSessionHTTPSConnection
+from utils.http_cache import CachingHTTPAdapter, ConditionalRequestCache
+
+
+# SharedSessionHTTPSConnection
+
+
+def test_connections_share_one_session(mocker):
+    # Arrange
+    mocker.patch.object(SharedSessionHTTPSConnection, "_session", None)
+
+    # Act
+    first = SharedSessionHTTPSConnection("api.github.com", pool_size=4)
+    second = SharedSessionHTTPSConnection("api.github.com", pool_size=4)
+
+    # Assert
+    assert first is not second
+    assert first.session is second.session
+    assert 443 == first.port
+    assert 4 == first.session.get_adapter("https://api.github.com")._pool_maxsize
+
+
+def test_close_keeps_shared_session(mocker):
+    # Arrange
+    mocker.patch.object(SharedSessionHTTPSConnection, "_session", None)
+    connection = SharedSessionHTTPSConnection("api.github.com")
+    session = connection.session
+
+    # Act
+    connection.close()
+
+    # Assert
+    assert SharedSessionHTTPSConnection("api.github.com").session is session
+
+
+def test_install(mocker):
+    # Arrange
+    mock_inject = mocker.patch("utils.github_connection.Requester.injectConnectionClasses")
+
+    # Act
+    SharedSessionHTTPSConnection.install()
+
+    # Assert
+    mock_inject.assert_called_once_with(HTTPRequestsConnectionClass, SharedSessionHTTPSConnection)
+
+
+def test_install_with_http_cache(mocker, tmp_path):
+    # Arrange
+    mocker.patch("utils.github_connection.Requester.injectConnectionClasses")
+    http_cache = ConditionalRequestCache(str(tmp_path))
+
+    # Act
+    SharedSessionHTTPSConnection.install(http_cache)
+    connection = SharedSessionHTTPSConnection("api.github.com")
+
+    # Assert
+    assert isinstance(connection.session.get_adapter("https://api.github.com"), CachingHTTPAdapter)
+    SharedSessionHTTPSConnection.install()
+
+
+def test_install_with_response_hook(mocker):
+    # Arrange
+    mocker.patch("utils.github_connection.Requester.injectConnectionClasses")
+    response_hook = mocker.Mock()
+
+    # Act
+    SharedSessionHTTPSConnection.install(response_hook=response_hook)
+    connection = SharedSessionHTTPSConnection("api.github.com")
+
+    # Assert
+    assert response_hook in connection.session.hooks["response"]
+    SharedSessionHTTPSConnection.install()
+
+
+def test_set_response_hook(mocker):
+    # Arrange
+    mocker.patch.object(SharedSessionHTTPSConnection, "_session", None)
+    session = SharedSessionHTTPSConnection("api.github.com").session
+    response_hook = mocker.Mock()
+
+    # Act
+    SharedSessionHTTPSConnection.set_response_hook(response_hook)
+    connection = SharedSessionHTTPSConnection("api.github.com")
+
+    # Assert
+    assert connection.session is not session
+    assert response_hook in connection.session.hooks["response"]
+    SharedSessionHTTPSConnection.set_response_hook(None)
+
+
+def test_github_instance_requests_share_one_session(mocker):
+    # Arrange
+    mocker.patch.object(SharedSessionHTTPSConnection, "_session", None)
+    SharedSessionHTTPSConnection.install()
+    requester = Github(auth=Auth.Token("token123"), pool_size=4).requester
+
+    # Act
+    first = requester._Requester__createConnection()
+    second = requester._Requester__createConnection()
+
+    # Assert
+    assert isinstance(first, SharedSessionHTTPSConnection)
+    assert first is not second
+    assert first.session is second.session
+    assert 4 == first.session.get_adapter("https://api.github.com")._pool_maxsize
+    Requester.resetConnectionClasses()
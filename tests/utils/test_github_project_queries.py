@@ -19,14 +19,23 @@ import re
 from utils.constants import (
     PROJECTS_FROM_REPO_QUERY,
     ISSUES_FROM_PROJECT_QUERY,
-    PROJECT_FIELD_OPTIONS_QUERY,
+    ISSUES_FROM_REPO_QUERY,
+    ISSUES_UPDATED_SINCE_FROM_REPO_QUERY,
     ISSUES_PER_PAGE_LIMIT,
+    PROJECTS_PER_PAGE_LIMIT,
+    PROJECT_ITEMS_PER_ISSUE_LIMIT,
 )
 from utils.exceptions import InvalidQueryFormatError
 from utils.github_project_queries import (
     get_projects_from_repo_query,
     get_issues_from_project_query,
-    get_project_field_options_query, validate_query_formats,
+    validate_query_formats,
+    get_issues_from_repo_query,
+    get_issues_updated_since_from_repo_query,
+    get_issues_audit_query,
+    get_issue_timeline_items_query,
+    get_issues_project_items_query,
+    get_issue_project_items_query,
 )
 
 
@@ -36,11 +45,15 @@ from utils.github_project_queries import (
 def test_get_projects_from_repo_query():
     organization_name = "test_org"
     repository_name = "test_repo"
+    after_argument = "test_after_argument"
     expected_query = PROJECTS_FROM_REPO_QUERY.format(
-        organization_name=organization_name, repository_name=repository_name
+        organization_name=organization_name,
+        repository_name=repository_name,
+        projects_per_page=PROJECTS_PER_PAGE_LIMIT,
+        after_argument=after_argument,
     )
 
-    actual_query = get_projects_from_repo_query(organization_name, repository_name)
+    actual_query = get_projects_from_repo_query(organization_name, repository_name, after_argument)
 
     leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
     assert expected_query == actual_query
@@ -64,24 +77,106 @@ def test_get_issues_from_project_query():
     assert not leftover_placeholders
 
 
-# get_project_field_options_query
+# get_issues_from_repo_query
 
 
-def test_get_project_field_options_query():
-    organization_name = "test_org"
-    repository_name = "test_repo"
-    project_number = 1
-    expected_query = PROJECT_FIELD_OPTIONS_QUERY.format(
-        organization_name=organization_name, repository_name=repository_name, project_number=project_number
+def test_get_issues_from_repo_query():
+    expected_query = ISSUES_FROM_REPO_QUERY.format(
+        organization_name="test_org",
+        repository_name="test_repo",
+        issues_per_page=ISSUES_PER_PAGE_LIMIT,
+        labels='"DocumentedFeature", "DocumentedUserStory"',
+        after_argument="test_after_argument",
+    )
+
+    actual_query = get_issues_from_repo_query(
+        "test_org", "test_repo", ["DocumentedFeature", "DocumentedUserStory"], "test_after_argument"
+    )
+
+    leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
+    assert expected_query == actual_query
+    assert not leftover_placeholders
+
+
+def test_get_issues_updated_since_from_repo_query():
+    expected_query = ISSUES_UPDATED_SINCE_FROM_REPO_QUERY.format(
+        organization_name="test_org",
+        repository_name="test_repo",
+        issues_per_page=ISSUES_PER_PAGE_LIMIT,
+        since="2025-01-20T12:00:00Z",
+        after_argument="test_after_argument",
     )
 
-    actual_query = get_project_field_options_query(organization_name, repository_name, project_number)
+    actual_query = get_issues_updated_since_from_repo_query(
+        "test_org", "test_repo", "2025-01-20T12:00:00Z", "test_after_argument"
+    )
 
     leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
     assert expected_query == actual_query
+    assert 'filterBy: {since: "2025-01-20T12:00:00Z"}' in actual_query
+    assert not leftover_placeholders
+
+
+def test_get_issues_audit_query():
+    # Act
+    actual_query = get_issues_audit_query(["I_1", "I_2"])
+
+    # Assert
+    leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
+    assert 'nodes(ids: ["I_1", "I_2"])' in actual_query
+    assert f"first: {ISSUES_PER_PAGE_LIMIT}" in actual_query
     assert not leftover_placeholders
 
 
+def test_get_issue_timeline_items_query():
+    # Act
+    actual_query = get_issue_timeline_items_query("I_1", 'after: "c1"')
+
+    # Assert
+    leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
+    assert 'node(id: "I_1")' in actual_query
+    assert 'after: "c1"' in actual_query
+    assert "CLOSED_EVENT" in actual_query
+    assert "fragment AuditTimelineItem on IssueTimelineItems {" in actual_query
+    assert not leftover_placeholders
+
+
+# get_issues_project_items_query
+
+
+def test_get_issues_project_items_query():
+    # Act
+    actual_query = get_issues_project_items_query(["I_1", "I_2"])
+
+    # Assert
+    leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
+    assert 'nodes(ids: ["I_1", "I_2"])' in actual_query
+    assert f"projectItems(first: {PROJECT_ITEMS_PER_ISSUE_LIMIT}, includeArchived: false)" in actual_query
+    assert 'moscow: fieldValueByName(name: "MoSCoW")' in actual_query
+    assert "fieldValues" not in actual_query
+    assert "hasNextPage" in actual_query
+    assert not leftover_placeholders
+
+
+# get_issue_project_items_query
+
+
+def test_get_issue_project_items_query():
+    # Act
+    actual_query = get_issue_project_items_query("I_1", 'after: "c1"')
+
+    # Assert
+    leftover_placeholders = re.findall(r"\{\w+\}", actual_query)
+    assert 'node(id: "I_1")' in actual_query
+    assert f'projectItems(first: {PROJECT_ITEMS_PER_ISSUE_LIMIT}, after: "c1", includeArchived: false)' in actual_query
+    assert "fragment ProjectItemFieldValues on ProjectV2Item {" in actual_query
+    assert not leftover_placeholders
+
+
+def test_validate_query_formats_correct_format():
+    assert validate_query_formats() is True
+
+
 def test_validate_query_formats_invalid_format(mocker):
     # Arrange
     mocker.patch("utils.github_project_queries.validate_query_format", side_effect=InvalidQueryFormatError)
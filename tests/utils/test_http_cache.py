@@ -0,0 +1,201 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.http_cache import CachingHTTPAdapter, ConditionalRequestCache
+
+URL = "https://api.github.com/repos/test_org/test_repo"
+
+
+def _request(method: str = "GET", token: str = "token123") -> requests.PreparedRequest:
+    return requests.Request(method, URL, headers={"Authorization": f"token {token}"}).prepare()
+
+
+def _response(request: requests.PreparedRequest, status_code: int, headers: dict, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = request.url
+    response.request = request
+    response._content = content
+    response.connection = None
+    return response
+
+
+# CachingHTTPAdapter
+
+
+def test_send_stores_and_replays_not_modified_response(mocker, tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    adapter = CachingHTTPAdapter(cache)
+    sent_requests = []
+
+    def fake_send(_adapter, request, **_kwargs):
+        sent_requests.append(request.copy())
+        if len(sent_requests) == 1:
+            return _response(request, 200, {"ETag": '"abc"', "Content-Type": "application/json"}, b'{"id": 1}')
+        return _response(request, 304, {"ETag": '"abc"', "X-RateLimit-Remaining": "4999"}, b"")
+
+    mocker.patch("requests.adapters.HTTPAdapter.send", autospec=True, side_effect=fake_send)
+
+    # Act
+    first = adapter.send(_request())
+    second = adapter.send(_request())
+
+    # Assert
+    assert {"id": 1} == first.json()
+    assert 200 == second.status_code
+    assert {"id": 1} == second.json()
+    assert "4999" == second.headers["X-RateLimit-Remaining"]
+    assert "If-None-Match" not in sent_requests[0].headers
+    assert '"abc"' == sent_requests[1].headers["If-None-Match"]
+    assert 1 == cache.hits
+    assert 1 == cache.misses
+
+
+def test_send_without_validators_is_not_cached(mocker, tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    adapter = CachingHTTPAdapter(cache)
+    mock_send = mocker.patch(
+        "requests.adapters.HTTPAdapter.send",
+        autospec=True,
+        side_effect=lambda _adapter, request, **_kwargs: _response(request, 200, {}, b"{}"),
+    )
+
+    # Act
+    adapter.send(_request())
+    adapter.send(_request())
+
+    # Assert
+    assert "If-None-Match" not in mock_send.call_args.args[1].headers
+    assert [] == list(tmp_path.iterdir())
+
+
+def test_send_post_bypasses_cache(mocker, tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    adapter = CachingHTTPAdapter(cache)
+    mocker.patch(
+        "requests.adapters.HTTPAdapter.send",
+        autospec=True,
+        side_effect=lambda _adapter, request, **_kwargs: _response(request, 200, {"ETag": '"abc"'}, b"{}"),
+    )
+
+    # Act
+    adapter.send(_request("POST"))
+
+    # Assert
+    assert [] == list(tmp_path.iterdir())
+    assert 0 == cache.misses
+
+
+# ConditionalRequestCache
+
+
+def test_make_key_differs_per_authorization(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+
+    # Act
+    first = cache.make_key(_request(token="token123"))
+    second = cache.make_key(_request(token="token456"))
+
+    # Assert
+    assert first != second
+    assert first == cache.make_key(_request(token="token123"))
+
+
+def test_make_key_with_identity_is_stable_across_tokens(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    other_cache = ConditionalRequestCache(str(tmp_path))
+    cache.set_identity("user:test_user")
+    other_cache.set_identity("user:other_user")
+
+    # Act
+    first = cache.make_key(_request(token="token123"))
+    second = cache.make_key(_request(token="token456"))
+
+    # Assert
+    assert first == second
+    assert first != other_cache.make_key(_request(token="token123"))
+
+
+def _write_entry(directory, name: str, size: int, age_seconds: float) -> None:
+    path = directory / name
+    path.write_text("x" * size)
+    used_at = time.time() - age_seconds
+    os.utime(path, (used_at, used_at))
+
+
+def test_prune_removes_stale_entries(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    _write_entry(tmp_path, "fresh.json", 10, 60)
+    _write_entry(tmp_path, "stale.json", 10, 7200)
+    _write_entry(tmp_path, "fresh.json.1.tmp", 10, 60)
+
+    # Act
+    actual = cache.prune(max_age_seconds=3600, max_size_bytes=1000)
+
+    # Assert
+    assert 2 == actual
+    assert ["fresh.json"] == sorted(path.name for path in tmp_path.iterdir())
+
+
+def test_prune_removes_least_recently_used_entries_above_size_limit(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    _write_entry(tmp_path, "oldest.json", 100, 300)
+    _write_entry(tmp_path, "older.json", 100, 200)
+    _write_entry(tmp_path, "newest.json", 100, 100)
+
+    # Act
+    actual = cache.prune(max_age_seconds=3600, max_size_bytes=250)
+
+    # Assert
+    assert 1 == actual
+    assert ["newest.json", "older.json"] == sorted(path.name for path in tmp_path.iterdir())
+
+
+def test_touch_marks_entry_as_used(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    _write_entry(tmp_path, "entry.json", 10, 7200)
+
+    # Act
+    cache.touch("entry")
+
+    # Assert
+    assert 0 == cache.prune(max_age_seconds=3600, max_size_bytes=1000)
+
+
+def test_get_unreadable_entry(tmp_path):
+    # Arrange
+    cache = ConditionalRequestCache(str(tmp_path))
+    (tmp_path / "broken.json").write_text("{broken")
+
+    # Act
+    actual = cache.get("broken")
+
+    # Assert
+    assert actual is None
@@ -0,0 +1,176 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import json
+
+import pytest
+
+from utils import json_codec
+
+DOCUMENT = {"title": "Žluťoučký kůň", "labels": ["DocumentedFeature"], "number": 1}
+
+
+# stdlib backend
+
+
+def test_stdlib_round_trip(mocker):
+    # Arrange
+    mocker.patch("utils.json_codec._ORJSON", None)
+
+    # Act
+    actual = json_codec.loads(json_codec.dumps(DOCUMENT).encode("utf-8"))
+
+    # Assert
+    assert DOCUMENT == actual
+    assert "json" == json_codec.get_backend_name()
+
+
+def test_stdlib_dump_keeps_indentation_and_non_ascii(mocker):
+    # Arrange
+    mocker.patch("utils.json_codec._ORJSON", None)
+    f = io.StringIO()
+
+    # Act
+    json_codec.dump(DOCUMENT, f, indent=4)
+
+    # Assert
+    assert json.dumps(DOCUMENT, indent=4, ensure_ascii=False) == f.getvalue()
+
+
+def test_loads_invalid_document(mocker):
+    # Arrange
+    mocker.patch("utils.json_codec._ORJSON", None)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        json_codec.loads(b"<html>Bad Gateway</html>")
+
+
+# orjson backend
+
+
+def test_orjson_used_when_installed(mocker):
+    # Arrange
+    mock_orjson = mocker.Mock(OPT_INDENT_2=2)
+    mock_orjson.loads.return_value = DOCUMENT
+    mock_orjson.dumps.return_value = b"{}"
+    mocker.patch("utils.json_codec._ORJSON", mock_orjson)
+
+    # Act
+    loaded = json_codec.loads(b"{}")
+    dumped = json_codec.dumps(DOCUMENT)
+
+    # Assert
+    assert DOCUMENT == loaded
+    assert "{}" == dumped
+    assert "orjson" == json_codec.get_backend_name()
+    mock_orjson.dumps.assert_called_once_with(DOCUMENT, option=0)
+
+
+def test_orjson_not_used_for_unsupported_indentation(mocker):
+    # Arrange
+    mock_orjson = mocker.Mock()
+    mocker.patch("utils.json_codec._ORJSON", mock_orjson)
+    f = io.StringIO()
+
+    # Act
+    json_codec.dump(DOCUMENT, f, indent=4)
+
+    # Assert
+    mock_orjson.dumps.assert_not_called()
+    assert json.dumps(DOCUMENT, indent=4, ensure_ascii=False) == f.getvalue()
+
+
+# dump_to_file
+
+
+def test_dump_to_file(tmp_path):
+    # Arrange
+    file_path = tmp_path / "cache" / "snapshot.json"
+
+    # Act
+    json_codec.dump_to_file(DOCUMENT, str(file_path))
+
+    # Assert
+    assert DOCUMENT == json.loads(file_path.read_text(encoding="utf-8"))
+    assert not (tmp_path / "cache" / "snapshot.json.tmp").exists()
+
+
+# dump_streamed
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {},
+        {"items": [], "metadata": {}, "warnings": []},
+        {"items": [DOCUMENT, {"nested": {"list": [1, [], {}], "text": "line\nbreak"}}], "warnings": ["Ω"]},
+    ],
+)
+def test_dump_streamed_is_byte_compatible(document):
+    # Arrange
+    f = io.StringIO()
+    fields = [(key, iter(value)) if key == "items" else (key, value) for key, value in document.items()]
+
+    # Act
+    json_codec.dump_streamed(fields, f, indent=4)
+
+    # Assert
+    assert json.dumps(document, indent=4, ensure_ascii=False) == f.getvalue()
+
+
+def test_dump_streamed_compact(mocker):
+    # Arrange
+    mocker.patch("utils.json_codec._ORJSON", None)
+    document = {"items": [DOCUMENT, {}], "metadata": {"a": [1, 2]}, "warnings": []}
+    f = io.StringIO()
+    fields = [(key, iter(value)) if key == "items" else (key, value) for key, value in document.items()]
+
+    # Act
+    json_codec.dump_streamed(fields, f, indent=None)
+
+    # Assert
+    assert json.dumps(document, separators=(",", ":"), ensure_ascii=False) == f.getvalue()
+
+
+def test_dump_streamed_encoded_elements():
+    # Arrange
+    document = {"items": [DOCUMENT, {"nested": [1, 2]}]}
+    encoded_elements = iter(json_codec.EncodedJSON(json.dumps(item, indent=4, ensure_ascii=False)) for item in document["items"])
+    f = io.StringIO()
+
+    # Act
+    json_codec.dump_streamed([("items", encoded_elements)], f, indent=4)
+
+    # Assert
+    assert json.dumps(document, indent=4, ensure_ascii=False) == f.getvalue()
+
+
+def test_dump_streamed_consumes_items_lazily():
+    # Arrange
+    f = io.StringIO()
+    written_lengths = []
+
+    def items():
+        for number in range(3):
+            written_lengths.append(len(f.getvalue()))
+            yield {"number": number}
+
+    # Act
+    json_codec.dump_streamed([("items", items())], f)
+
+    # Assert
+    assert written_lengths[0] < written_lengths[1] < written_lengths[2]
@@ -0,0 +1,132 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from datetime import datetime, timezone
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from utils.constants import RATE_LIMIT_RESET_MARGIN_SECONDS
+from utils.rate_limiter import HeaderRateLimiter
+
+NOW = 1_700_000_000.0
+
+
+def _response(headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.headers = CaseInsensitiveDict(headers)
+    return response
+
+
+# HeaderRateLimiter
+
+
+def test_wrapped_method_never_queries_rate_limit(mocker):
+    # Arrange
+    mock_github = mocker.Mock()
+    rate_limiter = HeaderRateLimiter(mock_github)
+    method = mocker.Mock(return_value="result")
+
+    # Act
+    actual = rate_limiter(method)("arg", key="value")
+
+    # Assert
+    assert "result" == actual
+    method.assert_called_once_with("arg", key="value")
+    mock_github.get_rate_limit.assert_not_called()
+
+
+def test_observe_sleeps_until_reset_when_budget_exhausted(mocker):
+    # Arrange
+    mocker.patch("utils.rate_limiter.time.time", return_value=NOW)
+    mock_sleep = mocker.patch("utils.rate_limiter.time.sleep")
+    rate_limiter = HeaderRateLimiter(mocker.Mock(), min_remaining=5)
+    headers = {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": str(int(NOW) + 60), "X-RateLimit-Resource": "core"}
+
+    # Act
+    rate_limiter.observe(_response(headers))
+
+    # Assert
+    mock_sleep.assert_called_once_with(60 + RATE_LIMIT_RESET_MARGIN_SECONDS)
+    assert 4 == rate_limiter.get_remaining("core")
+
+
+def test_observe_does_not_sleep_with_enough_budget(mocker):
+    # Arrange
+    mocker.patch("utils.rate_limiter.time.time", return_value=NOW)
+    mock_sleep = mocker.patch("utils.rate_limiter.time.sleep")
+    rate_limiter = HeaderRateLimiter(mocker.Mock(), min_remaining=5)
+    headers = {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(int(NOW) + 60)}
+
+    # Act
+    rate_limiter.observe(_response(headers))
+    rate_limiter.observe(_response({}))
+
+    # Assert
+    mock_sleep.assert_not_called()
+    assert 4999 == rate_limiter.get_remaining("core")
+    assert rate_limiter.get_remaining("graphql") is None
+
+
+def test_observe_ignores_exhausted_budget_after_reset(mocker):
+    # Arrange
+    mocker.patch("utils.rate_limiter.time.time", return_value=NOW)
+    mock_sleep = mocker.patch("utils.rate_limiter.time.sleep")
+    rate_limiter = HeaderRateLimiter(mocker.Mock(), min_remaining=5)
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(NOW) - 1)}
+
+    # Act
+    rate_limiter.observe(_response(headers))
+
+    # Assert
+    mock_sleep.assert_not_called()
+
+
+def test_observe_honours_retry_after(mocker):
+    # Arrange
+    mocker.patch("utils.rate_limiter.time.time", return_value=NOW)
+    mock_sleep = mocker.patch("utils.rate_limiter.time.sleep")
+    rate_limiter = HeaderRateLimiter(mocker.Mock())
+
+    # Act
+    rate_limiter.observe(_response({"Retry-After": "30"}))
+
+    # Assert
+    mock_sleep.assert_called_once_with(30)
+
+
+def test_record_graphql_cost_paces_only_graphql(mocker):
+    # Arrange
+    mocker.patch("utils.rate_limiter.time.time", return_value=NOW)
+    mock_sleep = mocker.patch("utils.rate_limiter.time.sleep")
+    rate_limiter = HeaderRateLimiter(mocker.Mock(), min_remaining=5)
+    reset_at = datetime.fromtimestamp(NOW + 60, tz=timezone.utc).isoformat()
+
+    # Act
+    rate_limiter.record_graphql_cost({"cost": 3, "remaining": 2, "resetAt": reset_at})
+    rate_limiter.record_graphql_cost({"cost": 1, "remaining": 1, "resetAt": reset_at})
+    rate_limiter.record_graphql_cost(None)
+    rate_limiter.wait("core")
+
+    # Assert
+    assert 4 == rate_limiter.graphql_cost
+    assert 1 == rate_limiter.get_remaining("graphql")
+    mock_sleep.assert_not_called()
+
+    # Act
+    rate_limiter.wait("graphql")
+
+    # Assert
+    mock_sleep.assert_called_once_with(60 + RATE_LIMIT_RESET_MARGIN_SECONDS)
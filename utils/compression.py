@@ -0,0 +1,88 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the helpers for writing output files compressed on the fly.
+gzip is always available, zstd is used from the standard library (Python 3.14+) or the zstandard package.
+"""
+
+import gzip
+import importlib
+from types import ModuleType
+from typing import Optional, TextIO
+
+from utils.constants import OUTPUT_GZIP_COMPRESS_LEVEL, OutputCompression
+
+
+def _import_zstd() -> Optional[ModuleType]:
+    """
+    Import the first available zstd module.
+
+    @return: The zstd module, None if zstd is not available.
+    """
+    for module_name in ("compression.zstd", "zstandard"):
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            continue
+    return None
+
+
+_ZSTD: Optional[ModuleType] = _import_zstd()
+
+FILE_EXTENSIONS = {
+    OutputCompression.NONE.value: "",
+    OutputCompression.GZIP.value: ".gz",
+    OutputCompression.ZSTD.value: ".zst",
+}
+
+
+def is_available(compression: str) -> bool:
+    """
+    Check if the compression can be used in the current environment.
+
+    @param compression: The compression name.
+    @return: True if the compression is supported and available, False otherwise.
+    """
+    if compression == OutputCompression.ZSTD.value:
+        return _ZSTD is not None
+    return compression in FILE_EXTENSIONS
+
+
+def get_file_path(file_path: str, compression: str) -> str:
+    """
+    Get the path of the file with the extension of the compression.
+
+    @param file_path: The path of the uncompressed file.
+    @param compression: The compression name.
+    @return: The path of the compressed file.
+    """
+    return file_path + FILE_EXTENSIONS[compression]
+
+
+def open_text_file(file_path: str, compression: str) -> TextIO:
+    """
+    Open the UTF-8 text file for writing, the written text is compressed on the fly.
+
+    @param file_path: The path of the file, including the extension of the compression.
+    @param compression: The compression name.
+    @return: The text file opened for writing.
+    """
+    if compression == OutputCompression.GZIP.value:
+        return gzip.open(file_path, "wt", encoding="utf-8", compresslevel=OUTPUT_GZIP_COMPRESS_LEVEL)
+    if compression == OutputCompression.ZSTD.value and _ZSTD is not None:
+        return _ZSTD.open(file_path, "wt", encoding="utf-8")
+    return open(file_path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
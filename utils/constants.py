@@ -44,6 +44,18 @@ VERBOSE_LOGGING = "VERBOSE_LOGGING"
 # doc-issues mode Action inputs
 DOC_ISSUES_PROJECT_STATE_MINING = "DOC_ISSUES_PROJECT_STATE_MINING"
 DOC_ISSUES_REPOSITORIES = "DOC_ISSUES_REPOSITORIES"
+DOC_ISSUES_CONCURRENCY = "DOC_ISSUES_CONCURRENCY"
+DOC_ISSUES_INCREMENTAL = "DOC_ISSUES_INCREMENTAL"
+DOC_ISSUES_SNAPSHOT_PATH = "DOC_ISSUES_SNAPSHOT_PATH"
+DOC_ISSUES_HTTP_CACHE = "DOC_ISSUES_HTTP_CACHE"
+DOC_ISSUES_HTTP_CACHE_PATH = "DOC_ISSUES_HTTP_CACHE_PATH"
+DOC_ISSUES_OUTPUT_FORMAT = "DOC_ISSUES_OUTPUT_FORMAT"
+DOC_ISSUES_OUTPUT_COMPRESSION = "DOC_ISSUES_OUTPUT_COMPRESSION"
+DOC_ISSUES_OUTPUT_COMPACT = "DOC_ISSUES_OUTPUT_COMPACT"
+DOC_ISSUES_OUTPUT_WORKERS = "DOC_ISSUES_OUTPUT_WORKERS"
+DOC_ISSUES_PARSE_CACHE = "DOC_ISSUES_PARSE_CACHE"
+DOC_ISSUES_BODY_SECTIONS = "DOC_ISSUES_BODY_SECTIONS"
+DOC_ISSUES_PARSE_CACHE_PATH = "DOC_ISSUES_PARSE_CACHE_PATH"
 
 # Supported issue labels
 DOC_USER_STORY_LABEL = "DocumentedUserStory"
@@ -57,28 +69,203 @@ class Mode(Enum):
     DOC_ISSUES = "DOC_ISSUES"
 
 
+# Output file formats of the doc-issues mode
+class OutputFormat(Enum):
+    JSON = "json"
+    JSONL = "jsonl"
+
+
+# Fields of every output item, the parsed issue body sections are added to them
+ADAPTER_ITEM_FIELDS = ["id", "title", "state", "tags", "url", "timestamps"]
+
+
+# Content kinds of the issue body sections
+class BodySectionKind(Enum):
+    TEXT = "text"
+    BULLET_LIST = "bullet-list"
+    TABLE = "table"
+
+
+# Compressions of the doc-issues mode output file
+class OutputCompression(Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
 # Regime output paths
 DOC_ISSUES_OUTPUT_PATH = "./output/doc-issues"
+DOC_ISSUES_SNAPSHOT_DEFAULT_PATH = "./.living-doc-cache/doc-issues-snapshot.json"
+DOC_ISSUES_HTTP_CACHE_DEFAULT_PATH = "./.living-doc-cache/http"
+DOC_ISSUES_PARSE_CACHE_DEFAULT_PATH = "./.living-doc-cache/doc-issues-parse-cache.json"
+DOC_ISSUES_OUTPUT_FILE_NAME = "doc-issues"
+DOC_ISSUES_SIDECAR_FILE_NAME = "doc-issues.metadata.json"
+DOC_ISSUES_OUTPUT_INDENT = 4
+# Balanced gzip level, the highest levels are several times slower for a few percent smaller output
+OUTPUT_GZIP_COMPRESS_LEVEL = 6
+# Output items built by a single worker process task, and tasks queued per worker to keep the workers busy
+OUTPUT_WORKERS_CHUNK_SIZE = 500
+OUTPUT_WORKERS_CHUNKS_IN_FLIGHT = 2
+
+# Incremental mining constants
+SNAPSHOT_VERSION = 2
+# Safety margin against clock skew between the runner and GitHub, re-fetching a few issues is cheap
+SNAPSHOT_SINCE_OVERLAP_MINUTES = 5
+# Repositories are mined fully again after this period, so deleted and transferred issues leave the snapshot
+SNAPSHOT_FULL_REFRESH_DAYS = 7
+
+# Parse cache constants - the least recently used parsed bodies above the size limit of the encoded cache are evicted
+PARSE_CACHE_MAX_SIZE_MB = 64
+
+# HTTP cache constants - entries not used for longer than the maximum age, or above the size limit, are pruned
+HTTP_CACHE_MAX_AGE_DAYS = 30
+HTTP_CACHE_MAX_SIZE_MB = 512
 
 
 # GitHub API constants
 ISSUES_PER_PAGE_LIMIT = 100
-ISSUE_STATE_ALL = "all"
+PROJECTS_PER_PAGE_LIMIT = 100
+# Number of issues resolving their project items by a single GraphQL query (issue-side project lookup)
+PROJECT_ITEMS_BATCH_SIZE = 50
+# Project items read per issue and page in the issue-side project lookup, an issue is rarely part of more projects
+PROJECT_ITEMS_PER_ISSUE_LIMIT = 20
+# Number of issues audited by a single GraphQL query
+AUDIT_BATCH_SIZE = 50
+
+# Rate limit pacing - calls kept in reserve per worker and extra seconds waited after the reset time
+RATE_LIMIT_MIN_REMAINING = 5
+RATE_LIMIT_RESET_MARGIN_SECONDS = 5
+GRAPHQL_MAX_RETRIES = 3
+ISSUES_FROM_REPO_QUERY = """
+                query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  repository(owner: "{organization_name}", name: "{repository_name}") {{
+                    issues(first: {issues_per_page}, labels: [{labels}], states: [OPEN, CLOSED], {after_argument}) {{
+                      pageInfo {{
+                        endCursor
+                        hasNextPage
+                      }}
+                      nodes {{
+                        id
+                        number
+                        title
+                        state
+                        body
+                        url
+                        createdAt
+                        updatedAt
+                        closedAt
+                        author {{
+                          login
+                        }}
+                        comments {{
+                          totalCount
+                        }}
+                        labels(first: 100) {{
+                          nodes {{
+                            name
+                          }}
+                        }}
+                      }}
+                    }}
+                  }}
+                }}
+                """
+ISSUES_UPDATED_SINCE_FROM_REPO_QUERY = """
+                query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  repository(owner: "{organization_name}", name: "{repository_name}") {{
+                    issues(first: {issues_per_page}, filterBy: {{since: "{since}"}}, states: [OPEN, CLOSED], {after_argument}) {{
+                      pageInfo {{
+                        endCursor
+                        hasNextPage
+                      }}
+                      nodes {{
+                        id
+                        number
+                        title
+                        state
+                        body
+                        url
+                        createdAt
+                        updatedAt
+                        closedAt
+                        author {{
+                          login
+                        }}
+                        comments {{
+                          totalCount
+                        }}
+                        labels(first: 100) {{
+                          nodes {{
+                            name
+                          }}
+                        }}
+                      }}
+                    }}
+                  }}
+                }}
+                """
 PROJECTS_FROM_REPO_QUERY = """
                 query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
                   repository(owner: "{organization_name}", name: "{repository_name}") {{
-                    projectsV2(first: 100) {{
+                    projectsV2(first: {projects_per_page}, {after_argument}) {{
+                      pageInfo {{
+                        endCursor
+                        hasNextPage
+                      }}
                       nodes {{
                         id
                         number
                         title
+                        items {{
+                          totalCount
+                        }}
                       }}
                     }}
                   }}
                 }}
                 """
+# Single select project fields mapped onto the project status of an issue, by the alias used in the item queries
+PROJECT_STATUS_FIELDS = {"status": "Status", "priority": "Priority", "size": "Size", "moscow": "MoSCoW"}
+# Only the values of the project status fields are requested for every project item, shared as a GraphQL fragment
+PROJECT_ITEM_FIELD_VALUE_SELECTION = """
+                  {alias}: fieldValueByName(name: "{field_name}") {{{{
+                    ... on ProjectV2ItemFieldSingleSelectValue {{{{
+                      name
+                    }}}}
+                  }}}}"""
+PROJECT_ITEM_FIELD_VALUES_FRAGMENT = (
+    """
+                fragment ProjectItemFieldValues on ProjectV2Item {{"""
+    + "".join(
+        PROJECT_ITEM_FIELD_VALUE_SELECTION.format(alias=alias, field_name=field_name)
+        for alias, field_name in PROJECT_STATUS_FIELDS.items()
+    )
+    + """
+                }}
+                """
+)
 ISSUES_FROM_PROJECT_QUERY = """
                 query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
                   node(id: "{project_id}") {{
                     ... on ProjectV2 {{
                       items(first: {issues_per_page}, {after_argument}) {{
@@ -89,8 +276,6 @@ ISSUES_FROM_PROJECT_QUERY = """
                         nodes {{
                           content {{
                               ... on Issue {{
-                                title
-                                state
                                 number
                                 repository {{
                                   name
@@ -100,36 +285,224 @@ ISSUES_FROM_PROJECT_QUERY = """
                                 }}
                               }}
                             }}
-                          fieldValues(first: 100) {{
-                            nodes {{
-                              __typename
-                              ... on ProjectV2ItemFieldSingleSelectValue {{
-                                name
-                              }}
-                            }}
+                          ...ProjectItemFieldValues
+                        }}
+                      }}
+                    }}
+                  }}
+                }}
+                """ + PROJECT_ITEM_FIELD_VALUES_FRAGMENT
+ISSUES_PROJECT_ITEMS_QUERY = """
+                query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  nodes(ids: [{node_ids}]) {{
+                    ... on Issue {{
+                      id
+                      number
+                      repository {{
+                        name
+                        owner {{
+                          login
+                        }}
+                      }}
+                      projectItems(first: {project_items_per_issue}, includeArchived: false) {{
+                        pageInfo {{
+                          endCursor
+                          hasNextPage
+                        }}
+                        nodes {{
+                          project {{
+                            id
+                          }}
+                          ...ProjectItemFieldValues
+                        }}
+                      }}
+                    }}
+                  }}
+                }}
+                """ + PROJECT_ITEM_FIELD_VALUES_FRAGMENT
+ISSUE_PROJECT_ITEMS_QUERY = """
+                query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  node(id: "{node_id}") {{
+                    ... on Issue {{
+                      projectItems(first: {project_items_per_issue}, {after_argument}, includeArchived: false) {{
+                        pageInfo {{
+                          endCursor
+                          hasNextPage
+                        }}
+                        nodes {{
+                          project {{
+                            id
                           }}
+                          ...ProjectItemFieldValues
                         }}
                       }}
                     }}
                   }}
                 }}
+                """ + PROJECT_ITEM_FIELD_VALUES_FRAGMENT
+# Audit-relevant timeline items, shared by the audit queries as a GraphQL fragment
+AUDIT_TIMELINE_ITEM_TYPES = """[
+                          LABELED_EVENT
+                          UNLABELED_EVENT
+                          ASSIGNED_EVENT
+                          UNASSIGNED_EVENT
+                          MILESTONED_EVENT
+                          DEMILESTONED_EVENT
+                          REOPENED_EVENT
+                          CLOSED_EVENT
+                        ]"""
+AUDIT_TIMELINE_ITEM_FRAGMENT = """
+                fragment AuditTimelineItem on IssueTimelineItems {{
+                  __typename
+                  ... on LabeledEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    label {{
+                      name
+                    }}
+                  }}
+                  ... on UnlabeledEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    label {{
+                      name
+                    }}
+                  }}
+                  ... on AssignedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    assignee {{
+                      ... on Actor {{
+                        login
+                      }}
+                    }}
+                  }}
+                  ... on UnassignedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    assignee {{
+                      ... on Actor {{
+                        login
+                      }}
+                    }}
+                  }}
+                  ... on MilestonedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    milestoneTitle
+                  }}
+                  ... on DemilestonedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                    milestoneTitle
+                  }}
+                  ... on ReopenedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                  }}
+                  ... on ClosedEvent {{
+                    createdAt
+                    actor {{
+                      login
+                    }}
+                  }}
+                }}
                 """
-PROJECT_FIELD_OPTIONS_QUERY = """
+ISSUES_AUDIT_QUERY = (
+    """
                 query {{
-                  repository(owner: "{organization_name}", name: "{repository_name}") {{
-                    projectV2(number: {project_number}) {{
-                      title
-                      fields(first: 100) {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  nodes(ids: [{node_ids}]) {{
+                    ... on Issue {{
+                      id
+                      author {{
+                        login
+                      }}
+                      comments(last: 1) {{
+                        totalCount
                         nodes {{
-                          ... on ProjectV2SingleSelectField {{
-                            name
-                            options {{
-                              name
-                            }}
+                          createdAt
+                          author {{
+                            login
                           }}
                         }}
                       }}
+                      timelineItems(
+                        first: {timeline_items_per_page}
+                        itemTypes: """
+    + AUDIT_TIMELINE_ITEM_TYPES
+    + """
+                      ) {{
+                        pageInfo {{
+                          endCursor
+                          hasNextPage
+                        }}
+                        nodes {{
+                          ...AuditTimelineItem
+                        }}
+                      }}
+                    }}
+                  }}
+                }}
+                """
+    + AUDIT_TIMELINE_ITEM_FRAGMENT
+)
+ISSUE_TIMELINE_ITEMS_QUERY = (
+    """
+                query {{
+                  rateLimit {{
+                    cost
+                    remaining
+                    resetAt
+                  }}
+                  node(id: "{node_id}") {{
+                    ... on Issue {{
+                      timelineItems(
+                        first: {timeline_items_per_page}
+                        {after_argument}
+                        itemTypes: """
+    + AUDIT_TIMELINE_ITEM_TYPES
+    + """
+                      ) {{
+                        pageInfo {{
+                          endCursor
+                          hasNextPage
+                        }}
+                        nodes {{
+                          ...AuditTimelineItem
+                        }}
+                      }}
                     }}
                   }}
                 }}
                 """
+    + AUDIT_TIMELINE_ITEM_FRAGMENT
+)
@@ -28,5 +28,9 @@ class FetchRepositoriesException(LivingDocumentationCollectorException):
     """Raised when fetching repositories fails in get_repositories()."""
 
 
+class FetchBodySectionsException(LivingDocumentationCollectorException):
+    """Raised when fetching additional issue body sections fails in get_body_sections()."""
+
+
 class InvalidQueryFormatError(LivingDocumentationCollectorException):
     """Raised when a query string is missing or has unexpected placeholders."""
@@ -0,0 +1,135 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the PyGithub connection class, which allows one GitHub instance to be used from several threads.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+import requests
+from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass, Requester
+
+from utils.http_cache import CachingHTTPAdapter, ConditionalRequestCache
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class SharedSessionHTTPSConnection(HTTPSRequestsConnectionClass):
+    """
+    A PyGithub HTTPS connection sending all requests through one shared requests Session.
+
+    PyGithub stores the pending request on its single persistent connection object, so concurrent calls
+    would overwrite each other. Once this class is injected, PyGithub creates a connection object per request,
+    while the shared Session keeps the pooled (keep-alive) connections between them.
+    """
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    _http_cache: Optional[ConditionalRequestCache] = None
+    _response_hook: Optional[Callable[..., Any]] = None
+
+    # pylint: disable=super-init-not-called, too-many-arguments, too-many-positional-arguments
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int] = None,
+        strict: bool = False,
+        timeout: Optional[int] = None,
+        retry: Any = None,
+        pool_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.port = port if port else 443
+        self.host = host
+        self.protocol = "https"
+        self.timeout = timeout
+        self.verify = kwargs.get("verify", True)
+        self.retry = retry if retry is not None else requests.adapters.DEFAULT_RETRIES
+        self.pool_size = pool_size if pool_size is not None else requests.adapters.DEFAULT_POOLSIZE
+        self.session = self.get_session(self.retry, self.pool_size)
+
+    @classmethod
+    def get_session(cls, retry: Any, pool_size: int) -> requests.Session:
+        """
+        Get the shared requests Session, create it on the first call.
+
+        @param retry: The retry configuration of the session adapter.
+        @param pool_size: The maximum number of pooled connections.
+        @return: The shared requests Session.
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                # Same as PyGithub: a defined auth disables the fallback to the .netrc file
+                session.auth = Requester.noopAuth
+                adapter: requests.adapters.HTTPAdapter
+                if cls._http_cache is not None:
+                    adapter = CachingHTTPAdapter(
+                        cls._http_cache, max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+                    )
+                else:
+                    adapter = requests.adapters.HTTPAdapter(
+                        max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+                    )
+                session.mount("https://", adapter)
+                if cls._response_hook is not None:
+                    session.hooks["response"].append(cls._response_hook)
+                cls._session = session
+                logger.debug("Shared GitHub session created with pool size `%i`.", pool_size)
+
+            return cls._session
+
+    def close(self) -> None:
+        """The shared Session outlives the connection object, so there is nothing to close."""
+
+    @classmethod
+    def install(
+        cls,
+        http_cache: Optional[ConditionalRequestCache] = None,
+        response_hook: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        """
+        Make PyGithub use the shared session connection for all HTTPS requests.
+        PyGithub copies the connection class when its Requester is created, so the class has to be installed
+        before the GitHub instance is created.
+
+        @param http_cache: The conditional request cache used by the shared session, None to disable caching.
+        @param response_hook: The requests response hook called for every response (e.g. rate limit pacing).
+        @return: None
+        """
+        with cls._session_lock:
+            # The session is created again on the next request, so it picks up the new configuration
+            cls._http_cache = http_cache
+            cls._response_hook = response_hook
+            cls._session = None
+        Requester.injectConnectionClasses(HTTPRequestsConnectionClass, SharedSessionHTTPSConnection)
+
+    @classmethod
+    def set_response_hook(cls, response_hook: Optional[Callable[..., Any]]) -> None:
+        """
+        Set the response hook of the shared session, e.g. when the hook owner can be created only after
+        the GitHub instance, which has to be created after the connection class is installed.
+
+        @param response_hook: The requests response hook called for every response, None to remove it.
+        @return: None
+        """
+        with cls._session_lock:
+            cls._response_hook = response_hook
+            cls._session = None
@@ -18,13 +18,22 @@
 This module contains methods for formatting the GitHub GraphQL queries.
 """
 
+import json
+
 from utils.exceptions import InvalidQueryFormatError
 from utils.utils import validate_query_format
 from utils.constants import (
     PROJECTS_FROM_REPO_QUERY,
     ISSUES_FROM_PROJECT_QUERY,
-    PROJECT_FIELD_OPTIONS_QUERY,
+    ISSUES_FROM_REPO_QUERY,
+    ISSUES_UPDATED_SINCE_FROM_REPO_QUERY,
+    ISSUES_AUDIT_QUERY,
+    ISSUE_TIMELINE_ITEMS_QUERY,
+    ISSUES_PROJECT_ITEMS_QUERY,
+    ISSUE_PROJECT_ITEMS_QUERY,
     ISSUES_PER_PAGE_LIMIT,
+    PROJECTS_PER_PAGE_LIMIT,
+    PROJECT_ITEMS_PER_ISSUE_LIMIT,
 )
 
 
@@ -34,17 +43,35 @@ def validate_query_formats() -> bool:
     @return: True if the queries are in the correct format, False otherwise
     """
     try:
-        validate_query_format(PROJECTS_FROM_REPO_QUERY, {"organization_name", "repository_name"})
+        validate_query_format(
+            PROJECTS_FROM_REPO_QUERY, {"organization_name", "repository_name", "projects_per_page", "after_argument"}
+        )
         validate_query_format(ISSUES_FROM_PROJECT_QUERY, {"project_id", "issues_per_page", "after_argument"})
-        validate_query_format(PROJECT_FIELD_OPTIONS_QUERY, {"organization_name", "repository_name", "project_number"})
+        validate_query_format(
+            ISSUES_FROM_REPO_QUERY,
+            {"organization_name", "repository_name", "issues_per_page", "labels", "after_argument"},
+        )
+        validate_query_format(
+            ISSUES_UPDATED_SINCE_FROM_REPO_QUERY,
+            {"organization_name", "repository_name", "issues_per_page", "since", "after_argument"},
+        )
+        validate_query_format(ISSUES_AUDIT_QUERY, {"node_ids", "timeline_items_per_page"})
+        validate_query_format(ISSUE_TIMELINE_ITEMS_QUERY, {"node_id", "timeline_items_per_page", "after_argument"})
+        validate_query_format(ISSUES_PROJECT_ITEMS_QUERY, {"node_ids", "project_items_per_issue"})
+        validate_query_format(ISSUE_PROJECT_ITEMS_QUERY, {"node_id", "project_items_per_issue", "after_argument"})
     except InvalidQueryFormatError:
         return False
     return True
 
 
-def get_projects_from_repo_query(organization_name: str, repository_name: str) -> str:
+def get_projects_from_repo_query(organization_name: str, repository_name: str, after_argument: str) -> str:
     """Update the placeholder values and format the GraphQL query."""
-    return PROJECTS_FROM_REPO_QUERY.format(organization_name=organization_name, repository_name=repository_name)
+    return PROJECTS_FROM_REPO_QUERY.format(
+        organization_name=organization_name,
+        repository_name=repository_name,
+        projects_per_page=PROJECTS_PER_PAGE_LIMIT,
+        after_argument=after_argument,
+    )
 
 
 def get_issues_from_project_query(project_id: str, after_argument: str) -> str:
@@ -54,8 +81,57 @@ def get_issues_from_project_query(project_id: str, after_argument: str) -> str:
     )
 
 
-def get_project_field_options_query(organization_name: str, repository_name: str, project_number: int) -> str:
+def get_issues_from_repo_query(
+    organization_name: str, repository_name: str, labels: list[str], after_argument: str
+) -> str:
+    """Update the placeholder values and format the GraphQL query."""
+    return ISSUES_FROM_REPO_QUERY.format(
+        organization_name=organization_name,
+        repository_name=repository_name,
+        issues_per_page=ISSUES_PER_PAGE_LIMIT,
+        labels=", ".join(json.dumps(label) for label in labels),
+        after_argument=after_argument,
+    )
+
+
+def get_issues_updated_since_from_repo_query(
+    organization_name: str, repository_name: str, since: str, after_argument: str
+) -> str:
+    """Update the placeholder values and format the GraphQL query."""
+    return ISSUES_UPDATED_SINCE_FROM_REPO_QUERY.format(
+        organization_name=organization_name,
+        repository_name=repository_name,
+        issues_per_page=ISSUES_PER_PAGE_LIMIT,
+        since=since,
+        after_argument=after_argument,
+    )
+
+
+def get_issues_audit_query(node_ids: list[str]) -> str:
+    """Update the placeholder values and format the GraphQL query."""
+    return ISSUES_AUDIT_QUERY.format(
+        node_ids=", ".join(json.dumps(node_id) for node_id in node_ids),
+        timeline_items_per_page=ISSUES_PER_PAGE_LIMIT,
+    )
+
+
+def get_issue_timeline_items_query(node_id: str, after_argument: str) -> str:
+    """Update the placeholder values and format the GraphQL query."""
+    return ISSUE_TIMELINE_ITEMS_QUERY.format(
+        node_id=node_id, timeline_items_per_page=ISSUES_PER_PAGE_LIMIT, after_argument=after_argument
+    )
+
+
+def get_issues_project_items_query(node_ids: list[str]) -> str:
+    """Update the placeholder values and format the GraphQL query."""
+    return ISSUES_PROJECT_ITEMS_QUERY.format(
+        node_ids=", ".join(json.dumps(node_id) for node_id in node_ids),
+        project_items_per_issue=PROJECT_ITEMS_PER_ISSUE_LIMIT,
+    )
+
+
+def get_issue_project_items_query(node_id: str, after_argument: str) -> str:
     """Update the placeholder values and format the GraphQL query."""
-    return PROJECT_FIELD_OPTIONS_QUERY.format(
-        organization_name=organization_name, repository_name=repository_name, project_number=project_number
+    return ISSUE_PROJECT_ITEMS_QUERY.format(
+        node_id=node_id, project_items_per_issue=PROJECT_ITEMS_PER_ISSUE_LIMIT, after_argument=after_argument
     )
@@ -0,0 +1,266 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the on-disk conditional request cache and the requests adapter using it.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class ConditionalRequestCache:
+    """
+    A class representing an on-disk cache of GET responses together with their validators (ETag, Last-Modified).
+    Every response is stored in its own file, so the cache can be shared by several threads and persisted
+    between runs. Entries not used for a long time are pruned, so the directory does not grow without bounds.
+    """
+
+    def __init__(self, directory: str):
+        self.__directory: str = directory
+        # The identity the responses are cached for, the authorization header is used until it is known
+        self.__identity: Optional[str] = None
+        self.__lock = threading.Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        os.makedirs(self.__directory, exist_ok=True)
+
+    @property
+    def hits(self) -> int:
+        """Getter of the number of responses replayed from the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Getter of the number of responses transferred in full."""
+        return self.__misses
+
+    def set_identity(self, identity: Optional[str]) -> None:
+        """
+        Set the stable identity (e.g. the authenticated login) the responses are cached for. Short-lived tokens
+        change on every run, so keying the responses by the token would never replay them in the next run.
+
+        @param identity: The identity, None to key the responses by the authorization header.
+        @return: None
+        """
+        self.__identity = identity
+
+    def make_key(self, request: requests.PreparedRequest) -> str:
+        """
+        Create the cache key of the request. The identity is part of the key,
+        so a response is never replayed to a different identity.
+
+        @param request: The prepared request.
+        @return: The cache key.
+        """
+        if self.__identity is not None:
+            identity = f"identity:{self.__identity}"
+        else:
+            identity = hashlib.sha256(request.headers.get("Authorization", "").encode("utf-8")).hexdigest()
+        key_source = "\n".join([request.url or "", request.headers.get("Accept", ""), identity])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Get the cached response entry.
+
+        @param key: The cache key.
+        @return: The cached entry, or None if the response is not cached.
+        """
+        try:
+            with open(self.__entry_path(key), "r", encoding="utf-8") as f:
+                return json_codec.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("HTTP cache - ignoring unreadable entry `%s`: %s.", key, str(e))
+            return None
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """
+        Store the response if it carries a validator.
+
+        @param key: The cache key.
+        @param response: The successful response.
+        @return: None
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            "url": response.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+
+        # Write to a thread-unique temporary file first, so readers never see a partially written entry
+        entry_path = self.__entry_path(key)
+        temporary_path = f"{entry_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json_codec.dump(entry, f)
+            os.replace(temporary_path, entry_path)
+        except OSError as e:
+            logger.debug("HTTP cache - could not store entry for `%s`: %s.", response.url, str(e))
+
+    def touch(self, key: str) -> None:
+        """
+        Mark the cached entry as used, so it is not pruned as a stale one.
+
+        @param key: The cache key.
+        @return: None
+        """
+        try:
+            os.utime(self.__entry_path(key))
+        except OSError as e:
+            logger.debug("HTTP cache - could not touch entry `%s`: %s.", key, str(e))
+
+    def prune(self, max_age_seconds: float, max_size_bytes: int) -> int:
+        """
+        Remove the entries not used for longer than the maximum age, then the least recently used entries
+        until the cache fits into the maximum size. Leftover temporary files are removed as well.
+
+        @param max_age_seconds: The maximum time since the last use of an entry.
+        @param max_size_bytes: The maximum total size of all entries.
+        @return: The number of removed files.
+        """
+        oldest_allowed = time.time() - max_age_seconds
+        entries: list[tuple[float, int, str]] = []
+        stale_paths: list[str] = []
+        with os.scandir(self.__directory) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.is_file():
+                    continue
+                stat = directory_entry.stat()
+                if not directory_entry.name.endswith(".json") or stat.st_mtime < oldest_allowed:
+                    stale_paths.append(directory_entry.path)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, directory_entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= max_size_bytes:
+                break
+            stale_paths.append(path)
+            total_size -= size
+
+        removed_count = 0
+        for path in stale_paths:
+            try:
+                os.remove(path)
+                removed_count += 1
+            except OSError as e:
+                logger.debug("HTTP cache - could not remove entry `%s`: %s.", path, str(e))
+
+        return removed_count
+
+    def record(self, hit: bool) -> None:
+        """
+        Count the cache hit or miss.
+
+        @param hit: True if the response was replayed from the cache.
+        @return: None
+        """
+        with self.__lock:
+            if hit:
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+    def __entry_path(self, key: str) -> str:
+        return os.path.join(self.__directory, f"{key}.json")
+
+
+class CachingHTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    A requests adapter sending GET requests as conditional requests. A `304 Not Modified` response
+    is replaced by the cached response, while its fresh headers (e.g. rate limit data) are kept.
+    GitHub does not count `304` responses against the primary rate limit.
+    """
+
+    def __init__(self, cache: ConditionalRequestCache, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__cache: ConditionalRequestCache = cache
+
+    # pylint: disable=arguments-differ
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        key = self.__cache.make_key(request)
+        entry = self.__cache.get(key)
+        if entry is not None:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.__cache.record(hit=True)
+            self.__cache.touch(key)
+            return self._replay(entry, response)
+
+        self.__cache.record(hit=False)
+        if response.status_code == 200:
+            self.__cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _replay(entry: dict[str, Any], not_modified_response: requests.Response) -> requests.Response:
+        """
+        Build the response from the cached entry and the headers of the `304 Not Modified` response.
+
+        @param entry: The cached entry.
+        @param not_modified_response: The `304 Not Modified` response.
+        @return: The replayed response.
+        """
+        headers: CaseInsensitiveDict = CaseInsensitiveDict(entry["headers"])
+        headers.update(not_modified_response.headers)
+        # The body is the cached one, so the headers describing the transferred body must not be replayed
+        for header in ("Content-Length", "Content-Encoding", "Transfer-Encoding"):
+            headers.pop(header, None)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = headers
+        response.url = not_modified_response.url
+        response.request = not_modified_response.request
+        response.connection = not_modified_response.connection
+        response.encoding = get_encoding_from_headers(headers)
+        response._content = base64.b64decode(entry["body"])  # pylint: disable=protected-access
+        return response
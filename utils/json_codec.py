@@ -0,0 +1,175 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the JSON codec used for GitHub responses, caches and output files.
+The fast orjson backend is used when it is installed, the standard library json module otherwise.
+"""
+
+import importlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from types import ModuleType
+from typing import Any, Optional, TextIO
+
+try:
+    _ORJSON: Optional[ModuleType] = importlib.import_module("orjson")
+except ImportError:
+    _ORJSON = None
+
+
+class EncodedJSON(str):
+    """
+    A JSON document already encoded with the indentation of the target document (not nested yet).
+    It is written by `dump_streamed` as it is, so documents can be encoded ahead, e.g. by worker processes.
+    """
+
+
+def get_backend_name() -> str:
+    """
+    Get the name of the used JSON backend.
+
+    @return: The backend name, `orjson` or `json`.
+    """
+    return "orjson" if _ORJSON is not None else "json"
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Decode a JSON document.
+
+    @param data: The JSON document.
+    @return: The decoded object.
+    @raise ValueError: If the document is not valid JSON.
+    """
+    if _ORJSON is not None:
+        return _ORJSON.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Encode the object as a JSON document. Non-ASCII characters are kept as they are.
+
+    @param obj: The object to encode.
+    @param indent: The indentation of the document, None for a compact document.
+    @return: The JSON document.
+    """
+    # orjson supports only compact and two spaces indented documents
+    if _ORJSON is not None and indent in (None, 2):
+        option = _ORJSON.OPT_INDENT_2 if indent == 2 else 0
+        return _ORJSON.dumps(obj, option=option).decode("utf-8")
+    # Compact documents are written without whitespace, the same way as by orjson
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+
+
+def dump(obj: Any, f: TextIO, indent: Optional[int] = None) -> None:
+    """
+    Encode the object as a JSON document into the text file.
+
+    @param obj: The object to encode.
+    @param f: The text file to write to.
+    @param indent: The indentation of the document, None for a compact document.
+    @return: None
+    """
+    if _ORJSON is not None and indent in (None, 2):
+        f.write(dumps(obj, indent))
+        return
+    separators = (",", ":") if indent is None else None
+    json.dump(obj, f, indent=indent, separators=separators, ensure_ascii=False)
+
+
+def dump_to_file(obj: Any, file_path: str) -> None:
+    """
+    Encode the object as a compact JSON document into the file, the file directory is created if needed.
+    The document is written to a temporary file first, so an interrupted run never leaves a broken file behind.
+
+    @param obj: The object to encode.
+    @param file_path: The path of the file to write to.
+    @return: None
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temporary_file_path = f"{file_path}.tmp"
+    with open(temporary_file_path, "w", encoding="utf-8") as f:
+        dump(obj, f)
+    os.replace(temporary_file_path, file_path)
+
+
+def dump_streamed(fields: Iterable[tuple[str, Any]], f: TextIO, indent: Optional[int] = 4) -> None:
+    """
+    Encode a JSON object into the text file field by field. Field values given as iterators
+    are written as arrays element by element, so the array never has to be kept in memory.
+    The document is byte-identical to the one written by `dump` for the same object with list values.
+
+    @param fields: The object fields as (key, value) pairs, in the order they are written.
+    @param f: The text file to write to.
+    @param indent: The indentation of the document, None for a compact document.
+    @return: None
+    """
+    line_break, key_separator = ("\n", ": ") if indent is not None else ("", ":")
+    prefix = " " * (indent or 0)
+    is_empty = True
+
+    f.write("{")
+    for key, value in fields:
+        f.write(line_break if is_empty else "," + line_break)
+        f.write(f"{prefix}{dumps(key)}{key_separator}")
+        if isinstance(value, Iterator):
+            _dump_streamed_array(value, f, indent, prefix)
+        else:
+            f.write(_nest(dumps(value, indent), prefix))
+        is_empty = False
+    f.write("}" if is_empty else line_break + "}")
+
+
+def _dump_streamed_array(elements: Iterator[Any], f: TextIO, indent: Optional[int], prefix: str) -> None:
+    """
+    Encode the elements as a JSON array nested in an object field.
+
+    @param elements: The array elements, the encoded JSON elements are not encoded again.
+    @param f: The text file to write to.
+    @param indent: The indentation of the document, None for a compact document.
+    @param prefix: The indentation of the object field holding the array.
+    @return: None
+    """
+    line_break = "\n" if indent is not None else ""
+    element_prefix = prefix + " " * (indent or 0)
+    is_empty = True
+
+    f.write("[")
+    for element in elements:
+        f.write(line_break if is_empty else "," + line_break)
+        document = element if isinstance(element, EncodedJSON) else dumps(element, indent)
+        f.write(element_prefix + _nest(document, element_prefix))
+        is_empty = False
+    f.write("]" if is_empty else line_break + prefix + "]")
+
+
+def _nest(document: str, prefix: str) -> str:
+    """
+    Indent the following lines of an indented JSON document to nest it into another one.
+    Line breaks are always escaped inside JSON strings, so every line break is a structural one.
+
+    @param document: The JSON document.
+    @param prefix: The indentation of the nesting level.
+    @return: The nested JSON document.
+    """
+    return document.replace("\n", "\n" + prefix) if prefix else document
@@ -0,0 +1,171 @@
+#
+# Copyright 2025 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the HeaderRateLimiter class, which paces GitHub API calls by the rate limit headers
+of the already received responses. It is the single rate budget manager of the PyGithub REST calls
+and of all GraphQL queries.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+import requests
+from github import Github
+from living_doc_utilities.github.rate_limiter import GithubRateLimiter
+
+from utils.constants import RATE_LIMIT_MIN_REMAINING, RATE_LIMIT_RESET_MARGIN_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class HeaderRateLimiter(GithubRateLimiter):
+    """
+    A rate limiter reading `X-RateLimit-Remaining`, `X-RateLimit-Reset` and `Retry-After` from every response.
+    Unlike the base GithubRateLimiter, it never queries the rate limit endpoint, the pause is decided from
+    the headers GitHub already sent.
+
+    Note:
+        The `observe` method is registered as a requests response hook of every session (PyGithub and GraphQL),
+        so every request is paced, including the lazy requests of PyGithub objects. Each resource is paced
+        against its own primary limit.
+    """
+
+    def __init__(self, github_client: Github, min_remaining: int = RATE_LIMIT_MIN_REMAINING):
+        super().__init__(github_client)
+        self.__min_remaining: int = min_remaining
+        self.__lock = threading.Lock()
+        # Remaining calls and reset time (epoch seconds) per rate limit resource (core, graphql, search, ...)
+        self.__budgets: dict[str, tuple[int, float]] = {}
+        self.__retry_after_until: float = 0.0
+        self.__graphql_cost: int = 0
+
+    def __call__(self, method: Callable) -> Callable:
+        """
+        Wraps the provided method to wait before it, if the last known headers ask for it.
+
+        @param method: The method to wrap.
+        @return: The wrapped method.
+        """
+
+        def wrapped_method(*args, **kwargs) -> Optional[Any]:
+            self.wait()
+            return method(*args, **kwargs)
+
+        return wrapped_method
+
+    @property
+    def graphql_cost(self) -> int:
+        """Getter of the total cost of all recorded GraphQL queries in rate limit points."""
+        return self.__graphql_cost
+
+    def get_remaining(self, resource: str) -> Optional[int]:
+        """
+        Get the last known number of remaining calls.
+
+        @param resource: The rate limit resource (e.g. `core`, `graphql`).
+        @return: The remaining calls, or None if no response of the resource was observed yet.
+        """
+        with self.__lock:
+            budget = self.__budgets.get(resource)
+        return budget[0] if budget else None
+
+    def observe(self, response: requests.Response, *_args: Any, **_kwargs: Any) -> None:
+        """
+        Update the known rate limit state from the response headers and wait if the budget is exhausted.
+        The signature matches the requests response hook.
+
+        @param response: The received response.
+        @return: None
+        """
+        headers = response.headers
+        now = time.time()
+        resource = headers.get("X-RateLimit-Resource", "core")
+
+        with self.__lock:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None and reset is not None:
+                self.__budgets[resource] = (int(remaining), float(reset))
+
+            # Secondary rate limits announce the pause directly
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None and retry_after.isdigit():
+                self.__retry_after_until = max(self.__retry_after_until, now + int(retry_after))
+
+        self.wait(resource)
+
+    def record_graphql_cost(self, rate_limit: Optional[dict[str, Any]]) -> None:
+        """
+        Record the `rateLimit { cost remaining resetAt }` part of a GraphQL response.
+
+        @param rate_limit: The rate limit data of the GraphQL response, None if not provided.
+        @return: None
+        """
+        if not rate_limit:
+            return
+
+        reset = datetime.fromisoformat(rate_limit["resetAt"]).timestamp()
+        with self.__lock:
+            self.__graphql_cost += rate_limit["cost"]
+            self.__budgets["graphql"] = (rate_limit["remaining"], reset)
+
+    def wait(self, resource: Optional[str] = None) -> None:
+        """
+        Sleep until the rate limit allows further calls, when the known headers ask for it.
+
+        @param resource: The rate limit resource the next call uses, None when unknown (all resources are checked).
+        @return: None
+        """
+        sleep_until = self._get_sleep_until(time.time(), resource)
+        if sleep_until is None:
+            return
+
+        sleep_time = sleep_until - time.time()
+        if sleep_time <= 0:
+            return
+
+        logger.info(
+            "Rate limit almost reached. Sleeping for %i seconds until %s.",
+            int(sleep_time),
+            datetime.fromtimestamp(sleep_until).strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        time.sleep(sleep_time)
+
+    def _get_sleep_until(self, now: float, resource: Optional[str] = None) -> Optional[float]:
+        """
+        Get the time to sleep until, based on the last known headers.
+
+        @param now: The current time in epoch seconds.
+        @param resource: The rate limit resource to check, None to check all resources.
+        @return: The time in epoch seconds, or None if no pause is needed.
+        """
+        with self.__lock:
+            sleep_until = self.__retry_after_until if self.__retry_after_until > now else None
+
+            budgets = [
+                budget for budget_resource, budget in self.__budgets.items() if resource in (None, budget_resource)
+            ]
+            for remaining, reset in budgets:
+                # A budget past its reset time is fresh again
+                if remaining < self.__min_remaining and reset > now:
+                    reset_with_margin = reset + RATE_LIMIT_RESET_MARGIN_SECONDS
+                    sleep_until = max(sleep_until or 0.0, reset_with_margin)
+
+        return sleep_until